@@ -0,0 +1,40 @@
+"""add hand_equities table
+
+Revision ID: 5f3b8c2e9a41
+Revises: a66a763724a3
+Create Date: 2026-10-17 10:12:44.512307
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3b8c2e9a41'
+down_revision: Union[str, Sequence[str], None] = 'a66a763724a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'hand_equities',
+        sa.Column('hand_id', sa.Integer(), nullable=False),
+        sa.Column('street', sa.String(), nullable=False),
+        sa.Column('equities', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['hand_id'],
+            ['hands.hand_id'],
+        ),
+        sa.PrimaryKeyConstraint('hand_id', 'street'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('hand_equities')
@@ -0,0 +1,83 @@
+"""add player_stats_agg table
+
+Revision ID: 8d2e4a7c1b90
+Revises: 5f3b8c2e9a41
+Create Date: 2026-10-17 14:03:51.208114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4a7c1b90'
+down_revision: Union[str, Sequence[str], None] = '5f3b8c2e9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'player_stats_agg',
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('hands_played', sa.Integer(), nullable=False),
+        sa.Column('hands_won', sa.Integer(), nullable=False),
+        sa.Column('hands_lost', sa.Integer(), nullable=False),
+        sa.Column('hands_folded', sa.Integer(), nullable=False),
+        sa.Column('total_profit_loss', sa.Float(), nullable=False),
+        sa.Column('turn_reached', sa.Integer(), nullable=False),
+        sa.Column('river_reached', sa.Integer(), nullable=False),
+        sa.Column('sessions_played', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['player_id'],
+            ['players.player_id'],
+        ),
+        sa.PrimaryKeyConstraint('player_id', 'game_id'),
+    )
+
+    # Backfill: one row per (player, game), then career rows under game_id 0
+    op.execute(
+        """
+        INSERT INTO player_stats_agg (
+            player_id, game_id, hands_played, hands_won, hands_lost,
+            hands_folded, total_profit_loss, turn_reached, river_reached,
+            sessions_played
+        )
+        SELECT ph.player_id, h.game_id, COUNT(*),
+            SUM(CASE WHEN ph.result = 'won' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN ph.result = 'lost' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN ph.result = 'folded' THEN 1 ELSE 0 END),
+            COALESCE(SUM(ph.profit_loss), 0.0),
+            SUM(CASE WHEN h.turn IS NOT NULL THEN 1 ELSE 0 END),
+            SUM(CASE WHEN h.river IS NOT NULL THEN 1 ELSE 0 END),
+            1
+        FROM player_hands ph JOIN hands h ON ph.hand_id = h.hand_id
+        WHERE ph.result IS NOT NULL AND ph.result != 'handed_back'
+        GROUP BY ph.player_id, h.game_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO player_stats_agg (
+            player_id, game_id, hands_played, hands_won, hands_lost,
+            hands_folded, total_profit_loss, turn_reached, river_reached,
+            sessions_played
+        )
+        SELECT player_id, 0, SUM(hands_played), SUM(hands_won), SUM(hands_lost),
+            SUM(hands_folded), SUM(total_profit_loss), SUM(turn_reached),
+            SUM(river_reached), COUNT(*)
+        FROM player_stats_agg
+        GROUP BY player_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('player_stats_agg')
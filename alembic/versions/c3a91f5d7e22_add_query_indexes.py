@@ -0,0 +1,48 @@
+"""add indexes for hot filter paths
+
+Revision ID: c3a91f5d7e22
+Revises: 8d2e4a7c1b90
+Create Date: 2026-10-17 15:26:09.731842
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a91f5d7e22'
+down_revision: Union[str, Sequence[str], None] = '8d2e4a7c1b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# hands(game_id, hand_number) and card_detections(upload_id, ...) are already
+# covered by the indexes behind their unique constraints.
+COLUMN_INDEXES = [
+    ('ix_game_sessions_game_date', 'game_sessions', ['game_date']),
+    ('ix_player_hands_player_result', 'player_hands', ['player_id', 'result']),
+    ('ix_player_hands_card_1', 'player_hands', ['card_1']),
+    ('ix_player_hands_card_2', 'player_hands', ['card_2']),
+    ('ix_hands_flop_1', 'hands', ['flop_1']),
+    ('ix_hands_flop_2', 'hands', ['flop_2']),
+    ('ix_hands_flop_3', 'hands', ['flop_3']),
+    ('ix_hands_turn', 'hands', ['turn']),
+    ('ix_hands_river', 'hands', ['river']),
+    ('ix_image_uploads_game_id', 'image_uploads', ['game_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in COLUMN_INDEXES:
+        op.create_index(name, table, columns)
+    op.create_index('ix_players_name_lower', 'players', [sa.text('lower(name)')])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_players_name_lower', table_name='players')
+    for name, table, _ in reversed(COLUMN_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,123 @@
+"""add hand_cards table
+
+Revision ID: e6b07d2f4c18
+Revises: c3a91f5d7e22
+Create Date: 2026-10-17 16:48:30.117205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b07d2f4c18'
+down_revision: Union[str, Sequence[str], None] = 'c3a91f5d7e22'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same layout as pydantic_models.card_codec, frozen here for the backfill
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('H', 'D', 'C', 'S')
+CARD_CODES = {
+    f'{r}{s}': i * 4 + j for i, r in enumerate(RANKS) for j, s in enumerate(SUITS)
+}
+
+
+def _card_code(card: str | None) -> int | None:
+    # Older rows may spell ten as 'T' or use lowercase suits
+    if not card:
+        return None
+    card = card.upper()
+    if card.startswith('T'):
+        card = '10' + card[1:]
+    return CARD_CODES.get(card)
+
+
+BOARD_LOCATIONS = (
+    ('flop_1', 'flop'),
+    ('flop_2', 'flop'),
+    ('flop_3', 'flop'),
+    ('turn', 'turn'),
+    ('river', 'river'),
+)
+
+# Per-column card indexes from c3a91f5d7e22, superseded by hand_cards
+CARD_COLUMN_INDEXES = [
+    ('ix_player_hands_card_1', 'player_hands', ['card_1']),
+    ('ix_player_hands_card_2', 'player_hands', ['card_2']),
+    ('ix_hands_flop_1', 'hands', ['flop_1']),
+    ('ix_hands_flop_2', 'hands', ['flop_2']),
+    ('ix_hands_flop_3', 'hands', ['flop_3']),
+    ('ix_hands_turn', 'hands', ['turn']),
+    ('ix_hands_river', 'hands', ['river']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    hand_cards = op.create_table(
+        'hand_cards',
+        sa.Column('hand_card_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('hand_id', sa.Integer(), nullable=False),
+        sa.Column('player_hand_id', sa.Integer(), nullable=True),
+        sa.Column('card_code', sa.SmallInteger(), nullable=False),
+        sa.Column('location', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['hand_id'],
+            ['hands.hand_id'],
+        ),
+        sa.ForeignKeyConstraint(
+            ['player_hand_id'],
+            ['player_hands.player_hand_id'],
+        ),
+        sa.PrimaryKeyConstraint('hand_card_id'),
+    )
+
+    # Backfill from the existing card columns
+    conn = op.get_bind()
+    rows = []
+    board_columns = ', '.join(column for column, _ in BOARD_LOCATIONS)
+    for hand in conn.execute(sa.text(f'SELECT hand_id, {board_columns} FROM hands')):
+        for (_, location), card in zip(BOARD_LOCATIONS, hand[1:], strict=True):
+            if (code := _card_code(card)) is not None:
+                rows.append(
+                    {
+                        'hand_id': hand[0],
+                        'player_hand_id': None,
+                        'card_code': code,
+                        'location': location,
+                    }
+                )
+    for ph in conn.execute(
+        sa.text('SELECT player_hand_id, hand_id, card_1, card_2 FROM player_hands')
+    ):
+        for card in ph[2:]:
+            if (code := _card_code(card)) is not None:
+                rows.append(
+                    {
+                        'hand_id': ph[1],
+                        'player_hand_id': ph[0],
+                        'card_code': code,
+                        'location': 'hole',
+                    }
+                )
+    if rows:
+        op.bulk_insert(hand_cards, rows)
+
+    # Indexes go on after the bulk load
+    op.create_index('ix_hand_cards_card_hand', 'hand_cards', ['card_code', 'hand_id'])
+    op.create_index('ix_hand_cards_hand_id', 'hand_cards', ['hand_id'])
+    for name, table, _ in CARD_COLUMN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, columns in CARD_COLUMN_INDEXES:
+        op.create_index(name, table, columns)
+    op.drop_index('ix_hand_cards_hand_id', table_name='hand_cards')
+    op.drop_index('ix_hand_cards_card_hand', table_name='hand_cards')
+    op.drop_table('hand_cards')
@@ -0,0 +1,35 @@
+"""add version counters to game_sessions and hands
+
+Revision ID: f3a8d51c02b7
+Revises: e6b07d2f4c18
+Create Date: 2026-10-18 10:12:41.538204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d51c02b7'
+down_revision: Union[str, Sequence[str], None] = 'e6b07d2f4c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('game_sessions', 'hands'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column('version', sa.Integer(), nullable=False, server_default='1')
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('hands', 'game_sessions'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('version')
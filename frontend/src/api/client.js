@@ -174,8 +174,27 @@ export function uploadImage(gameId, file) {
     });
 }
 
-export function getDetectionResults(gameId, uploadId) {
-  return request(`/games/${gameId}/hands/image/${uploadId}`);
+// Seconds the server may hold each detection read while it is still running
+const DETECTION_WAIT_SECONDS = 30;
+// Give up on a detection that has not settled by then, e.g. a lost job
+const DETECTION_TIMEOUT_MS = 2 * 60 * 1000;
+
+export async function getDetectionResults(gameId, uploadId) {
+  // Detection runs in the background after upload; long-poll until it settles
+  const deadline = Date.now() + DETECTION_TIMEOUT_MS;
+  let results;
+  do {
+    const remainingMs = deadline - Date.now();
+    if (remainingMs <= 0) {
+      throw new Error('Card detection timed out, please try again');
+    }
+    const wait = Math.min(DETECTION_WAIT_SECONDS, Math.ceil(remainingMs / 1000));
+    results = await request(`/games/${gameId}/hands/image/${uploadId}?wait=${wait}`);
+  } while (results.status === 'processing');
+  if (results.status === 'failed') {
+    throw new Error('Card detection failed');
+  }
+  return results;
 }
 
 export function fetchCsvSchema() {
@@ -190,6 +209,23 @@ export function fetchHandStatus(gameId, handNumber, { signal } = {}) {
   return request(`/games/${gameId}/hands/${handNumber}/status`, { signal });
 }
 
+// Event types sent by GET /games/{id}/events, see app/routes/events.py
+const GAME_EVENT_TYPES = ['snapshot', 'hand', 'board', 'player', 'hand_deleted', 'upload', 'game', 'game_deleted'];
+
+export function subscribeGameEvents(gameId, onEvent, { onClose } = {}) {
+  // Returns an unsubscribe function, or null where EventSource is unavailable
+  if (typeof EventSource === 'undefined') return null;
+  const source = new EventSource(`${BASE_URL}/games/${gameId}/events`);
+  GAME_EVENT_TYPES.forEach((type) => {
+    source.addEventListener(type, (e) => onEvent(type, JSON.parse(e.data)));
+  });
+  source.onerror = () => {
+    // The browser reconnects dropped streams itself; CLOSED means it gave up
+    if (source.readyState === EventSource.CLOSED && onClose) onClose();
+  };
+  return () => source.close();
+}
+
 export function exportGameCsvUrl(gameId) {
   return `${BASE_URL}/games/${gameId}/export/csv`;
 }
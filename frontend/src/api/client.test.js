@@ -1,5 +1,5 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
-import { fetchHandStatus } from './client.js';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { fetchHandStatus, getDetectionResults } from './client.js';
 
 describe('fetchHandStatus', () => {
   beforeEach(() => {
@@ -31,3 +31,50 @@ describe('fetchHandStatus', () => {
     await expect(fetchHandStatus(1, 99)).rejects.toThrow('HTTP 404: Not found');
   });
 });
+
+describe('getDetectionResults', () => {
+  beforeEach(() => {
+    vi.stubGlobal('fetch', vi.fn());
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  const respond = (body) => fetch.mockResolvedValueOnce({
+    ok: true,
+    json: () => Promise.resolve(body),
+  });
+
+  it('long-polls until detection is no longer processing', async () => {
+    respond({ upload_id: 4, status: 'processing', detections: [] });
+    respond({ upload_id: 4, status: 'detected', detections: [{ card_position: 'hole_1' }] });
+
+    const result = await getDetectionResults(2, 4);
+
+    expect(fetch).toHaveBeenCalledTimes(2);
+    expect(fetch.mock.calls[0][0]).toBe('/games/2/hands/image/4?wait=30');
+    expect(result.status).toBe('detected');
+  });
+
+  it('throws when detection failed', async () => {
+    respond({ upload_id: 4, status: 'failed', detections: [] });
+
+    await expect(getDetectionResults(2, 4)).rejects.toThrow('Card detection failed');
+  });
+
+  it('gives up once the deadline passes while still processing', async () => {
+    let now = 0;
+    vi.spyOn(Date, 'now').mockImplementation(() => now);
+    fetch.mockImplementation(() => {
+      now += 30_000;
+      return Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve({ upload_id: 4, status: 'processing', detections: [] }),
+      });
+    });
+
+    await expect(getDetectionResults(2, 4)).rejects.toThrow('Card detection timed out');
+    expect(fetch).toHaveBeenCalledTimes(4);
+  });
+});
@@ -9,7 +9,7 @@ import { DetectionReview } from './DetectionReview.jsx';
 import { OutcomeButtons } from './OutcomeButtons.jsx';
 import { DealerPreview } from './DealerPreview.jsx';
 import { QRCodeDisplay } from './QRCodeDisplay.jsx';
-import { addPlayerToHand, updateHolecards, updateFlop, updateTurn, updateRiver, patchPlayerResult, fetchGame, fetchHand, fetchHandStatus } from '../api/client.js';
+import { addPlayerToHand, updateHolecards, updateFlop, updateTurn, updateRiver, patchPlayerResult, fetchGame, fetchHand, fetchHandStatus, subscribeGameEvents } from '../api/client.js';
 
 const DEALER_STATE_KEY = 'aia_dealer_state';
 
@@ -115,12 +115,23 @@ export function DealerApp() {
         });
     }
 
+    let intervalId = null;
+    function startPolling() {
+      if (!intervalId) intervalId = setInterval(poll, 3000);
+    }
+
     poll();
-    const intervalId = setInterval(poll, 3000);
+    // Refresh when the game's event stream reports a change; poll only
+    // where no stream can be opened
+    const unsubscribe = subscribeGameEvents(state.gameId, (type) => {
+      if (type !== 'upload') poll();
+    }, { onClose: startPolling });
+    if (!unsubscribe) startPolling();
 
     return () => {
       controller.abort();
-      clearInterval(intervalId);
+      if (unsubscribe) unsubscribe();
+      if (intervalId) clearInterval(intervalId);
     };
   }, [state.currentStep, state.gameId, state.currentHandId, state.gameMode]);
 
@@ -22,6 +22,7 @@ vi.mock('../api/client.js', () => ({
   fetchGame: vi.fn(),
   fetchHand: vi.fn(),
   fetchHandStatus: vi.fn(() => Promise.resolve({ hand_number: 1, community_recorded: false, players: [] })),
+  subscribeGameEvents: vi.fn(() => null),
 }));
 
 vi.mock('./CameraCapture.jsx', () => ({
@@ -105,7 +106,7 @@ vi.mock('./dealerState.js', async () => {
   };
 });
 
-import { createHand, addPlayerToHand, updateHolecards, updateCommunityCards, updateFlop, updateTurn, updateRiver, patchPlayerResult, fetchHands, fetchHand, fetchHandStatus } from '../api/client.js';
+import { createHand, addPlayerToHand, updateHolecards, updateCommunityCards, updateFlop, updateTurn, updateRiver, patchPlayerResult, fetchHands, fetchHand, fetchHandStatus, subscribeGameEvents } from '../api/client.js';
 import { initialState } from './dealerState.js';
 import { DealerApp } from './DealerApp.jsx';
 
@@ -1014,6 +1015,36 @@ describe('DealerApp hand status polling', () => {
     expect(fetchHandStatus).toHaveBeenCalledTimes(0);
   });
 
+  it('refreshes on stream events instead of a timer when subscribed', async () => {
+    let emit;
+    const unsubscribe = vi.fn();
+    subscribeGameEvents.mockImplementation((gameId, onEvent) => {
+      emit = onEvent;
+      return unsubscribe;
+    });
+    try {
+      const container = renderToContainer(<DealerApp />);
+      await startHand(container);
+      await vi.waitFor(() => {
+        expect(subscribeGameEvents).toHaveBeenCalledWith(42, expect.any(Function), expect.any(Object));
+      });
+
+      fetchHandStatus.mockClear();
+      await vi.advanceTimersByTimeAsync(6000);
+      expect(fetchHandStatus).toHaveBeenCalledTimes(0);
+
+      emit('player', { hand_number: 1, name: 'Alice', participation_status: 'joined' });
+      await vi.waitFor(() => {
+        expect(fetchHandStatus).toHaveBeenCalledTimes(1);
+      });
+
+      render(null, container);
+      expect(unsubscribe).toHaveBeenCalled();
+    } finally {
+      subscribeGameEvents.mockImplementation(() => null);
+    }
+  });
+
   it('existing manual flow still works alongside polling', async () => {
     vi.useRealTimers();
     initialState.gameMode = 'dealer_centric';
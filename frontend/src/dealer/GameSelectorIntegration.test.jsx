@@ -19,6 +19,7 @@ vi.mock('../api/client.js', () => ({
   fetchGame: vi.fn(),
   fetchHand: vi.fn(),
   fetchHandStatus: vi.fn(() => Promise.resolve({ hand_number: 1, community_recorded: false, players: [] })),
+  subscribeGameEvents: vi.fn(() => null),
 }));
 
 vi.mock('./CameraCapture.jsx', () => ({
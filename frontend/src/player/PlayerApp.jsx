@@ -1,6 +1,6 @@
 import { h } from 'preact';
 import { useState, useEffect, useRef, useCallback } from 'preact/hooks';
-import { fetchSessions, fetchGame, fetchHands, fetchHandStatus, updateHolecards, patchPlayerResult } from '../api/client.js';
+import { fetchSessions, fetchGame, fetchHands, fetchHandStatus, subscribeGameEvents, updateHolecards, patchPlayerResult } from '../api/client.js';
 import { CameraCapture } from '../dealer/CameraCapture.jsx';
 import { DetectionReview } from '../dealer/DetectionReview.jsx';
 
@@ -214,11 +214,21 @@ export function PlayerApp() {
         });
     }
 
+    function startPolling() {
+      if (!intervalId) intervalId = setInterval(pollCycle, 3000);
+    }
+
     pollCycle();
-    intervalId = setInterval(pollCycle, 3000);
+    // Refresh when the game's event stream reports a change; poll only
+    // where no stream can be opened
+    const unsubscribe = subscribeGameEvents(gameId, (type) => {
+      if (type !== 'upload') pollCycle();
+    }, { onClose: startPolling });
+    if (!unsubscribe) startPolling();
 
     return () => {
       controller.abort();
+      if (unsubscribe) unsubscribe();
       if (intervalId) clearInterval(intervalId);
     };
   }, [step, gameId, playerName]);
@@ -8,13 +8,14 @@ vi.mock('../api/client.js', () => ({
   fetchGame: vi.fn(),
   fetchHands: vi.fn(),
   fetchHandStatus: vi.fn(),
+  subscribeGameEvents: vi.fn(() => null),
   uploadImage: vi.fn(),
   getDetectionResults: vi.fn(),
   updateHolecards: vi.fn(),
   patchPlayerResult: vi.fn(),
 }));
 
-import { fetchSessions, fetchGame, fetchHands, fetchHandStatus, uploadImage, getDetectionResults, updateHolecards, patchPlayerResult } from '../api/client.js';
+import { fetchSessions, fetchGame, fetchHands, fetchHandStatus, subscribeGameEvents, uploadImage, getDetectionResults, updateHolecards, patchPlayerResult } from '../api/client.js';
 
 function renderToContainer(vnode) {
   const container = document.createElement('div');
@@ -380,6 +381,86 @@ function makeStatus(playerName, status, extras = {}) {
   };
 }
 
+describe('PlayerApp — live event stream', () => {
+  let originalHash;
+  let emit;
+  let unsubscribe;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.useFakeTimers();
+    originalHash = window.location.hash;
+    window.location.hash = '';
+    unsubscribe = vi.fn();
+    subscribeGameEvents.mockImplementation((gameId, onEvent) => {
+      emit = onEvent;
+      return unsubscribe;
+    });
+  });
+
+  afterEach(() => {
+    subscribeGameEvents.mockImplementation(() => null);
+    vi.useRealTimers();
+    window.location.hash = originalHash;
+  });
+
+  it('subscribes to the game and does not poll on a timer', async () => {
+    const container = document.createElement('div');
+    await goToPlaying(container, 1, { handStatus: HAND_STATUS_IDLE });
+
+    await vi.waitFor(() => {
+      expect(fetchHandStatus).toHaveBeenCalledTimes(1);
+    });
+    expect(subscribeGameEvents).toHaveBeenCalledWith(3, expect.any(Function), expect.any(Object));
+
+    vi.advanceTimersByTime(9000);
+    expect(fetchHandStatus).toHaveBeenCalledTimes(1);
+  });
+
+  it('refreshes when a hand event arrives', async () => {
+    const container = document.createElement('div');
+    await goToPlaying(container, 1, { handStatus: HAND_STATUS_IDLE });
+    await vi.waitFor(() => {
+      expect(fetchHandStatus).toHaveBeenCalledTimes(1);
+    });
+
+    fetchHandStatus.mockResolvedValue(makeStatus('Bob', 'pending'));
+    emit('player', { hand_number: 1, name: 'Bob', participation_status: 'pending' });
+    await vi.waitFor(() => {
+      expect(fetchHandStatus).toHaveBeenCalledTimes(2);
+    });
+
+    emit('upload', { upload_id: 1, status: 'detected' });
+    expect(fetchHandStatus).toHaveBeenCalledTimes(2);
+  });
+
+  it('closes the stream on unmount', async () => {
+    const container = document.createElement('div');
+    await goToPlaying(container, 1, { handStatus: HAND_STATUS_IDLE });
+    await vi.waitFor(() => {
+      expect(subscribeGameEvents).toHaveBeenCalled();
+    });
+
+    render(null, container);
+    expect(unsubscribe).toHaveBeenCalled();
+  });
+
+  it('falls back to polling when the stream closes', async () => {
+    const container = document.createElement('div');
+    await goToPlaying(container, 1, { handStatus: HAND_STATUS_IDLE });
+    await vi.waitFor(() => {
+      expect(fetchHandStatus).toHaveBeenCalledTimes(1);
+    });
+
+    const [, , { onClose }] = subscribeGameEvents.mock.calls[0];
+    onClose();
+    vi.advanceTimersByTime(3000);
+    await vi.waitFor(() => {
+      expect(fetchHandStatus).toHaveBeenCalledTimes(2);
+    });
+  });
+});
+
 describe('PlayerApp — polling and status', () => {
   let originalHash;
 
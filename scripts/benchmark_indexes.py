@@ -0,0 +1,185 @@
+"""Compare query plans and timings with and without the secondary indexes.
+
+Usage (from repo root):
+    uv run python scripts/benchmark_indexes.py
+    uv run python scripts/benchmark_indexes.py --hands 20000 --db /tmp/bench.db
+
+Seeds a throwaway SQLite database (100k hands by default), drops the
+indexes declared in app.database.models, runs the hot query shapes used by
+the routes, recreates the indexes and runs them again. Prints SQLite's
+EXPLAIN QUERY PLAN and the median time of each query both ways.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, func, insert, select, text
+
+from app.database.models import (
+    Base,
+    GamePlayer,
+    GameSession,
+    Hand,
+    HandCard,
+    Player,
+    PlayerHand,
+)
+from app.services.hand_cards import BOARD_LOCATIONS
+from pydantic_models.card_codec import RANKS, SUITS, encode_card
+
+parser = argparse.ArgumentParser(description='Benchmark the secondary indexes')
+parser.add_argument('--hands', type=int, default=100_000, help='Hands to seed')
+parser.add_argument('--hands-per-game', type=int, default=100)
+parser.add_argument('--players', type=int, default=60, help='Player pool size')
+parser.add_argument('--db', help='SQLite file to use (default: a temp file)')
+parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query')
+args = parser.parse_args()
+
+DECK = [f'{r}{s}' for r in RANKS for s in SUITS]
+RESULTS = ['won', 'lost', 'folded', 'handed_back', None]
+
+
+def seed(conn) -> None:
+    rng = random.Random(0)
+    conn.execute(
+        insert(Player), [{'name': f'Player{i:03d}'} for i in range(args.players)]
+    )
+    games = -(-args.hands // args.hands_per_game)
+    start = date(2020, 1, 1)
+    conn.execute(
+        insert(GameSession),
+        [
+            {'game_id': g + 1, 'game_date': start + timedelta(days=g)}
+            for g in range(games)
+        ],
+    )
+
+    game_players, hands, player_hands, hand_cards = [], [], [], []
+    for g in range(1, games + 1):
+        seats = rng.sample(range(1, args.players + 1), rng.randint(4, 8))
+        game_players += [{'game_id': g, 'player_id': p} for p in seats]
+        for n in range(1, args.hands_per_game + 1):
+            hand_id = len(hands) + 1
+            if hand_id > args.hands:
+                break
+            cards = rng.sample(DECK, 5 + 2 * len(seats))
+            hands.append(
+                {
+                    'hand_id': hand_id,
+                    'game_id': g,
+                    'hand_number': n,
+                    'flop_1': cards[0],
+                    'flop_2': cards[1],
+                    'flop_3': cards[2],
+                    'turn': cards[3] if rng.random() < 0.7 else None,
+                    'river': cards[4] if rng.random() < 0.5 else None,
+                }
+            )
+            hand_cards += [
+                {
+                    'hand_id': hand_id,
+                    'player_hand_id': None,
+                    'card_code': encode_card(hands[-1][column]),
+                    'location': location,
+                }
+                for column, location in BOARD_LOCATIONS
+                if hands[-1][column] is not None
+            ]
+            for i, p in enumerate(seats):
+                player_hand_id = len(player_hands) + 1
+                hand_cards += [
+                    {
+                        'hand_id': hand_id,
+                        'player_hand_id': player_hand_id,
+                        'card_code': encode_card(c),
+                        'location': 'hole',
+                    }
+                    for c in cards[5 + 2 * i : 7 + 2 * i]
+                ]
+                player_hands.append(
+                    {
+                        'player_hand_id': player_hand_id,
+                        'hand_id': hand_id,
+                        'player_id': p,
+                        'card_1': cards[5 + 2 * i],
+                        'card_2': cards[6 + 2 * i],
+                        'result': rng.choice(RESULTS),
+                        'profit_loss': rng.uniform(-50, 50),
+                    }
+                )
+    conn.execute(insert(GamePlayer), game_players)
+    conn.execute(insert(Hand), hands)
+    conn.execute(insert(PlayerHand), player_hands)
+    conn.execute(insert(HandCard), hand_cards)
+    print(f'Seeded {len(hands)} hands, {len(player_hands)} player hands')
+
+
+# The query shapes the routes run, with representative parameters
+QUERIES = {
+    'player by name (every route)': select(Player).where(
+        func.lower(Player.name) == 'player007'
+    ),
+    'player results (stats, leaderboard)': select(PlayerHand).where(
+        PlayerHand.player_id == 7,
+        PlayerHand.result.isnot(None),
+        PlayerHand.result != 'handed_back',
+    ),
+    'hands of a game (list, export)': select(Hand)
+    .where(Hand.game_id == 500)
+    .order_by(Hand.hand_number),
+    'date range (search)': select(Hand.hand_id)
+    .join(GameSession, GameSession.game_id == Hand.game_id)
+    .where(GameSession.game_date.between(date(2021, 1, 1), date(2021, 1, 31))),
+    'card on board (search)': select(HandCard.hand_id).where(
+        HandCard.card_code == encode_card('AS'), HandCard.player_hand_id.is_(None)
+    ),
+    'card in hole (search)': select(HandCard.player_hand_id).where(
+        HandCard.card_code == encode_card('AS'), HandCard.player_hand_id.isnot(None)
+    ),
+}
+
+
+def measure(conn) -> dict[str, tuple[list[str], float]]:
+    out = {}
+    for label, stmt in QUERIES.items():
+        sql = str(stmt.compile(conn, compile_kwargs={'literal_binds': True}))
+        plan = [row[-1] for row in conn.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            conn.execute(text(sql)).fetchall()
+            times.append(time.perf_counter() - t0)
+        out[label] = (plan, statistics.median(times))
+    return out
+
+
+path = args.db or os.path.join(tempfile.mkdtemp(), 'bench.db')
+engine = create_engine(f'sqlite:///{path}')
+Base.metadata.create_all(engine)
+indexes = [ix for table in Base.metadata.sorted_tables for ix in table.indexes]
+
+with engine.begin() as conn:
+    if conn.execute(select(func.count()).select_from(Hand)).scalar() == 0:
+        seed(conn)
+    for ix in indexes:
+        ix.drop(conn)
+    conn.execute(text('ANALYZE'))
+    before = measure(conn)
+    for ix in indexes:
+        ix.create(conn)
+    conn.execute(text('ANALYZE'))
+    after = measure(conn)
+
+print(f'Database: {path}\n')
+for label in QUERIES:
+    (plan_before, t_before), (plan_after, t_after) = before[label], after[label]
+    print(f'{label}: {t_before * 1000:.2f} ms -> {t_after * 1000:.2f} ms')
+    print('  before: ' + ' | '.join(plan_before))
+    print('  after:  ' + ' | '.join(plan_after))
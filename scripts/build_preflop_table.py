@@ -0,0 +1,44 @@
+"""Build the 169×169 heads-up preflop hand-class equity table.
+
+Usage (from repo root):
+    uv run python scripts/build_preflop_table.py
+    uv run python scripts/build_preflop_table.py --samples 50000
+
+Output:
+    models/preflop_equity.npy — loaded by app.services.equity_range so
+    preflop range queries are a table lookup instead of a simulation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from app.services.equity_range import (
+    PREFLOP_TABLE_PATH,
+    class_name,
+    simulate_class_matchup,
+)
+
+parser = argparse.ArgumentParser(description='Build the preflop class equity table')
+parser.add_argument('--output', default=PREFLOP_TABLE_PATH, help='Output .npy path')
+parser.add_argument(
+    '--samples', type=int, default=100_000, help='Runouts sampled per matchup'
+)
+args = parser.parse_args()
+
+table = np.full((169, 169), 0.5, dtype=np.float32)
+start = time.perf_counter()
+for hero in range(169):
+    for villain in range(hero + 1, 169):
+        equity = simulate_class_matchup(hero, villain, args.samples)
+        table[hero, villain] = equity
+        table[villain, hero] = 1.0 - equity
+    print(f'{class_name(hero):>4} done ({time.perf_counter() - start:.0f}s)')
+
+os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+np.save(args.output, table)
+print(f'Wrote {args.output}')
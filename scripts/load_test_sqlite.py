@@ -0,0 +1,152 @@
+"""Load-test concurrent dealer writes and player reads per SQLite profile.
+
+Usage (from repo root):
+    uv run python scripts/load_test_sqlite.py
+    uv run python scripts/load_test_sqlite.py --seconds 20 --writers 2 --readers 16
+
+For each engine profile (SQLite's defaults, then the tuned WAL profile from
+app.database.session) a fresh database file is created and the app is
+driven through its HTTP routes. Writer threads record hands, as dealers do,
+while reader threads poll the game, game stats and player stats endpoints,
+as player screens do. Prints throughput, latency percentiles and failed
+requests for both, so the effect of the profile on read/write contention
+can be compared directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base
+from app.database.session import create_db_engine, get_db
+from app.main import app
+
+parser = argparse.ArgumentParser(description='Load-test the SQLite profiles')
+parser.add_argument('--seconds', type=float, default=10.0, help='Run time each')
+parser.add_argument('--writers', type=int, default=4, help='Dealer threads')
+parser.add_argument('--readers', type=int, default=8, help='Polling threads')
+parser.add_argument('--dir', help='Directory for the database files')
+args = parser.parse_args()
+
+PLAYERS = [f'Player{i}' for i in range(8)]
+
+
+def hand_body(seat: int) -> dict:
+    winner = PLAYERS[seat % len(PLAYERS)]
+    return {
+        'flop_1': '2C',
+        'flop_2': '7D',
+        'flop_3': 'JS',
+        'player_entries': [
+            {
+                'player_name': name,
+                'result': 'won' if name == winner else 'lost',
+                'profit_loss': 7.0 if name == winner else -1.0,
+            }
+            for name in PLAYERS
+        ],
+    }
+
+
+def run(profile: str, path: str) -> dict[str, list]:
+    engine = create_db_engine(f'sqlite:///{path}', profile)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    game_ids = [
+        client.post(
+            '/games',
+            json={'game_date': f'2026-01-{i + 1:02d}', 'player_names': PLAYERS},
+        ).json()['game_id']
+        for i in range(args.writers)
+    ]
+
+    results: dict[str, list] = {'write': [], 'read': [], 'failed': []}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def worker(kind: str, n: int) -> None:
+        local = TestClient(app)
+        timings, failed = [], []
+        i = 0
+        while time.perf_counter() < deadline:
+            game_id = game_ids[n % len(game_ids)]
+            t0 = time.perf_counter()
+            if kind == 'write':
+                resp = local.post(f'/games/{game_id}/hands', json=hand_body(i))
+            else:
+                path = (
+                    f'/games/{game_id}',
+                    f'/stats/games/{game_id}',
+                    f'/stats/players/{PLAYERS[i % len(PLAYERS)]}',
+                )[i % 3]
+                resp = local.get(path)
+            elapsed = time.perf_counter() - t0
+            (timings if resp.status_code < 400 else failed).append(elapsed)
+            i += 1
+        with lock:
+            results[kind] += timings
+            results['failed'] += failed
+
+    threads = [
+        threading.Thread(target=worker, args=('write', n)) for n in range(args.writers)
+    ]
+    threads += [
+        threading.Thread(target=worker, args=('read', n)) for n in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with engine.connect() as conn:
+        mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+    app.dependency_overrides.clear()
+    engine.dispose()
+    results['journal_mode'] = [mode]
+    return results
+
+
+def summarize(label: str, timings: list[float]) -> str:
+    if not timings:
+        return f'  {label}: none'
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1] if len(ms) > 1 else ms[0]
+    return (
+        f'  {label}: {len(ms) / args.seconds:8.1f}/s'
+        f'  p50 {statistics.median(ms):7.1f} ms  p95 {p95:7.1f} ms  max {ms[-1]:7.1f} ms'
+    )
+
+
+directory = args.dir or tempfile.mkdtemp()
+print(
+    f'{args.writers} writers, {args.readers} readers, {args.seconds:.0f}s per '
+    f'profile, databases in {directory}\n'
+)
+for profile in ('default', 'tuned'):
+    path = os.path.join(directory, f'load_{profile}.db')
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    results = run(profile, path)
+    print(f'{profile} (journal_mode={results["journal_mode"][0]}):')
+    print(summarize('writes', results['write']))
+    print(summarize('reads ', results['read']))
+    print(f'  failed requests: {len(results["failed"])}\n')
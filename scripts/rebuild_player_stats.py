@@ -0,0 +1,16 @@
+"""Rebuild the player_stats_agg table from recorded hands.
+
+Usage (from repo root):
+    uv run python scripts/rebuild_player_stats.py
+
+Run after importing or editing hands outside the API (e.g. direct SQL or
+seed scripts), which bypass the incremental stats maintenance.
+"""
+
+from app.database.session import SessionLocal
+from app.services.player_stats import rebuild_player_stats
+
+with SessionLocal() as db:
+    written = rebuild_player_stats(db)
+    db.commit()
+print(f'Rebuilt player_stats_agg: {written} rows')
@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta, timezone
 
 from app.database.models import Base, GamePlayer, GameSession, Hand, Player, PlayerHand
 from app.database.session import SessionLocal, engine
+from app.services.player_stats import rebuild_player_stats
 
 Base.metadata.create_all(engine)
 
@@ -173,6 +174,8 @@ def seed():
                 f'  Game {game.game_id}: {game_date} — {len(game_player_names)} players, {HANDS_PER_GAME} hands'
             )
 
+        # Rows were inserted directly, so bring the stats table up to date
+        rebuild_player_stats(db)
         db.commit()
         print(f'Seeded {NUM_GAMES} games with {HANDS_PER_GAME} hands each.')
     except Exception:
@@ -6,9 +6,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -28,13 +31,19 @@ class Player(Base):
     hands_played = relationship('PlayerHand', back_populates='player')
 
 
+# Routes look players up case-insensitively with func.lower(Player.name)
+Index('ix_players_name_lower', func.lower(Player.name))
+
+
 class GameSession(Base):
     __tablename__ = 'game_sessions'
+    __table_args__ = (Index('ix_game_sessions_game_date', 'game_date'),)
 
     game_id = Column(Integer, primary_key=True, autoincrement=True)
     game_date = Column(Date, nullable=False)
     status = Column(String, nullable=False, default='active')
     winners = Column(String, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     players = relationship('Player', secondary='game_players', back_populates='games')
@@ -66,6 +75,7 @@ class Hand(Base):
     source_upload_id = Column(
         Integer, ForeignKey('image_uploads.upload_id'), nullable=True
     )
+    version = Column(Integer, nullable=False, default=1, server_default='1')
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     game_session = relationship('GameSession', back_populates='hands')
@@ -74,7 +84,10 @@ class Hand(Base):
 
 class PlayerHand(Base):
     __tablename__ = 'player_hands'
-    __table_args__ = (UniqueConstraint('hand_id', 'player_id', name='uq_player_hand'),)
+    __table_args__ = (
+        UniqueConstraint('hand_id', 'player_id', name='uq_player_hand'),
+        Index('ix_player_hands_player_result', 'player_id', 'result'),
+    )
 
     player_hand_id = Column(Integer, primary_key=True, autoincrement=True)
     hand_id = Column(Integer, ForeignKey('hands.hand_id'), nullable=False)
@@ -90,8 +103,69 @@ class PlayerHand(Base):
     player = relationship('Player', back_populates='hands_played')
 
 
+class HandCard(Base):
+    """One dealt card of a hand, for searching hands by card.
+
+    Board cards have no ``player_hand_id``; hole cards point at the player
+    hand holding them. Maintained by ``app.services.hand_cards``.
+    """
+
+    __tablename__ = 'hand_cards'
+    __table_args__ = (
+        Index('ix_hand_cards_card_hand', 'card_code', 'hand_id'),
+        Index('ix_hand_cards_hand_id', 'hand_id'),
+    )
+
+    hand_card_id = Column(Integer, primary_key=True, autoincrement=True)
+    hand_id = Column(Integer, ForeignKey('hands.hand_id'), nullable=False)
+    player_hand_id = Column(
+        Integer, ForeignKey('player_hands.player_hand_id'), nullable=True
+    )
+    # 0-51 id from pydantic_models.card_codec
+    card_code = Column(SmallInteger, nullable=False)
+    # 'flop', 'turn', 'river' or 'hole'
+    location = Column(String, nullable=False)
+
+
+class HandEquity(Base):
+    __tablename__ = 'hand_equities'
+
+    hand_id = Column(Integer, ForeignKey('hands.hand_id'), primary_key=True)
+    street = Column(String, primary_key=True)
+    # JSON object mapping player_id to equity at this street
+    equities = Column(String, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class PlayerStatsAgg(Base):
+    """Running result totals for a player, per game and overall.
+
+    ``game_id`` 0 holds the player's career totals; any other value is one
+    game session. Maintained by ``app.services.player_stats``.
+    """
+
+    __tablename__ = 'player_stats_agg'
+
+    player_id = Column(Integer, ForeignKey('players.player_id'), primary_key=True)
+    game_id = Column(Integer, primary_key=True)
+    hands_played = Column(Integer, nullable=False, default=0)
+    hands_won = Column(Integer, nullable=False, default=0)
+    hands_lost = Column(Integer, nullable=False, default=0)
+    hands_folded = Column(Integer, nullable=False, default=0)
+    total_profit_loss = Column(Float, nullable=False, default=0.0)
+    turn_reached = Column(Integer, nullable=False, default=0)
+    river_reached = Column(Integer, nullable=False, default=0)
+    sessions_played = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
 class ImageUpload(Base):
     __tablename__ = 'image_uploads'
+    __table_args__ = (Index('ix_image_uploads_game_id', 'game_id'),)
 
     upload_id = Column(Integer, primary_key=True, autoincrement=True)
     game_id = Column(Integer, ForeignKey('game_sessions.game_id'), nullable=False)
@@ -0,0 +1,56 @@
+"""Shared loaders that fetch hands together with their players.
+
+Serializing a hand touches every ``PlayerHand`` and its ``Player``. Loading
+them lazily costs one query per row, so these loaders pull the whole tree
+in a fixed number of queries: one for the hands, one for their player
+hands with the player names joined in.
+
+The ``*_async`` loaders take an ``AsyncSession``, where lazy loading is not
+available at all.
+"""
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session, selectinload
+
+from app.database.models import Hand, PlayerHand
+
+
+def with_players(query: Query | Select) -> Query | Select:
+    """Eager-load ``Hand.player_hands`` and each ``PlayerHand.player``."""
+    return query.options(selectinload(Hand.player_hands).joinedload(PlayerHand.player))
+
+
+def load_hand(db: Session, game_id: int, hand_number: int) -> Hand | None:
+    """One hand with players loaded, or None.
+
+    Existing instances in the session are overwritten, so this also serves
+    to re-read a hand after a commit instead of ``db.refresh``.
+    """
+    return (
+        with_players(db.query(Hand))
+        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
+        .populate_existing()
+        .first()
+    )
+
+
+async def load_game_hands_async(db: AsyncSession, game_id: int) -> list[Hand]:
+    """All hands of a game in hand-number order, with players loaded."""
+    result = await db.scalars(
+        with_players(select(Hand))
+        .where(Hand.game_id == game_id)
+        .order_by(Hand.hand_number)
+    )
+    return list(result)
+
+
+async def load_hand_async(
+    db: AsyncSession, game_id: int, hand_number: int
+) -> Hand | None:
+    """``load_hand`` for an ``AsyncSession``."""
+    return await db.scalar(
+        with_players(select(Hand))
+        .where(Hand.game_id == game_id, Hand.hand_number == hand_number)
+        .execution_options(populate_existing=True)
+    )
@@ -1,19 +1,123 @@
-"""Shared database engine, session factory, and FastAPI dependency."""
+"""Shared database engine, session factory, and FastAPI dependency.
+
+File-backed SQLite databases get the ``tuned`` profile unless
+``SQLITE_PROFILE=default``: WAL journaling so player polling reads never
+wait on a dealer's write, ``synchronous=NORMAL`` (durable at every WAL
+checkpoint, safe against application crashes), a busy timeout so writers
+queue instead of failing with "database is locked", and a larger page
+cache plus memory-mapped reads. Each connection gets the pragmas as it is
+opened. The connection pool is per process, so every uvicorn worker holds
+up to ``DB_POOL_SIZE + DB_MAX_OVERFLOW`` connections.
+
+Read-heavy ``async def`` routes use ``get_async_db`` instead of ``get_db``.
+Its engine points at the same database through aiosqlite, so polling
+requests wait on the event loop rather than holding a threadpool thread
+each. URLs for other databases are used as given and must name an
+asyncio driver that is installed separately.
+"""
 
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 DATABASE_URL = os.environ.get('DATABASE_URL', 'sqlite:///./poker.db')
 
-_connect_args = (
-    {'check_same_thread': False} if DATABASE_URL.startswith('sqlite') else {}
-)
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'tuned')
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000')),
+    # Negative cache_size is in KiB rather than pages
+    'cache_size': -int(os.environ.get('SQLITE_CACHE_KIB', '65536')),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_BYTES', str(256 * 1024 * 1024))),
+}
+
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '8'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '8'))
+
+ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite'}
+
+
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith('sqlite') and ':memory:' not in url and url != 'sqlite://'
+
+
+def _apply_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str, profile: str = SQLITE_PROFILE) -> Engine:
+    """Build an engine for ``url`` with the SQLite profile applied if it fits.
 
-engine = create_engine(DATABASE_URL, connect_args=_connect_args)
+    Args:
+        url: SQLAlchemy database URL.
+        profile: ``tuned`` for the pragmas and a sized ``QueuePool``,
+            ``default`` for SQLAlchemy's defaults. Ignored for in-memory
+            and non-SQLite databases.
+    """
+    connect_args = {'check_same_thread': False} if url.startswith('sqlite') else {}
+    if profile != 'tuned' or not _is_sqlite_file(url):
+        return create_engine(url, connect_args=connect_args)
+
+    engine = create_engine(
+        url,
+        connect_args=connect_args,
+        poolclass=QueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+    )
+    event.listen(engine, 'connect', _apply_pragmas)
+    return engine
+
+
+def async_database_url(url: str) -> str:
+    """``url`` with its driver swapped for the asyncio one from ASYNC_DRIVERS."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str, profile: str = SQLITE_PROFILE) -> AsyncEngine:
+    """Async counterpart of ``create_db_engine`` for the same database.
+
+    Args:
+        url: Sync SQLAlchemy URL, as in ``DATABASE_URL``.
+        profile: As for ``create_db_engine``.
+    """
+    async_url = async_database_url(url)
+    if profile != 'tuned' or not _is_sqlite_file(url):
+        return create_async_engine(async_url)
+
+    engine = create_async_engine(
+        async_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+    )
+    event.listen(engine.sync_engine, 'connect', _apply_pragmas)
+    return engine
+
+
+engine = create_db_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine(DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -21,3 +125,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
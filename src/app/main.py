@@ -1,11 +1,44 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .routes import games, hands, images, players, upload, stats, search
+from .routes import (
+    equity,
+    events,
+    games,
+    hands,
+    images,
+    players,
+    upload,
+    stats,
+    search,
+)
+from .database.session import engine
+from .services.detection_queue import detection_queue
+from .services.equity_pool import equity_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # EQUITY_WORKERS=0 disables the pool; equity then runs on a thread
+    workers = os.getenv('EQUITY_WORKERS')
+    equity_pool.start(int(workers) if workers else None)
+    # Each detection worker holds its own model; DETECTION_WORKERS=0 runs
+    # detection on a thread with the request's detector instead
+    detection_queue.start(
+        int(os.getenv('DETECTION_WORKERS', '1')), images.get_card_detector
+    )
+    detection_queue.resume(engine, images.get_card_detector, events.publish_upload)
+    try:
+        yield
+    finally:
+        detection_queue.shutdown()
+        equity_pool.shutdown()
+
 
-app = FastAPI(title='All In Analytics Core Backend', version='1.0.0')
+app = FastAPI(title='All In Analytics Core Backend', version='1.0.0', lifespan=lifespan)
 
 _raw_origins = os.getenv('ALLOWED_ORIGINS', 'http://localhost:5173')
 _allowed_origins = [origin.strip() for origin in _raw_origins.split(',')]
@@ -39,12 +72,14 @@ app.add_middleware(
 # Include the routers
 app.include_router(games.router)
 app.include_router(hands.router)
+app.include_router(events.router)
 app.include_router(images.router)
 app.include_router(images.corrections_router)
 app.include_router(players.router)
 app.include_router(upload.router)
 app.include_router(stats.router)
 app.include_router(search.router)
+app.include_router(equity.router)
 
 
 @app.get('/')
@@ -0,0 +1,31 @@
+"""ETags for conditional GETs of game and hand responses.
+
+ETags are built from the version counters kept by
+``app.services.versions``, so a route can answer a matching
+``If-None-Match`` with a 304 after looking up one version, before loading
+or serializing anything.
+"""
+
+from fastapi import Request, Response
+
+
+def game_etag(game_id: int, version: int) -> str:
+    return f'W/"game-{game_id}-{version}"'
+
+
+def hand_etag(hand_id: int, version: int) -> str:
+    # hand_id rather than hand_number: a deleted number can be reused
+    return f'W/"hand-{hand_id}-{version}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """A 304 for ``etag`` if the request's ``If-None-Match`` already has it."""
+    header = request.headers.get('if-none-match')
+    if header is None:
+        return None
+    tags = {tag.strip() for tag in header.split(',')}
+    # If-None-Match compares weakly, so a W/ prefix on either side is ignored
+    bare = {tag.removeprefix('W/') for tag in tags}
+    if '*' in tags or etag.removeprefix('W/') in bare:
+        return Response(status_code=304, headers={'ETag': etag})
+    return None
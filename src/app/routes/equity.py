@@ -0,0 +1,41 @@
+"""Equity router - handles equity queries that are not tied to a recorded hand."""
+
+from fastapi import APIRouter, HTTPException
+
+from app.services.equity_pool import equity_pool
+from app.services.equity_range import range_equity
+from pydantic_models.app_models import RangeEquityRequest, RangeEquityResponse
+from pydantic_models.card_validator import validate_no_duplicate_cards
+
+router = APIRouter(prefix='/equity', tags=['equity'])
+
+
+@router.post('/range', response_model=RangeEquityResponse)
+async def post_range_equity(payload: RangeEquityRequest):
+    """Equity of the hero's hole cards against a weighted villain range.
+
+    Range combos that share a card with the hero or the board are removed
+    before evaluation.
+    """
+    try:
+        validate_no_duplicate_cards(
+            [str(c) for c in payload.hero_cards + payload.board]
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    try:
+        result = await equity_pool.run(
+            range_equity,
+            [c.card_id for c in payload.hero_cards],
+            payload.villain_range,
+            [c.card_id for c in payload.board],
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return RangeEquityResponse(
+        equity=round(result.equity, 4),
+        villain_combos=result.combos,
+        method=result.method,
+    )
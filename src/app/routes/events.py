@@ -0,0 +1,143 @@
+"""Events router - streams live game updates as server-sent events.
+
+A stream opens with a ``snapshot`` of the latest hand's status (``null``
+before the first hand) and then carries only deltas, published by the
+write routes through ``app.services.game_events``:
+
+- ``hand``: a new hand, with every player's status in it
+- ``board``: a hand's community cards changed
+- ``player``: one player's status in a hand changed
+- ``hand_deleted``: a hand was deleted
+- ``upload``: an image upload changed status
+- ``game``: the game was completed or reactivated
+- ``game_deleted``: the game was deleted; the stream ends
+
+A client that falls too far behind is sent a fresh ``snapshot`` instead of
+its backlog, as is every client that reconnects.
+"""
+
+from collections.abc import AsyncIterable
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database.models import GameSession, Hand, ImageUpload, PlayerHand
+from app.database.queries import load_hand_async
+from app.database.session import get_async_db
+from app.routes.serializers import hand_status_response, player_status_entry
+from app.services.game_events import RESYNC, game_events
+from pydantic_models.app_models import HandStatusResponse
+
+router = APIRouter(prefix='/games', tags=['events'])
+
+
+def publish_hand(game: GameSession, hand: Hand) -> None:
+    game_events.publish(game.game_id, 'hand', hand_status_response(game.players, hand))
+
+
+def publish_board(hand: Hand) -> None:
+    game_events.publish(
+        hand.game_id,
+        'board',
+        {
+            'hand_number': hand.hand_number,
+            'community_recorded': any(
+                c is not None for c in [hand.flop_1, hand.turn, hand.river]
+            ),
+            'flop_1': hand.flop_1,
+            'flop_2': hand.flop_2,
+            'flop_3': hand.flop_3,
+            'turn': hand.turn,
+            'river': hand.river,
+        },
+    )
+
+
+def publish_player(hand: Hand, name: str, ph: PlayerHand | None) -> None:
+    """Publish ``name``'s status in ``hand``; ``ph=None`` after removal."""
+    game_events.publish(
+        hand.game_id,
+        'player',
+        {'hand_number': hand.hand_number, **player_status_entry(name, ph).model_dump()},
+    )
+
+
+def publish_hand_deleted(game_id: int, hand_number: int) -> None:
+    game_events.publish(game_id, 'hand_deleted', {'hand_number': hand_number})
+
+
+def publish_upload(upload: ImageUpload) -> None:
+    game_events.publish(
+        upload.game_id,
+        'upload',
+        {'upload_id': upload.upload_id, 'status': upload.status},
+    )
+
+
+def publish_game(game: GameSession) -> None:
+    game_events.publish(game.game_id, 'game', {'status': game.status})
+
+
+def publish_game_deleted(game_id: int) -> None:
+    game_events.publish(game_id, 'game_deleted', {'game_id': game_id})
+
+
+async def _existing_game(
+    game_id: int,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> int:
+    # Checked before the stream starts, while a 404 can still be sent
+    if await db.get(GameSession, game_id) is None:
+        raise HTTPException(status_code=404, detail='Game session not found')
+    return game_id
+
+
+async def _snapshot(db: AsyncSession, game_id: int) -> HandStatusResponse | None:
+    """Status of the game's latest hand, read fresh from the database."""
+    try:
+        game = await db.get(
+            GameSession,
+            game_id,
+            options=[selectinload(GameSession.players)],
+            populate_existing=True,
+        )
+        hand_number = await db.scalar(
+            select(func.max(Hand.hand_number)).where(Hand.game_id == game_id)
+        )
+        if game is None or hand_number is None:
+            return None
+        hand = await load_hand_async(db, game_id, hand_number)
+        return hand_status_response(game.players, hand) if hand else None
+    finally:
+        # Hand the connection back while the stream idles
+        await db.close()
+
+
+def _snapshot_event(status: HandStatusResponse | None) -> ServerSentEvent:
+    # EventSource drops events without a data line, so send an explicit null
+    if status is None:
+        return ServerSentEvent(event='snapshot', raw_data='null')
+    return ServerSentEvent(event='snapshot', data=status)
+
+
+@router.get('/{game_id}/events', response_class=EventSourceResponse)
+async def stream_game_events(
+    game_id: Annotated[int, Depends(_existing_game)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> AsyncIterable[ServerSentEvent]:
+    """Stream the game's hand, player and upload changes as they are committed."""
+    # Subscribe before the snapshot so no write can fall between the two
+    with game_events.subscribe(game_id) as subscription:
+        yield _snapshot_event(await _snapshot(db, game_id))
+        while True:
+            event, data = await subscription.get()
+            if event == RESYNC:
+                yield _snapshot_event(await _snapshot(db, game_id))
+                continue
+            yield ServerSentEvent(event=event, data=data)
+            if event == 'game_deleted':
+                return
@@ -1,19 +1,37 @@
 """Games router - handles game-related endpoints."""
 
-import csv
-import io
 import json
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+)
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.database.models import GamePlayer, GameSession, Hand, Player, PlayerHand
+from app.database.models import (
+    GamePlayer,
+    GameSession,
+    HandEquity,
+    Player,
+    PlayerHand,
+)
 from app.database.session import get_db
+from app.routes.conditional import game_etag, not_modified
+from app.routes.events import publish_game, publish_game_deleted
+from app.services.csv_export import export_rows_query, iter_csv
+from app.services.equity_precompute import precompute_game_equities
+from app.services.hand_cards import clear_hand_cards
+from app.services.player_stats import refresh_game_stats
+from app.services.versions import bump_versions
 from pydantic_models.app_models import (
     CompleteGameRequest,
     GameSessionCreate,
@@ -106,11 +124,21 @@ def create_game_session(
 @router.get('/{game_id}', response_model=GameSessionResponse)
 def get_game_session(
     game_id: int,
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
-    if game is None:
+    version = (
+        db.query(GameSession.version).filter(GameSession.game_id == game_id).scalar()
+    )
+    if version is None:
         raise HTTPException(status_code=404, detail='Game session not found')
+    etag = game_etag(game_id, version)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+
+    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
+    response.headers['ETag'] = etag
     return GameSessionResponse(
         game_id=game.game_id,
         game_date=game.game_date,
@@ -126,6 +154,7 @@ def get_game_session(
 def complete_game_session(
     game_id: int,
     db: Annotated[Session, Depends(get_db)],
+    background_tasks: BackgroundTasks,
     payload: CompleteGameRequest | None = None,
 ):
     game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
@@ -136,8 +165,12 @@ def complete_game_session(
     winners = payload.winners if payload else []
     game.status = 'completed'
     game.winners = json.dumps(winners) if winners else None
+    bump_versions(db, game_id)
     db.commit()
     db.refresh(game)
+    publish_game(game)
+    # Equities for playback are computed on the equity pool after the response
+    background_tasks.add_task(precompute_game_equities, game_id, db.get_bind())
     return GameSessionResponse(
         game_id=game.game_id,
         game_date=game.game_date,
@@ -161,8 +194,10 @@ def reactivate_game_session(
         raise HTTPException(status_code=400, detail='Game session is already active')
     game.status = 'active'
     game.winners = None
+    bump_versions(db, game_id)
     db.commit()
     db.refresh(game)
+    publish_game(game)
     return GameSessionResponse(
         game_id=game.game_id,
         game_date=game.game_date,
@@ -174,6 +209,25 @@ def reactivate_game_session(
     )
 
 
+@router.get('/export/csv')
+def export_games_csv(
+    db: Annotated[Session, Depends(get_db)],
+    date_from: date | None = None,
+    date_to: date | None = None,
+):
+    """Stream every game in the date range as one CSV, oldest first."""
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(
+            status_code=400, detail='date_from must not be after date_to'
+        )
+    span = '_'.join(d.isoformat() if d else 'all' for d in (date_from, date_to))
+    return StreamingResponse(
+        iter_csv(db, export_rows_query(date_from=date_from, date_to=date_to)),
+        media_type='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="games_{span}.csv"'},
+    )
+
+
 @router.get('/{game_id}/export/csv')
 def export_game_csv(
     game_id: int,
@@ -183,55 +237,10 @@ def export_game_csv(
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
 
-    hands = (
-        db.query(Hand).filter(Hand.game_id == game_id).order_by(Hand.hand_number).all()
-    )
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            'game_date',
-            'hand_number',
-            'player_name',
-            'hole_card_1',
-            'hole_card_2',
-            'flop_1',
-            'flop_2',
-            'flop_3',
-            'turn',
-            'river',
-            'result',
-            'profit_loss',
-        ]
-    )
-
     game_date_str = game.game_date.strftime('%m-%d-%Y') if game.game_date else ''
-
-    for hand in hands:
-        for ph in hand.player_hands:
-            player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-            writer.writerow(
-                [
-                    game_date_str,
-                    hand.hand_number,
-                    player.name if player else '',
-                    ph.card_1 or '',
-                    ph.card_2 or '',
-                    hand.flop_1 or '',
-                    hand.flop_2 or '',
-                    hand.flop_3 or '',
-                    hand.turn or '',
-                    hand.river or '',
-                    ph.result or '',
-                    ph.profit_loss if ph.profit_loss is not None else '',
-                ]
-            )
-
     filename = f'game_{game_id}_{game_date_str}.csv'
-    output.seek(0)
     return StreamingResponse(
-        output,
+        iter_csv(db, export_rows_query(game_id=game_id)),
         media_type='text/csv',
         headers={'Content-Disposition': f'attachment; filename="{filename}"'},
     )
@@ -246,10 +255,14 @@ def delete_game(
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
 
-    # Delete child records: player_hands → hands → game_players → game
+    # Delete child records: per-hand rows → hands → game_players → game
     for hand in game.hands:
+        clear_hand_cards(db, hand.hand_id)
         db.query(PlayerHand).filter(PlayerHand.hand_id == hand.hand_id).delete()
+        db.query(HandEquity).filter(HandEquity.hand_id == hand.hand_id).delete()
         db.delete(hand)
+    refresh_game_stats(db, game_id)
     db.query(GamePlayer).filter(GamePlayer.game_id == game_id).delete()
     db.delete(game)
     db.commit()
+    publish_game_deleted(game_id)
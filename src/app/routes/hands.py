@@ -2,16 +2,42 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from app.database.models import GameSession, Hand, Player, PlayerHand
-from app.database.session import get_db
-from app.services.equity import calculate_equity
+from app.database.queries import load_game_hands_async, load_hand, load_hand_async
+from app.database.session import get_async_db, get_db
+from app.routes.conditional import game_etag, hand_etag, not_modified
+from app.routes.events import (
+    publish_board,
+    publish_hand,
+    publish_hand_deleted,
+    publish_player,
+)
+from app.routes.serializers import hand_response, hand_status_response
+from app.services.equity import STREET_BOARD_SIZES
+from app.services.equity_pool import (
+    calculate_equity_async,
+    calculate_street_equities_async,
+    equity_pool,
+)
+from app.services.equity_precompute import (
+    clear_hand_equities,
+    dealt_board,
+    stored_street_equities_async,
+    street_for_board_size,
+)
+from app.services.game_events import game_events
+from app.services.hand_cards import clear_hand_cards, index_hand_cards
+from app.services.player_stats import refresh_game_stats
+from app.services.versions import bump_versions
 from pydantic_models.app_models import (
     CommunityCardsUpdate,
     EquityResponse,
+    EquityTimelineResponse,
     FlopUpdate,
     HandCreate,
     HandResponse,
@@ -21,218 +47,294 @@ from pydantic_models.app_models import (
     PlayerHandResponse,
     PlayerResultEntry,
     PlayerResultUpdate,
-    PlayerStatusEntry,
     RiverUpdate,
     TurnUpdate,
 )
+from pydantic_models.card_codec import encode_cards, encode_mask
 from pydantic_models.card_validator import validate_no_duplicate_cards
 
 router = APIRouter(prefix='/games', tags=['hands'])
 
+# Upper bound on ?wait=, kept under the ~100 s idle timeout of the tunnel
+LONG_POLL_MAX_WAIT = 60
+
 
-def _derive_participation_status(player_hand: PlayerHand | None) -> str:
-    """Derive participation status from a PlayerHand row (or None)."""
-    if player_hand is None:
-        return 'idle'
-    if player_hand.result is not None:
-        return player_hand.result
-    if player_hand.card_1 is not None:
-        return 'joined'
-    return 'pending'
+def _hand_version(game_id: int, hand_number: int) -> Select:
+    return select(Hand.hand_id, Hand.version).where(
+        Hand.game_id == game_id, Hand.hand_number == hand_number
+    )
 
 
 @router.get('/{game_id}/hands/{hand_number}/status', response_model=HandStatusResponse)
-def get_hand_status(
+async def get_hand_status(
     game_id: int,
     hand_number: int,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    wait: Annotated[float, Query(ge=0, le=LONG_POLL_MAX_WAIT)] = 0,
+    since_version: int | None = None,
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
+    """Status of every game player in the hand.
+
+    With ``since_version`` and ``wait``, the request is held for up to
+    ``wait`` seconds while the hand is still at ``since_version``, and
+    answered as soon as it changes. On timeout the current status is
+    returned, or a 304 if ``If-None-Match`` still matches.
+    """
+    if since_version is not None and wait > 0:
+
+        async def changed() -> bool:
+            row = (await db.execute(_hand_version(game_id, hand_number))).first()
+            # Each check reads in a fresh transaction, and none is held between
+            await db.close()
+            return row is None or row.version != since_version
+
+        await game_events.wait_until(game_id, changed, wait)
+
+    # The game's roster is fixed, so the hand's version covers the whole status
+    row = (await db.execute(_hand_version(game_id, hand_number))).first()
+    if row is not None:
+        etag = hand_etag(*row)
+        if (unchanged := not_modified(request, etag)) is not None:
+            return unchanged
+        response.headers['ETag'] = etag
+
+    game = await db.get(
+        GameSession, game_id, options=[selectinload(GameSession.players)]
+    )
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
 
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
+    hand = await load_hand_async(db, game_id, hand_number)
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
 
-    community_recorded = any(
-        c is not None for c in [hand.flop_1, hand.turn, hand.river]
-    )
-
-    # Build a lookup of player_id -> PlayerHand for this hand
-    ph_by_player_id = {ph.player_id: ph for ph in hand.player_hands}
-
-    players: list[PlayerStatusEntry] = []
-    for player in game.players:
-        ph = ph_by_player_id.get(player.player_id)
-        players.append(
-            PlayerStatusEntry(
-                name=player.name,
-                participation_status=_derive_participation_status(ph),
-                card_1=ph.card_1 if ph else None,
-                card_2=ph.card_2 if ph else None,
-                result=ph.result if ph else None,
-                outcome_street=ph.outcome_street if ph else None,
-            )
-        )
-
-    return HandStatusResponse(
-        hand_number=hand.hand_number,
-        community_recorded=community_recorded,
-        players=players,
-    )
+    return hand_status_response(game.players, hand)
 
 
 @router.get('/{game_id}/hands', response_model=list[HandResponse])
-def list_hands(
+async def list_hands(
     game_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
-    if game is None:
-        raise HTTPException(status_code=404, detail='Game session not found')
-
-    hands = (
-        db.query(Hand).filter(Hand.game_id == game_id).order_by(Hand.hand_number).all()
+    version = await db.scalar(
+        select(GameSession.version).where(GameSession.game_id == game_id)
     )
+    if version is None:
+        raise HTTPException(status_code=404, detail='Game session not found')
+    etag = game_etag(game_id, version)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
 
-    result: list[HandResponse] = []
-    for hand in hands:
-        player_hand_responses: list[PlayerHandResponse] = []
-        for ph in hand.player_hands:
-            player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-            player_hand_responses.append(
-                PlayerHandResponse(
-                    player_hand_id=ph.player_hand_id,
-                    hand_id=ph.hand_id,
-                    player_id=ph.player_id,
-                    player_name=player.name if player else '',
-                    card_1=ph.card_1,
-                    card_2=ph.card_2,
-                    result=ph.result,
-                    profit_loss=ph.profit_loss,
-                    outcome_street=ph.outcome_street,
-                )
-            )
-        result.append(
-            HandResponse(
-                hand_id=hand.hand_id,
-                game_id=hand.game_id,
-                hand_number=hand.hand_number,
-                flop_1=hand.flop_1,
-                flop_2=hand.flop_2,
-                flop_3=hand.flop_3,
-                turn=hand.turn,
-                river=hand.river,
-                created_at=hand.created_at,
-                player_hands=player_hand_responses,
-            )
-        )
-    return result
+    response.headers['ETag'] = etag
+    return [hand_response(hand) for hand in await load_game_hands_async(db, game_id)]
 
 
 @router.get('/{game_id}/hands/{hand_number}', response_model=HandResponse)
 def get_hand(
     game_id: int,
     hand_number: int,
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
-    if game is None:
-        raise HTTPException(status_code=404, detail='Game session not found')
+    row = db.execute(_hand_version(game_id, hand_number)).first()
+    if row is None:
+        # Only hit the games table to tell the two 404s apart
+        game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
+        if game is None:
+            raise HTTPException(status_code=404, detail='Game session not found')
+        raise HTTPException(status_code=404, detail='Hand not found')
+    etag = hand_etag(*row)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
 
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
+    hand = load_hand(db, game_id, hand_number)
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
 
-    player_hand_responses: list[PlayerHandResponse] = []
-    for ph in hand.player_hands:
-        player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-        player_hand_responses.append(
-            PlayerHandResponse(
-                player_hand_id=ph.player_hand_id,
-                hand_id=ph.hand_id,
-                player_id=ph.player_id,
-                player_name=player.name if player else '',
-                card_1=ph.card_1,
-                card_2=ph.card_2,
-                result=ph.result,
-                profit_loss=ph.profit_loss,
-                outcome_street=ph.outcome_street,
-            )
-        )
+    response.headers['ETag'] = etag
+    return hand_response(hand)
 
-    return HandResponse(
-        hand_id=hand.hand_id,
-        game_id=hand.game_id,
-        hand_number=hand.hand_number,
-        flop_1=hand.flop_1,
-        flop_2=hand.flop_2,
-        flop_3=hand.flop_3,
-        turn=hand.turn,
-        river=hand.river,
-        created_at=hand.created_at,
-        player_hands=player_hand_responses,
+
+async def _get_hand_async(game_id: int, hand_number: int, db: AsyncSession) -> Hand:
+    """Look up a hand of an existing game or raise 404."""
+    game = await db.scalar(
+        select(GameSession.game_id).where(GameSession.game_id == game_id)
     )
+    if game is None:
+        raise HTTPException(status_code=404, detail='Game session not found')
+    hand = await load_hand_async(db, game_id, hand_number)
+    if hand is None:
+        raise HTTPException(status_code=404, detail='Hand not found')
+    return hand
+
 
+def _current_equities(
+    stored: dict[int, float] | None, player_ids: list[int]
+) -> list[float] | None:
+    """Stored equities for ``player_ids``, if still current.
 
-def _db_card_to_tuple(card_str: str) -> tuple[str, str]:
-    """Convert DB card string (e.g. 'AS', '10H') to (rank, suit) tuple for equity calc."""
-    return (card_str[:-1], card_str[-1].lower())
+    Rows written before a player joined or left the hand are ignored.
+    """
+    if stored is None or set(stored) != set(player_ids):
+        return None
+    return [stored[pid] for pid in player_ids]
 
 
-@router.get('/{game_id}/hands/{hand_number}/equity', response_model=EquityResponse)
-def get_hand_equity(
+@router.get(
+    '/{game_id}/hands/{hand_number}/equity',
+    response_model=EquityResponse,
+    response_model_exclude_none=True,
+)
+async def get_hand_equity(
     game_id: int,
     hand_number: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    precision: Annotated[
+        float | None,
+        Query(
+            gt=0,
+            le=0.5,
+            description='Sample until each 95% CI half-width is within this, '
+            'e.g. 0.005 for ±0.5%',
+        ),
+    ] = None,
+    time_budget_ms: Annotated[
+        int | None,
+        Query(ge=1, le=30_000, description='Stop sampling after this many ms'),
+    ] = None,
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
-    if game is None:
-        raise HTTPException(status_code=404, detail='Game session not found')
+    """Return each player's equity.
 
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
-    if hand is None:
-        raise HTTPException(status_code=404, detail='Hand not found')
+    By default the result is exact. Passing ``precision`` and/or
+    ``time_budget_ms`` switches to adaptive Monte Carlo sampling, and the
+    response also carries each player's confidence interval and the number
+    of runouts sampled.
+    """
+    hand = await _get_hand_async(game_id, hand_number, db)
 
     # Collect players with non-null hole cards
-    players_with_cards: list[tuple[str, list[tuple[str, str]]]] = []
+    players_with_cards: list[tuple[str, int]] = []
+    player_ids: list[int] = []
     for ph in hand.player_hands:
         if ph.card_1 is None or ph.card_2 is None:
             continue
-        player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-        player_name = player.name if player else ''
-        hole_cards = [_db_card_to_tuple(ph.card_1), _db_card_to_tuple(ph.card_2)]
+        player_name = ph.player.name if ph.player else ''
+        hole_cards = encode_mask([ph.card_1, ph.card_2])
         players_with_cards.append((player_name, hole_cards))
+        player_ids.append(ph.player_id)
 
     if len(players_with_cards) < 2:
         return EquityResponse(equities=[])
 
     # Gather community cards
-    community_cards: list[tuple[str, str]] = []
-    for card_str in [hand.flop_1, hand.flop_2, hand.flop_3, hand.turn, hand.river]:
-        if card_str is not None:
-            community_cards.append(_db_card_to_tuple(card_str))
+    community_cards = encode_mask(
+        c
+        for c in [hand.flop_1, hand.flop_2, hand.flop_3, hand.turn, hand.river]
+        if c is not None
+    )
 
     player_hole_cards = [hc for _, hc in players_with_cards]
-    equities = calculate_equity(player_hole_cards, community_cards)
+    if precision is not None or time_budget_ms is not None:
+        # Don't hold a connection while the pool computes
+        await db.close()
+        estimate = await equity_pool.estimate_equity(
+            player_hole_cards,
+            community_cards,
+            precision=precision,
+            time_budget=None if time_budget_ms is None else time_budget_ms / 1000,
+        )
+        return EquityResponse(
+            equities=[
+                {
+                    'player_name': name,
+                    'equity': round(eq, 4),
+                    'ci_low': round(max(eq - hw, 0.0), 4),
+                    'ci_high': round(min(eq + hw, 1.0), 4),
+                }
+                for (name, _), eq, hw in zip(
+                    players_with_cards,
+                    estimate.equities,
+                    estimate.half_widths,
+                    strict=True,
+                )
+            ],
+            samples=estimate.samples,
+            confidence=estimate.confidence,
+        )
+
+    street = street_for_board_size(community_cards.bit_count())
+    stored = await stored_street_equities_async(db, hand, street) if street else None
+    await db.close()
+    equities = _current_equities(stored, player_ids)
+    if equities is None:
+        equities = await calculate_equity_async(player_hole_cards, community_cards)
 
     return EquityResponse(
         equities=[
             {'player_name': name, 'equity': round(eq, 4)}
-            for (name, _), eq in zip(players_with_cards, equities)
+            for (name, _), eq in zip(players_with_cards, equities, strict=True)
+        ]
+    )
+
+
+@router.get(
+    '/{game_id}/hands/{hand_number}/equity/timeline',
+    response_model=EquityTimelineResponse,
+)
+async def get_hand_equity_timeline(
+    game_id: int,
+    hand_number: int,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """Return equities for every street dealt so far, computed in one pass."""
+    hand = await _get_hand_async(game_id, hand_number, db)
+
+    players_with_cards: list[tuple[str, int]] = []
+    player_ids: list[int] = []
+    for ph in hand.player_hands:
+        if ph.card_1 is None or ph.card_2 is None:
+            continue
+        player_name = ph.player.name if ph.player else ''
+        hole_cards = encode_mask([ph.card_1, ph.card_2])
+        players_with_cards.append((player_name, hole_cards))
+        player_ids.append(ph.player_id)
+
+    if len(players_with_cards) < 2:
+        return EquityTimelineResponse(streets=[])
+
+    # Only a contiguous run of dealt streets counts: flop, then turn, then river
+    community_cards = encode_cards(dealt_board(hand))
+
+    timeline = {
+        street: _current_equities(
+            await stored_street_equities_async(db, hand, street), player_ids
+        )
+        for street, size in STREET_BOARD_SIZES.items()
+        if size <= len(community_cards)
+    }
+    # Don't hold a connection while the pool computes
+    await db.close()
+    if any(equities is None for equities in timeline.values()):
+        player_hole_cards = [hc for _, hc in players_with_cards]
+        timeline = await calculate_street_equities_async(
+            player_hole_cards, community_cards
+        )
+
+    return EquityTimelineResponse(
+        streets=[
+            {
+                'street': street,
+                'equities': [
+                    {'player_name': name, 'equity': round(eq, 4)}
+                    for (name, _), eq in zip(players_with_cards, equities, strict=True)
+                ],
+            }
+            for street, equities in timeline.items()
         ]
     )
 
@@ -248,11 +350,7 @@ def edit_community_cards(
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
 
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
+    hand = load_hand(db, game_id, hand_number)
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
 
@@ -276,76 +374,20 @@ def edit_community_cards(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    clear_hand_equities(db, hand.hand_id)
     hand.flop_1 = str(payload.flop_1)
     hand.flop_2 = str(payload.flop_2)
     hand.flop_3 = str(payload.flop_3)
     hand.turn = str(payload.turn) if payload.turn is not None else None
     hand.river = str(payload.river) if payload.river is not None else None
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [ph.player_id for ph in hand.player_hands])
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
-    db.refresh(hand)
-
-    player_hand_responses: list[PlayerHandResponse] = []
-    for ph in hand.player_hands:
-        player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-        player_hand_responses.append(
-            PlayerHandResponse(
-                player_hand_id=ph.player_hand_id,
-                hand_id=ph.hand_id,
-                player_id=ph.player_id,
-                player_name=player.name if player else '',
-                card_1=ph.card_1,
-                card_2=ph.card_2,
-                result=ph.result,
-                profit_loss=ph.profit_loss,
-                outcome_street=ph.outcome_street,
-            )
-        )
-
-    return HandResponse(
-        hand_id=hand.hand_id,
-        game_id=hand.game_id,
-        hand_number=hand.hand_number,
-        flop_1=hand.flop_1,
-        flop_2=hand.flop_2,
-        flop_3=hand.flop_3,
-        turn=hand.turn,
-        river=hand.river,
-        created_at=hand.created_at,
-        player_hands=player_hand_responses,
-    )
-
-
-def _build_hand_response(hand: Hand, db: Session) -> HandResponse:
-    """Build a HandResponse from a Hand ORM object."""
-    player_hand_responses: list[PlayerHandResponse] = []
-    for ph in hand.player_hands:
-        player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-        player_hand_responses.append(
-            PlayerHandResponse(
-                player_hand_id=ph.player_hand_id,
-                hand_id=ph.hand_id,
-                player_id=ph.player_id,
-                player_name=player.name if player else '',
-                card_1=ph.card_1,
-                card_2=ph.card_2,
-                result=ph.result,
-                profit_loss=ph.profit_loss,
-                outcome_street=ph.outcome_street,
-            )
-        )
-    return HandResponse(
-        hand_id=hand.hand_id,
-        game_id=hand.game_id,
-        hand_number=hand.hand_number,
-        flop_1=hand.flop_1,
-        flop_2=hand.flop_2,
-        flop_3=hand.flop_3,
-        turn=hand.turn,
-        river=hand.river,
-        created_at=hand.created_at,
-        player_hands=player_hand_responses,
-    )
+    hand = load_hand(db, game_id, hand_number)
+    publish_board(hand)
+    return hand_response(hand)
 
 
 def _get_game_and_hand(
@@ -355,11 +397,7 @@ def _get_game_and_hand(
     game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
+    hand = load_hand(db, game_id, hand_number)
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
     return game, hand
@@ -391,13 +429,17 @@ def set_flop(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    clear_hand_equities(db, hand.hand_id)
     hand.flop_1 = str(payload.flop_1)
     hand.flop_2 = str(payload.flop_2)
     hand.flop_3 = str(payload.flop_3)
+    index_hand_cards(db, hand)
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
-    db.refresh(hand)
-    return _build_hand_response(hand, db)
+    hand = load_hand(db, game_id, hand_number)
+    publish_board(hand)
+    return hand_response(hand)
 
 
 @router.patch('/{game_id}/hands/{hand_number}/turn', response_model=HandResponse)
@@ -430,11 +472,16 @@ def set_turn(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    clear_hand_equities(db, hand.hand_id)
     hand.turn = str(payload.turn)
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [ph.player_id for ph in hand.player_hands])
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
-    db.refresh(hand)
-    return _build_hand_response(hand, db)
+    hand = load_hand(db, game_id, hand_number)
+    publish_board(hand)
+    return hand_response(hand)
 
 
 @router.patch('/{game_id}/hands/{hand_number}/river', response_model=HandResponse)
@@ -470,11 +517,16 @@ def set_river(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    clear_hand_equities(db, hand.hand_id)
     hand.river = str(payload.river)
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [ph.player_id for ph in hand.player_hands])
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
-    db.refresh(hand)
-    return _build_hand_response(hand, db)
+    hand = load_hand(db, game_id, hand_number)
+    publish_board(hand)
+    return hand_response(hand)
 
 
 @router.patch(
@@ -540,11 +592,15 @@ def edit_player_hole_cards(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    clear_hand_equities(db, hand.hand_id)
     ph.card_1 = str(payload.card_1) if payload.card_1 is not None else None
     ph.card_2 = str(payload.card_2) if payload.card_2 is not None else None
+    index_hand_cards(db, hand)
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
     db.refresh(ph)
+    publish_player(hand, player.name, ph)
 
     return PlayerHandResponse(
         player_hand_id=ph.player_hand_id,
@@ -641,8 +697,12 @@ def add_player_to_hand(
         profit_loss=payload.profit_loss,
     )
     db.add(ph)
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [player.player_id])
+    bump_versions(db, game_id, hand.hand_id)
     db.commit()
     db.refresh(ph)
+    publish_player(hand, player.name, ph)
 
     return PlayerHandResponse(
         player_hand_id=ph.player_hand_id,
@@ -700,7 +760,11 @@ def remove_player_from_hand(
         )
 
     db.delete(ph)
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [player.player_id])
+    bump_versions(db, game_id, hand.hand_id)
     db.commit()
+    publish_player(hand, player.name, None)
 
 
 @router.delete('/{game_id}/hands/{hand_number}', status_code=204)
@@ -721,9 +785,15 @@ def delete_hand(
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
 
+    player_ids = [ph.player_id for ph in hand.player_hands]
+    clear_hand_cards(db, hand.hand_id)
     db.query(PlayerHand).filter(PlayerHand.hand_id == hand.hand_id).delete()
+    clear_hand_equities(db, hand.hand_id)
     db.delete(hand)
+    refresh_game_stats(db, game_id, player_ids)
+    bump_versions(db, game_id)
     db.commit()
+    publish_hand_deleted(game_id, hand_number)
 
 
 @router.post('/{game_id}/hands', status_code=201, response_model=HandResponse)
@@ -827,8 +897,12 @@ def record_hand(
             )
         )
 
+    index_hand_cards(db, hand)
+    refresh_game_stats(db, game_id, [r.player_id for r in player_hand_responses])
+    bump_versions(db, game_id)
     db.commit()
     db.refresh(hand)
+    publish_hand(game, hand)
 
     return HandResponse(
         hand_id=hand.hand_id,
@@ -980,9 +1054,12 @@ def update_player_result(
     ph.result = payload.result
     ph.profit_loss = payload.profit_loss
     ph.outcome_street = payload.outcome_street
+    refresh_game_stats(db, game_id, [player.player_id])
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
     db.refresh(ph)
+    publish_player(hand, player.name, ph)
 
     return PlayerHandResponse(
         player_hand_id=ph.player_hand_id,
@@ -1011,70 +1088,38 @@ def record_hand_results(
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
 
-    hand = (
-        db.query(Hand)
-        .filter(Hand.game_id == game_id, Hand.hand_number == hand_number)
-        .first()
-    )
+    hand = load_hand(db, game_id, hand_number)
     if hand is None:
         raise HTTPException(status_code=404, detail='Hand not found')
 
+    by_name = {ph.player.name.lower(): ph for ph in hand.player_hands if ph.player}
     for entry in payload:
-        player = (
-            db.query(Player)
-            .filter(func.lower(Player.name) == entry.player_name.lower())
-            .first()
-        )
-        if player is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f'Player {entry.player_name!r} not found',
-            )
-        ph = (
-            db.query(PlayerHand)
-            .filter(
-                PlayerHand.hand_id == hand.hand_id,
-                PlayerHand.player_id == player.player_id,
-            )
-            .first()
-        )
+        ph = by_name.get(entry.player_name.lower())
         if ph is None:
+            # Only hit the players table to tell the two 404s apart
+            player = (
+                db.query(Player)
+                .filter(func.lower(Player.name) == entry.player_name.lower())
+                .first()
+            )
+            if player is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f'Player {entry.player_name!r} not found',
+                )
             raise HTTPException(
                 status_code=404,
                 detail=f'Player {entry.player_name!r} not found in this hand',
             )
         ph.result = entry.result
         ph.profit_loss = entry.profit_loss
+    refresh_game_stats(db, game_id, [ph.player_id for ph in hand.player_hands])
+    bump_versions(db, game_id, hand.hand_id)
 
     db.commit()
-    db.refresh(hand)
-
-    player_hand_responses: list[PlayerHandResponse] = []
+    hand = load_hand(db, game_id, hand_number)
+    updated = {entry.player_name.lower() for entry in payload}
     for ph in hand.player_hands:
-        player = db.query(Player).filter(Player.player_id == ph.player_id).first()
-        player_hand_responses.append(
-            PlayerHandResponse(
-                player_hand_id=ph.player_hand_id,
-                hand_id=ph.hand_id,
-                player_id=ph.player_id,
-                player_name=player.name if player else '',
-                card_1=ph.card_1,
-                card_2=ph.card_2,
-                result=ph.result,
-                profit_loss=ph.profit_loss,
-                outcome_street=ph.outcome_street,
-            )
-        )
-
-    return HandResponse(
-        hand_id=hand.hand_id,
-        game_id=hand.game_id,
-        hand_number=hand.hand_number,
-        flop_1=hand.flop_1,
-        flop_2=hand.flop_2,
-        flop_3=hand.flop_3,
-        turn=hand.turn,
-        river=hand.river,
-        created_at=hand.created_at,
-        player_hands=player_hand_responses,
-    )
+        if ph.player and ph.player.name.lower() in updated:
+            publish_player(hand, ph.player.name, ph)
+    return hand_response(hand)
@@ -4,9 +4,17 @@ import os
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from sqlalchemy import func
-from sqlalchemy.exc import IntegrityError
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.database.models import (
@@ -18,8 +26,14 @@ from app.database.models import (
     Player,
     PlayerHand,
 )
-from app.database.session import get_db
-from app.services.card_detector import CardDetector, MockCardDetector, YoloCardDetector
+from app.database.session import get_async_db, get_db
+from app.routes.events import publish_hand, publish_upload
+from app.services.card_detector import CardDetector, MockCardDetector
+from app.services.detection_queue import detection_queue
+from app.services.game_events import game_events
+from app.services.hand_cards import index_hand_cards
+from app.services.model_registry import RegisteredCardDetector
+from app.services.versions import bump_versions
 from pydantic_models.app_models import (
     ConfirmDetectionRequest,
     HandResponse,
@@ -34,6 +48,9 @@ corrections_router = APIRouter(prefix='/images', tags=['images'])
 ALLOWED_CONTENT_TYPES = {'image/jpeg', 'image/png'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Upper bound on ?wait= for detection results, as for hand status
+DETECTION_MAX_WAIT = 60
+
 JPEG_MAGIC = b'\xff\xd8\xff'
 PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
 
@@ -43,10 +60,15 @@ _WEIGHTS_PATH_FALLBACK = os.path.join(_MODELS_DIR, 'best.pt')
 
 
 def get_card_detector() -> CardDetector:
+    """The detector for the available weights; the model itself is shared.
+
+    Weights are loaded once per process by ``model_registry`` on first use,
+    and reloaded when the file on disk changes.
+    """
     if os.path.exists(_WEIGHTS_PATH):
-        return YoloCardDetector(_WEIGHTS_PATH)
+        return RegisteredCardDetector(_WEIGHTS_PATH)
     if os.path.exists(_WEIGHTS_PATH_FALLBACK):
-        return YoloCardDetector(_WEIGHTS_PATH_FALLBACK)
+        return RegisteredCardDetector(_WEIGHTS_PATH_FALLBACK)
     return MockCardDetector()
 
 
@@ -54,13 +76,30 @@ def _has_valid_image_magic(data: bytes) -> bool:
     return data[:3] == JPEG_MAGIC or data[:8] == PNG_MAGIC
 
 
+async def _detect_upload(
+    upload_id: int,
+    image_path: str,
+    bind: Engine | Connection,
+    detector: CardDetector,
+) -> None:
+    upload = await detection_queue.run(upload_id, image_path, bind, detector)
+    if upload is not None:
+        publish_upload(upload)
+
+
 @router.post('/{game_id}/hands/image', status_code=201)
 async def upload_image(
     game_id: int,
     file: UploadFile,
     db: Annotated[Session, Depends(get_db)],
+    background_tasks: BackgroundTasks,
+    detector: Annotated[CardDetector, Depends(get_card_detector)],
 ):
-    """Accept a JPEG/PNG image upload, store it, and create an ImageUpload record."""
+    """Accept a JPEG/PNG image upload, store it, and queue card detection.
+
+    The upload is returned with status ``processing``; detection runs after
+    the response is sent and moves it to ``detected`` or ``failed``.
+    """
     game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
     if game is None:
         raise HTTPException(status_code=404, detail='Game session not found')
@@ -131,6 +170,10 @@ async def upload_image(
         ) from None
 
     db.refresh(record)
+    publish_upload(record)
+    background_tasks.add_task(
+        _detect_upload, record.upload_id, record.file_path, db.get_bind(), detector
+    )
 
     return {
         'upload_id': record.upload_id,
@@ -141,61 +184,39 @@ async def upload_image(
 
 
 @router.get('/{game_id}/hands/image/{upload_id}')
-def get_detection_results(
+async def get_detection_results(
     game_id: int,
     upload_id: int,
-    db: Annotated[Session, Depends(get_db)],
-    detector: Annotated[CardDetector, Depends(get_card_detector)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    wait: Annotated[float, Query(ge=0, le=DETECTION_MAX_WAIT)] = 0,
 ):
-    """Return card detection results for an uploaded image."""
-    upload = (
-        db.query(ImageUpload)
-        .filter(ImageUpload.upload_id == upload_id, ImageUpload.game_id == game_id)
-        .first()
+    """Return card detection results for an uploaded image.
+
+    Detection is queued at upload, so the status stays ``processing`` with
+    no detections until it finishes. ``wait`` holds the request for up to
+    that many seconds while it is still processing.
+    """
+    query = select(ImageUpload).where(
+        ImageUpload.upload_id == upload_id, ImageUpload.game_id == game_id
     )
+    if wait > 0:
+
+        async def settled() -> bool:
+            status = await db.scalar(query.with_only_columns(ImageUpload.status))
+            await db.close()
+            return status != 'processing'
+
+        await game_events.wait_until(game_id, settled, wait)
+
+    upload = await db.scalar(query)
     if upload is None:
         raise HTTPException(status_code=404, detail='Upload not found')
 
-    # Run detection if not already done
-    if upload.status != 'detected':
-        if upload.status == 'failed':
-            return {
-                'upload_id': upload.upload_id,
-                'game_id': upload.game_id,
-                'status': upload.status,
-                'detections': [],
-            }
-        try:
-            results = detector.detect(upload.file_path)
-            for r in results:
-                detection = CardDetection(
-                    upload_id=upload_id,
-                    card_position=r['card_position'],
-                    detected_value=r['detected_value'],
-                    confidence=r['confidence'],
-                    bbox_x=r.get('bbox_x'),
-                    bbox_y=r.get('bbox_y'),
-                    bbox_width=r.get('bbox_width'),
-                    bbox_height=r.get('bbox_height'),
-                )
-                db.add(detection)
-            upload.status = 'detected'
-            db.commit()
-            db.refresh(upload)
-        except IntegrityError:
-            db.rollback()
-            db.refresh(upload)
-        except Exception:
-            db.rollback()
-            upload.status = 'failed'
-            db.commit()
-            raise HTTPException(
-                status_code=500, detail='Card detection failed'
-            ) from None
-
     detections = (
-        db.query(CardDetection).filter(CardDetection.upload_id == upload_id).all()
-    )
+        await db.scalars(
+            select(CardDetection).where(CardDetection.upload_id == upload_id)
+        )
+    ).all()
 
     return {
         'upload_id': upload.upload_id,
@@ -380,9 +401,13 @@ def confirm_detection(
                 )
             )
 
+    index_hand_cards(db, hand)
     upload.status = 'confirmed'
+    bump_versions(db, game_id)
     db.commit()
     db.refresh(hand)
+    publish_hand(game, hand)
+    publish_upload(upload)
 
     return HandResponse(
         hand_id=hand.hand_id,
@@ -1,25 +1,83 @@
 """Search router - handles search endpoints."""
 
+import base64
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import date as date_type
+from functools import partial
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Select, and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.models import GameSession, Hand, Player, PlayerHand
-from app.database.session import get_db
+from app.database.models import GameSession, Hand, HandCard, Player, PlayerHand
+from app.database.session import get_async_db
 from pydantic_models.app_models import (
     HandSearchResult,
     PaginatedHandSearchResponse,
     PlayerHandResponse,
 )
+from pydantic_models.card_codec import encode_card
 
 router = APIRouter(prefix='/hands', tags=['search'])
 
+# Totals for cursor paging are counted once per filter set and reused for
+# this long, so following a cursor never re-counts the whole result set.
+TOTAL_CACHE_TTL = 60.0
+TOTAL_CACHE_SIZE = 256
+_total_cache: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+
+
+def encode_cursor(game_date: date_type, hand_number: int, player_hand_id: int) -> str:
+    """Opaque cursor for the row after (game_date, hand_number, player_hand_id)."""
+    raw = json.dumps([game_date.isoformat(), hand_number, player_hand_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[date_type, int, int]:
+    """Inverse of ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        game_date, hand_number, player_hand_id = json.loads(raw)
+        return (
+            date_type.fromisoformat(game_date),
+            int(hand_number),
+            int(player_hand_id),
+        )
+    except (ValueError, TypeError) as exc:
+        raise ValueError('Invalid cursor') from exc
+
+
+async def _count(db: AsyncSession, query: Select) -> int:
+    return await db.scalar(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+
+
+async def _cached_total(key: tuple, count: Callable[[], Awaitable[int]]) -> int:
+    """``await count()`` for ``key``, reusing a result younger than the TTL."""
+    now = time.monotonic()
+    hit = _total_cache.get(key)
+    if hit is not None and now - hit[0] < TOTAL_CACHE_TTL:
+        _total_cache.move_to_end(key)
+        return hit[1]
+    total = await count()
+    _total_cache[key] = (now, total)
+    _total_cache.move_to_end(key)
+    while len(_total_cache) > TOTAL_CACHE_SIZE:
+        _total_cache.popitem(last=False)
+    return total
+
 
 @router.get('', response_model=PaginatedHandSearchResponse)
-def search_hands(
+async def search_hands(
     player: Annotated[str | None, Query(description='Player name to filter by')] = None,
     date_from: Annotated[
         date_type | None,
@@ -38,47 +96,100 @@ def search_hands(
     ] = None,
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=200)] = 50,
-    db: Annotated[Session, Depends(get_db)] = None,
+    cursor: Annotated[
+        str | None,
+        Query(
+            description='next_cursor from the previous page; pass an empty '
+            'value to start cursor paging. Overrides page.'
+        ),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description='Report a (cached) total in cursor mode')
+    ] = True,
+    db: Annotated[AsyncSession, Depends(get_async_db)] = None,
 ):
+    """Search hands, one row per player hand, oldest first.
+
+    ``page`` uses offset paging with an exact total. ``cursor`` uses keyset
+    paging on (game_date, hand_number, player_hand_id): every page costs the
+    same however deep it is, and ``total`` is counted once per filter set
+    and cached for ``TOTAL_CACHE_TTL`` seconds.
+    """
     query = (
-        db.query(Hand, PlayerHand, Player, GameSession)
+        select(Hand, PlayerHand, Player, GameSession)
         .join(PlayerHand, PlayerHand.hand_id == Hand.hand_id)
         .join(Player, Player.player_id == PlayerHand.player_id)
         .join(GameSession, GameSession.game_id == Hand.game_id)
     )
 
     if player is not None:
-        query = query.filter(func.lower(Player.name) == player.lower())
+        query = query.where(func.lower(Player.name) == player.lower())
 
     if date_from is not None:
-        query = query.filter(GameSession.game_date >= date_from)
+        query = query.where(GameSession.game_date >= date_from)
 
     if date_to is not None:
-        query = query.filter(GameSession.game_date <= date_to)
+        query = query.where(GameSession.game_date <= date_to)
 
     if card is not None:
-        community_match = or_(
-            Hand.flop_1 == card,
-            Hand.flop_2 == card,
-            Hand.flop_3 == card,
-            Hand.turn == card,
-            Hand.river == card,
-        )
-        hole_match = or_(
-            PlayerHand.card_1 == card,
-            PlayerHand.card_2 == card,
-        )
+        try:
+            card_code = encode_card(card)
+        except ValueError:
+            card_code = None
+        # A card is dealt at most once per hand, so this join adds no rows
+        on_board = HandCard.player_hand_id.is_(None)
+        in_hole = HandCard.player_hand_id == PlayerHand.player_hand_id
         if location == 'community':
-            query = query.filter(community_match)
+            where = on_board
         elif location == 'hole':
-            query = query.filter(hole_match)
+            where = in_hole
         else:
-            query = query.filter(or_(community_match, hole_match))
+            where = or_(on_board, in_hole)
+        query = query.join(
+            HandCard,
+            and_(
+                HandCard.hand_id == Hand.hand_id,
+                HandCard.card_code == card_code,
+                where,
+            ),
+        )
 
-    query = query.order_by(GameSession.game_date, Hand.hand_number)
+    # Unique per row, so it is both the sort order and the keyset cursor
+    keys = (GameSession.game_date, Hand.hand_number, PlayerHand.player_hand_id)
+    query = query.order_by(*keys)
 
-    total = query.count()
-    rows = query.offset((page - 1) * per_page).limit(per_page).all()
+    next_cursor = None
+    if cursor is None:
+        total = await _count(db, query)
+        rows = (
+            await db.execute(query.offset((page - 1) * per_page).limit(per_page))
+        ).all()
+    else:
+        if include_total:
+            key = (player and player.lower(), date_from, date_to, card, location)
+            total = await _cached_total(key, partial(_count, db, query))
+        else:
+            total = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            query = query.where(
+                tuple_(*keys)
+                > tuple_(
+                    *(literal(v, k.type) for k, v in zip(keys, after, strict=True))
+                )
+            )
+        # One extra row tells whether another page follows
+        rows = (await db.execute(query.limit(per_page + 1))).all()
+        if len(rows) > per_page:
+            rows = rows[:per_page]
+            hand, ph, _player, game = rows[-1]
+            next_cursor = encode_cursor(
+                game.game_date, hand.hand_number, ph.player_hand_id
+            )
+        page = None
 
     results: list[HandSearchResult] = []
     for hand, ph, player_obj, game in rows:
@@ -113,4 +224,5 @@ def search_hands(
         page=page,
         per_page=per_page,
         results=results,
+        next_cursor=next_cursor,
     )
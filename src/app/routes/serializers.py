@@ -0,0 +1,86 @@
+"""Build response models from hand ORM objects.
+
+These read ``PlayerHand.player`` for names, so pass hands loaded through
+``app.database.queries`` to keep serialization free of per-row queries.
+"""
+
+from collections.abc import Iterable
+
+from app.database.models import Hand, Player, PlayerHand
+from pydantic_models.app_models import (
+    HandResponse,
+    HandStatusResponse,
+    PlayerHandResponse,
+    PlayerStatusEntry,
+)
+
+
+def player_hand_response(ph: PlayerHand) -> PlayerHandResponse:
+    """Build a PlayerHandResponse from a PlayerHand ORM object."""
+    return PlayerHandResponse(
+        player_hand_id=ph.player_hand_id,
+        hand_id=ph.hand_id,
+        player_id=ph.player_id,
+        player_name=ph.player.name if ph.player else '',
+        card_1=ph.card_1,
+        card_2=ph.card_2,
+        result=ph.result,
+        profit_loss=ph.profit_loss,
+        outcome_street=ph.outcome_street,
+    )
+
+
+def hand_response(hand: Hand) -> HandResponse:
+    """Build a HandResponse from a Hand ORM object."""
+    return HandResponse(
+        hand_id=hand.hand_id,
+        game_id=hand.game_id,
+        hand_number=hand.hand_number,
+        flop_1=hand.flop_1,
+        flop_2=hand.flop_2,
+        flop_3=hand.flop_3,
+        turn=hand.turn,
+        river=hand.river,
+        source_upload_id=hand.source_upload_id,
+        created_at=hand.created_at,
+        player_hands=[player_hand_response(ph) for ph in hand.player_hands],
+    )
+
+
+def participation_status(player_hand: PlayerHand | None) -> str:
+    """Derive participation status from a PlayerHand row (or None)."""
+    if player_hand is None:
+        return 'idle'
+    if player_hand.result is not None:
+        return player_hand.result
+    if player_hand.card_1 is not None:
+        return 'joined'
+    return 'pending'
+
+
+def player_status_entry(name: str, ph: PlayerHand | None) -> PlayerStatusEntry:
+    """A player's status in a hand; ``ph`` is None if they are not in it."""
+    return PlayerStatusEntry(
+        name=name,
+        participation_status=participation_status(ph),
+        card_1=ph.card_1 if ph else None,
+        card_2=ph.card_2 if ph else None,
+        result=ph.result if ph else None,
+        outcome_street=ph.outcome_street if ph else None,
+    )
+
+
+def hand_status_response(players: Iterable[Player], hand: Hand) -> HandStatusResponse:
+    """Status of every game player in ``hand``, idle if not dealt in."""
+    ph_by_player_id = {ph.player_id: ph for ph in hand.player_hands}
+    return HandStatusResponse(
+        hand_number=hand.hand_number,
+        version=hand.version,
+        community_recorded=any(
+            c is not None for c in [hand.flop_1, hand.turn, hand.river]
+        ),
+        players=[
+            player_status_entry(player.name, ph_by_player_id.get(player.player_id))
+            for player in players
+        ],
+    )
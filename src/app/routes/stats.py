@@ -3,11 +3,13 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import case, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.database.models import GameSession, Hand, Player, PlayerHand
-from app.database.session import get_db
+from app.database.models import GameSession, Hand, Player, PlayerStatsAgg
+from app.database.session import get_async_db
+from app.services.player_stats import OVERALL_GAME_ID, player_stats_row_async
 from pydantic_models.app_models import (
     GameStatsPlayerEntry,
     GameStatsResponse,
@@ -20,32 +22,18 @@ router = APIRouter(prefix='/stats', tags=['stats'])
 
 
 @router.get('/players/{player_name}', response_model=PlayerStatsResponse)
-def get_player_stats(
+async def get_player_stats(
     player_name: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
-    player = (
-        db.query(Player)
-        .filter(func.lower(Player.name) == func.lower(player_name))
-        .first()
+    player = await db.scalar(
+        select(Player).where(func.lower(Player.name) == func.lower(player_name))
     )
     if player is None:
         raise HTTPException(status_code=404, detail='Player not found')
 
-    player_hands = (
-        db.query(PlayerHand)
-        .options(joinedload(PlayerHand.hand))
-        .filter(
-            PlayerHand.player_id == player.player_id,
-            PlayerHand.result.isnot(None),
-            PlayerHand.result != 'handed_back',
-        )
-        .all()
-    )
-
-    total = len(player_hands)
-
-    if total == 0:
+    agg = await player_stats_row_async(db, player.player_id)
+    if agg is None or agg.hands_played == 0:
         return PlayerStatsResponse(
             player_name=player.name,
             total_hands_played=0,
@@ -61,55 +49,42 @@ def get_player_stats(
             river_pct=0.0,
         )
 
-    hands_won = sum(1 for ph in player_hands if ph.result == 'won')
-    hands_lost = sum(1 for ph in player_hands if ph.result == 'lost')
-    hands_folded = sum(1 for ph in player_hands if ph.result == 'folded')
-    win_rate = round(hands_won / total * 100, 2)
-
-    total_pl = sum(ph.profit_loss or 0.0 for ph in player_hands)
-    avg_pl_per_hand = round(total_pl / total, 2)
-
-    session_pl: dict[int, float] = {}
-    for ph in player_hands:
-        gid = ph.hand.game_id
-        session_pl[gid] = session_pl.get(gid, 0.0) + (ph.profit_loss or 0.0)
-    avg_pl_per_session = round(sum(session_pl.values()) / len(session_pl), 2)
-
-    hands_with_turn = sum(1 for ph in player_hands if ph.hand.turn is not None)
-    hands_with_river = sum(1 for ph in player_hands if ph.hand.river is not None)
-
+    total = agg.hands_played
     return PlayerStatsResponse(
         player_name=player.name,
         total_hands_played=total,
-        hands_won=hands_won,
-        hands_lost=hands_lost,
-        hands_folded=hands_folded,
-        win_rate=win_rate,
-        total_profit_loss=round(total_pl, 2),
-        avg_profit_loss_per_hand=avg_pl_per_hand,
-        avg_profit_loss_per_session=avg_pl_per_session,
+        hands_won=agg.hands_won,
+        hands_lost=agg.hands_lost,
+        hands_folded=agg.hands_folded,
+        win_rate=round(agg.hands_won / total * 100, 2),
+        total_profit_loss=round(agg.total_profit_loss, 2),
+        avg_profit_loss_per_hand=round(agg.total_profit_loss / total, 2),
+        avg_profit_loss_per_session=round(
+            agg.total_profit_loss / agg.sessions_played, 2
+        ),
         flop_pct=100.0,
-        turn_pct=round(hands_with_turn / total * 100, 2),
-        river_pct=round(hands_with_river / total * 100, 2),
+        turn_pct=round(agg.turn_reached / total * 100, 2),
+        river_pct=round(agg.river_reached / total * 100, 2),
     )
 
 
 @router.get('/leaderboard', response_model=list[LeaderboardEntry])
-def get_leaderboard(
-    db: Annotated[Session, Depends(get_db)],
+async def get_leaderboard(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     metric: LeaderboardMetric = LeaderboardMetric.total_profit_loss,
 ):
-    rows = (
-        db.query(
+    rows = await db.execute(
+        select(
             Player.name,
-            func.count(PlayerHand.player_hand_id).label('hands_played'),
-            func.coalesce(func.sum(PlayerHand.profit_loss), 0.0).label('total_pl'),
-            func.sum(case((PlayerHand.result == 'won', 1), else_=0)).label('wins'),
+            PlayerStatsAgg.hands_played,
+            PlayerStatsAgg.total_profit_loss.label('total_pl'),
+            PlayerStatsAgg.hands_won.label('wins'),
+        )
+        .join(PlayerStatsAgg, Player.player_id == PlayerStatsAgg.player_id)
+        .where(
+            PlayerStatsAgg.game_id == OVERALL_GAME_ID,
+            PlayerStatsAgg.hands_played > 0,
         )
-        .join(PlayerHand, Player.player_id == PlayerHand.player_id)
-        .filter(PlayerHand.result.isnot(None), PlayerHand.result != 'handed_back')
-        .group_by(Player.player_id, Player.name)
-        .all()
     )
 
     entries = []
@@ -141,52 +116,37 @@ def get_leaderboard(
 
 
 @router.get('/games/{game_id}', response_model=GameStatsResponse)
-def get_game_stats(
+async def get_game_stats(
     game_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
-    game = db.query(GameSession).filter(GameSession.game_id == game_id).first()
+    game = await db.get(
+        GameSession, game_id, options=[selectinload(GameSession.players)]
+    )
     if game is None:
         raise HTTPException(status_code=404, detail='Game not found')
 
-    total_hands = (
-        db.query(func.count(Hand.hand_id)).filter(Hand.game_id == game_id).scalar()
+    total_hands = await db.scalar(
+        select(func.count(Hand.hand_id)).where(Hand.game_id == game_id)
     )
 
-    player_hands = (
-        db.query(PlayerHand)
-        .join(Hand, PlayerHand.hand_id == Hand.hand_id)
-        .join(Player, PlayerHand.player_id == Player.player_id)
-        .filter(
-            Hand.game_id == game_id,
-            PlayerHand.result.isnot(None),
-            PlayerHand.result != 'handed_back',
-        )
-        .all()
+    rows = await db.execute(
+        select(PlayerStatsAgg, Player.name)
+        .join(Player, PlayerStatsAgg.player_id == Player.player_id)
+        .where(PlayerStatsAgg.game_id == game_id)
     )
 
-    # Aggregate per-player
-    stats: dict[int, dict] = {}
-    for ph in player_hands:
-        pid = ph.player_id
-        if pid not in stats:
-            stats[pid] = {
-                'player_name': ph.player.name,
-                'hands_played': 0,
-                'hands_won': 0,
-                'hands_lost': 0,
-                'hands_folded': 0,
-                'profit_loss': 0.0,
-            }
-        s = stats[pid]
-        s['hands_played'] += 1
-        if ph.result == 'won':
-            s['hands_won'] += 1
-        elif ph.result == 'lost':
-            s['hands_lost'] += 1
-        elif ph.result == 'folded':
-            s['hands_folded'] += 1
-        s['profit_loss'] += ph.profit_loss or 0.0
+    stats: dict[int, dict] = {
+        agg.player_id: {
+            'player_name': name,
+            'hands_played': agg.hands_played,
+            'hands_won': agg.hands_won,
+            'hands_lost': agg.hands_lost,
+            'hands_folded': agg.hands_folded,
+            'profit_loss': agg.total_profit_loss,
+        }
+        for agg, name in rows
+    }
 
     # Include players registered in the session but with no results
     for player in game.players:
@@ -1,20 +1,24 @@
 """Upload router - handles file upload endpoints."""
 
-from datetime import datetime
+import json
+from collections.abc import Iterator
+from itertools import chain
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from sqlalchemy import func
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database.models import GamePlayer, GameSession, Hand, Player, PlayerHand
 from app.database.session import get_db
+from app.services.csv_import import IMPORT_BATCH_HANDS, CSVImporter
 from pydantic_models.app_models import CSVCommitSummary
 from pydantic_models.csv_schema import (
     CSV_COLUMNS,
     CSV_COLUMN_FORMATS,
-    parse_csv,
-    validate_csv_rows,
+    HandKey,
+    iter_hand_groups,
+    iter_text_lines,
+    validate_hand_groups,
 )
 
 router = APIRouter(prefix='/upload', tags=['upload'])
@@ -28,152 +32,107 @@ def get_csv_schema():
     }
 
 
-@router.post('/csv')
-async def upload_csv(file: UploadFile):
-    """Accept a CSV file upload, validate it, and return a validation report."""
-    content = await file.read()
-    csv_text = content.decode('utf-8')
+def _hand_groups(file: UploadFile) -> Iterator[tuple[HandKey, list[dict[str, str]]]]:
+    """Stream the upload as hand groups, checking the header up front.
 
+    The first group is read eagerly so a bad header or encoding is a 400
+    before any response is started.
+    """
+    groups = iter_hand_groups(iter_text_lines(file.file))
     try:
-        grouped = parse_csv(csv_text)
+        first = next(groups, None)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return chain([first], groups) if first is not None else iter(())
 
-    total_rows = sum(len(rows) for rows in grouped.values())
-    errors = validate_csv_rows(grouped)
 
-    return {
-        'valid': len(errors) == 0,
-        'total_rows': total_rows,
-        'error_count': len(errors),
-        'errors': errors,
-    }
+def _validation_report(
+    groups: Iterator[tuple[HandKey, list[dict[str, str]]]],
+) -> Iterator[str]:
+    """The validation report as JSON text, written one hand at a time.
+
+    ``errors`` comes first so each hand's errors go out as soon as it has
+    been checked; the totals close the object once the file is read.
+    """
+    total_rows = 0
+    error_count = 0
+    yield '{"errors": ['
+    try:
+        for _, rows, errors in validate_hand_groups(groups):
+            total_rows += len(rows)
+            for error in errors:
+                yield (', ' if error_count else '') + json.dumps(error)
+                error_count += 1
+    except UnicodeDecodeError as exc:
+        error = {
+            'row': total_rows + 2,
+            'field': 'file',
+            'value': '',
+            'message': f'File is not valid UTF-8: {exc.reason}',
+        }
+        yield (', ' if error_count else '') + json.dumps(error)
+        error_count += 1
+    yield (
+        f'], "valid": {json.dumps(error_count == 0)}, '
+        f'"total_rows": {total_rows}, "error_count": {error_count}}}'
+    )
+
+
+@router.post('/csv')
+def upload_csv(file: UploadFile):
+    """Accept a CSV file upload, validate it, and return a validation report.
+
+    The upload is decoded in chunks and validated hand by hand, so memory
+    stays flat and the report starts streaming before the file is read.
+    """
+    return StreamingResponse(
+        _validation_report(_hand_groups(file)), media_type='application/json'
+    )
 
 
 @router.post('/csv/commit', status_code=201, response_model=CSVCommitSummary)
-async def commit_csv(
+def commit_csv(
     file: UploadFile,
     db: Annotated[Session, Depends(get_db)],
 ):
-    """Parse, validate, and bulk-commit CSV data in a single transaction."""
-    content = await file.read()
-    csv_text = content.decode('utf-8')
+    """Parse, validate, and bulk-commit CSV data in a single transaction.
+
+    Hands are imported in batches as they pass validation. After the first
+    error nothing more is imported, but validation carries on so the 400
+    lists every problem, and the transaction is rolled back.
+    """
+    groups = _hand_groups(file)
+    importer = CSVImporter(db)
+    batch: list[tuple[HandKey, list[dict[str, str]]]] = []
+    errors: list[dict] = []
 
     try:
-        grouped = parse_csv(csv_text)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        for key, rows, group_errors in validate_hand_groups(groups):
+            errors += group_errors
+            if errors:
+                continue
+            batch.append((key, rows))
+            if len(batch) >= IMPORT_BATCH_HANDS:
+                importer.add(batch)
+                batch = []
+        if not errors:
+            importer.add(batch)
+            summary = importer.finish()
+            db.commit()
+    except UnicodeDecodeError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=400, detail=f'File is not valid UTF-8: {exc.reason}'
+        ) from exc
+    except Exception as exc:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f'Commit failed: {exc}') from exc
 
-    errors = validate_csv_rows(grouped)
     if errors:
+        db.rollback()
         raise HTTPException(
             status_code=400,
             detail={'valid': False, 'error_count': len(errors), 'errors': errors},
         )
 
-    games_created = 0
-    hands_created = 0
-    players_created = 0
-    players_matched = 0
-
-    # Track within-commit state to avoid duplicate DB hits
-    session_by_date: dict[str, GameSession] = {}
-    player_by_name: dict[str, Player] = {}
-
-    try:
-        for (game_date_str, hand_number_str), rows in grouped.items():
-            # --- Game Session ---
-            if game_date_str not in session_by_date:
-                game_date = datetime.strptime(game_date_str, '%m-%d-%Y').date()
-                game_session = GameSession(game_date=game_date, status='active')
-                db.add(game_session)
-                db.flush()
-                games_created += 1
-                session_by_date[game_date_str] = game_session
-
-            game_session = session_by_date[game_date_str]
-            hand_number = int(hand_number_str)
-
-            # --- Hand (community cards from first row) ---
-            first_row = rows[0]
-            flop_1_val = first_row['flop_1'].strip() or None
-            flop_2_val = first_row['flop_2'].strip() or None
-            flop_3_val = first_row['flop_3'].strip() or None
-            turn_val = first_row['turn'].strip() or None
-            river_val = first_row['river'].strip() or None
-            hand = Hand(
-                game_id=game_session.game_id,
-                hand_number=hand_number,
-                flop_1=flop_1_val,
-                flop_2=flop_2_val,
-                flop_3=flop_3_val,
-                turn=turn_val,
-                river=river_val,
-            )
-            db.add(hand)
-            db.flush()
-            hands_created += 1
-
-            # --- Players and PlayerHands ---
-            for row in rows:
-                player_name = row['player_name'].strip()
-                name_key = player_name.lower()
-
-                if name_key not in player_by_name:
-                    existing = (
-                        db.query(Player)
-                        .filter(func.lower(Player.name) == name_key)
-                        .first()
-                    )
-                    if existing is None:
-                        player = Player(name=player_name)
-                        db.add(player)
-                        db.flush()
-                        players_created += 1
-                    else:
-                        player = existing
-                        players_matched += 1
-                    player_by_name[name_key] = player
-
-                player = player_by_name[name_key]
-
-                # Link player to game session if not already linked
-                already_linked = (
-                    db.query(GamePlayer)
-                    .filter(
-                        GamePlayer.game_id == game_session.game_id,
-                        GamePlayer.player_id == player.player_id,
-                    )
-                    .first()
-                )
-                if already_linked is None:
-                    db.add(
-                        GamePlayer(
-                            game_id=game_session.game_id,
-                            player_id=player.player_id,
-                        )
-                    )
-
-                pl_str = row['profit_loss'].strip()
-                db.add(
-                    PlayerHand(
-                        hand_id=hand.hand_id,
-                        player_id=player.player_id,
-                        card_1=row['hole_card_1'].strip(),
-                        card_2=row['hole_card_2'].strip(),
-                        result=row['result'].strip() or None,
-                        profit_loss=float(pl_str) if pl_str else None,
-                    )
-                )
-
-        db.commit()
-    except Exception as exc:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f'Commit failed: {exc}') from exc
-
-    return CSVCommitSummary(
-        games_created=games_created,
-        hands_created=hands_created,
-        players_created=players_created,
-        players_matched=players_matched,
-    )
+    return CSVCommitSummary(**summary._asdict())
@@ -73,6 +73,14 @@ class YoloCardDetector:
         self._confidence_threshold = confidence_threshold
         self._scales = scales or self._DEFAULT_SCALES
 
+    def warmup(self) -> None:
+        """Run one blank inference per scale so the first detection is not slow."""
+        import numpy as np
+
+        for scale in self._scales:
+            blank = np.zeros((scale, scale, 3), dtype=np.uint8)
+            self._model(blank, imgsz=scale, verbose=False)
+
     def detect(self, image_path: str) -> list[dict]:
         if not os.path.exists(image_path):
             raise FileNotFoundError(f'Image not found: {image_path}')
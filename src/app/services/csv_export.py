@@ -0,0 +1,84 @@
+"""Stream hand history out as CSV in the upload schema.
+
+Rows come from a single flat query over hands, player hands and players,
+read from the database cursor in batches of ``EXPORT_BATCH_ROWS`` and
+written out as they arrive, so exporting a season holds one batch in
+memory at a time and the first bytes are sent straight away.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterator
+from datetime import date
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.database.models import GameSession, Hand, Player, PlayerHand
+from pydantic_models.csv_schema import CSV_COLUMNS
+
+# Rows fetched per cursor batch and written per response chunk
+EXPORT_BATCH_ROWS = 1000
+
+
+def export_rows_query(
+    game_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> Select:
+    """One row per player hand, in ``CSV_COLUMNS`` order, oldest game first."""
+    query = (
+        select(
+            GameSession.game_date,
+            Hand.hand_number,
+            Player.name,
+            PlayerHand.card_1,
+            PlayerHand.card_2,
+            Hand.flop_1,
+            Hand.flop_2,
+            Hand.flop_3,
+            Hand.turn,
+            Hand.river,
+            PlayerHand.result,
+            PlayerHand.profit_loss,
+        )
+        .join(Hand, Hand.game_id == GameSession.game_id)
+        .join(PlayerHand, PlayerHand.hand_id == Hand.hand_id)
+        .join(Player, Player.player_id == PlayerHand.player_id)
+        .order_by(
+            GameSession.game_date,
+            GameSession.game_id,
+            Hand.hand_number,
+            PlayerHand.player_hand_id,
+        )
+    )
+    if game_id is not None:
+        query = query.where(GameSession.game_id == game_id)
+    if date_from is not None:
+        query = query.where(GameSession.game_date >= date_from)
+    if date_to is not None:
+        query = query.where(GameSession.game_date <= date_to)
+    return query
+
+
+def iter_csv(db: Session, query: Select) -> Iterator[str]:
+    """Yield the header, then the rows of ``query`` a batch at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_ROWS))
+    for rows in result.partitions():
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            (
+                game_date.strftime('%m-%d-%Y') if game_date else '',
+                *(value if value is not None else '' for value in rest),
+            )
+            for game_date, *rest in rows
+        )
+        yield buffer.getvalue()
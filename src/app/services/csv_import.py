@@ -0,0 +1,231 @@
+"""Bulk import of validated CSV hand history.
+
+Each batch is written with a fixed number of statements regardless of its
+size: existing players are resolved with one ``IN`` query per batch, and
+players, games, hands, game players and player hands each go in as batched
+``insert()`` statements. ``RETURNING`` hands back each new id with the row's
+natural key (name, date, game and hand number, hand and player), which
+maps ids to rows without asking SQLite for row-by-row ordered inserts.
+The new games' stats rows come from one grouped aggregate. The caller owns
+the transaction, so an import is all-or-nothing. ``CSVImporter`` takes the
+rows in batches so a streamed upload never has to be held whole.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import NamedTuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.database.models import (
+    GamePlayer,
+    GameSession,
+    Hand,
+    HandCard,
+    Player,
+    PlayerHand,
+)
+from app.services.hand_cards import BOARD_LOCATIONS
+from app.services.player_stats import add_new_game_stats
+from pydantic_models.card_codec import encode_card
+from pydantic_models.csv_schema import HandKey
+
+# Bound parameters per IN query; well under SQLite's variable limit
+LOOKUP_BATCH_SIZE = 500
+
+# Hands buffered from a streamed upload before each CSVImporter.add()
+IMPORT_BATCH_HANDS = 500
+
+
+class ImportSummary(NamedTuple):
+    games_created: int
+    hands_created: int
+    players_created: int
+    players_matched: int
+
+
+def _resolve_players(db: Session, names: dict[str, str]) -> tuple[dict[str, int], int]:
+    """Map lowercased names to player ids, creating any that are missing.
+
+    Args:
+        names: Lowercased name -> spelling to use if the player is new.
+
+    Returns:
+        The id map and the number of players created.
+    """
+    ids: dict[str, int] = {}
+    keys = list(names)
+    for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+        batch = keys[start : start + LOOKUP_BATCH_SIZE]
+        rows = db.execute(
+            select(func.lower(Player.name), Player.player_id).where(
+                func.lower(Player.name).in_(batch)
+            )
+        )
+        ids.update(rows.all())
+
+    missing = [key for key in keys if key not in ids]
+    if missing:
+        spelled = {names[key]: key for key in missing}
+        created = db.execute(
+            insert(Player).returning(Player.name, Player.player_id),
+            [{'name': name} for name in spelled],
+        )
+        ids.update((spelled[name], player_id) for name, player_id in created)
+    return ids, len(missing)
+
+
+def _card(value: str) -> str | None:
+    return value.strip() or None
+
+
+class CSVImporter:
+    """Insert validated hand groups batch by batch inside one transaction.
+
+    Players and games resolved by earlier batches are remembered, so a date
+    spread over several batches still gets a single game. Stats rows are
+    written once by ``finish`` after the last batch.
+
+    Args:
+        db: Session to write through; not committed here.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.player_ids: dict[str, int] = {}
+        self.game_ids: dict[date, int] = {}
+        self.game_players: set[tuple[int, int]] = set()
+        self.hands_created = 0
+        self.players_created = 0
+
+    def add(self, groups: Iterable[tuple[HandKey, list[dict[str, str]]]]) -> None:
+        """Insert one batch: a hand per group, new games for unseen dates."""
+        groups = list(groups)
+        if not groups:
+            return
+
+        names: dict[str, str] = {}
+        for _, rows in groups:
+            for row in rows:
+                name = row['player_name'].strip()
+                if name.lower() not in self.player_ids:
+                    names.setdefault(name.lower(), name)
+        if names:
+            player_ids, created = _resolve_players(self.db, names)
+            self.player_ids.update(player_ids)
+            self.players_created += created
+        # Core executes on the connection skip the ORM bulk-insert bookkeeping
+        conn = self.db.connection()
+
+        dates = {d: datetime.strptime(d, '%m-%d-%Y').date() for (d, _), _ in groups}
+        new_dates = set(dates.values()) - self.game_ids.keys()
+        if new_dates:
+            created = conn.execute(
+                insert(GameSession).returning(
+                    GameSession.game_date, GameSession.game_id
+                ),
+                [{'game_date': d, 'status': 'active'} for d in new_dates],
+            )
+            self.game_ids.update(created.all())
+
+        hand_values = []
+        for (game_date, hand_number), rows in groups:
+            # Community cards come from the first row of the group
+            first = rows[0]
+            hand_values.append(
+                {
+                    'game_id': self.game_ids[dates[game_date]],
+                    'hand_number': int(hand_number),
+                    **{column: _card(first[column]) for column, _ in BOARD_LOCATIONS},
+                }
+            )
+        created = conn.execute(
+            insert(Hand).returning(Hand.game_id, Hand.hand_number, Hand.hand_id),
+            hand_values,
+        )
+        hand_ids = {(game_id, number): hand_id for game_id, number, hand_id in created}
+        self.hands_created += len(hand_values)
+
+        game_players = []
+        player_hand_values = []
+        card_rows = []
+        for hand, (_, rows) in zip(hand_values, groups, strict=True):
+            hand_id = hand_ids[(hand['game_id'], hand['hand_number'])]
+            card_rows += [
+                {
+                    'hand_id': hand_id,
+                    'player_hand_id': None,
+                    'card_code': encode_card(hand[column]),
+                    'location': location,
+                }
+                for column, location in BOARD_LOCATIONS
+                if hand[column] is not None
+            ]
+            for row in rows:
+                player_id = self.player_ids[row['player_name'].strip().lower()]
+                if (hand['game_id'], player_id) not in self.game_players:
+                    self.game_players.add((hand['game_id'], player_id))
+                    game_players.append(
+                        {'game_id': hand['game_id'], 'player_id': player_id}
+                    )
+                pl_str = row['profit_loss'].strip()
+                player_hand_values.append(
+                    {
+                        'hand_id': hand_id,
+                        'player_id': player_id,
+                        'card_1': row['hole_card_1'].strip(),
+                        'card_2': row['hole_card_2'].strip(),
+                        'result': row['result'].strip() or None,
+                        'profit_loss': float(pl_str) if pl_str else None,
+                    }
+                )
+
+        if game_players:
+            conn.execute(insert(GamePlayer), game_players)
+        created = conn.execute(
+            insert(PlayerHand).returning(
+                PlayerHand.hand_id, PlayerHand.player_id, PlayerHand.player_hand_id
+            ),
+            player_hand_values,
+        )
+        player_hand_ids = {(h, p): ph_id for h, p, ph_id in created}
+        for ph in player_hand_values:
+            ph_id = player_hand_ids[(ph['hand_id'], ph['player_id'])]
+            card_rows += [
+                {
+                    'hand_id': ph['hand_id'],
+                    'player_hand_id': ph_id,
+                    'card_code': encode_card(card),
+                    'location': 'hole',
+                }
+                for card in (ph['card_1'], ph['card_2'])
+            ]
+        if card_rows:
+            conn.execute(insert(HandCard), card_rows)
+
+    def finish(self) -> ImportSummary:
+        """Write the new games' stats rows and report what was imported."""
+        add_new_game_stats(self.db, self.game_ids.values())
+        return ImportSummary(
+            games_created=len(self.game_ids),
+            hands_created=self.hands_created,
+            players_created=self.players_created,
+            players_matched=len(self.player_ids) - self.players_created,
+        )
+
+
+def import_csv_hands(
+    db: Session, grouped: dict[HandKey, list[dict[str, str]]]
+) -> ImportSummary:
+    """Insert validated CSV rows: one new game per date, one hand per group.
+
+    Args:
+        db: Session to write through; not committed here.
+        grouped: Output of ``parse_csv`` that passed ``validate_csv_rows``.
+    """
+    importer = CSVImporter(db)
+    importer.add(grouped.items())
+    return importer.finish()
@@ -0,0 +1,200 @@
+"""Background card detection for uploaded images.
+
+Uploads are stored with status ``processing`` and a detection job is
+queued for them; the job moves the upload to ``detected`` (with its
+``card_detections`` rows) or ``failed``. The upload rows double as the
+durable queue: ``resume`` re-queues anything still ``processing`` after a
+restart.
+
+Inference runs on a pool of worker processes that each load their
+detector once, in the pool's initializer. When the pool has not been
+started (tests, scripts, ``DETECTION_WORKERS=0``) the detector passed with
+the job runs on a thread instead, so the event loop stays free either way.
+
+Each upload is detected at most once per process, and its result is
+committed only while the upload is still ``processing``, so concurrent or
+repeated jobs can never store detections twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.database.models import CardDetection, ImageUpload
+from app.services.card_detector import CardDetector
+
+# Detector of the current worker process, built by _init_worker
+_worker_detector: CardDetector | None = None
+
+
+def _init_worker(detector_factory: Callable[[], CardDetector]) -> None:
+    global _worker_detector
+    _worker_detector = detector_factory()
+    # Load the model now rather than on the worker's first job
+    warmup = getattr(_worker_detector, 'warmup', None)
+    if warmup is not None:
+        warmup()
+
+
+def _detect_in_worker(image_path: str) -> list[dict]:
+    return _worker_detector.detect(image_path)
+
+
+def _ping() -> bool:
+    return _worker_detector is not None
+
+
+def store_detection(
+    bind: Engine | Connection, upload_id: int, results: list[dict] | None
+) -> ImageUpload | None:
+    """Record a finished job: its detections, or ``failed`` if ``results`` is None.
+
+    Returns the updated upload, or None if it had already left
+    ``processing`` (another job finished first, or it was confirmed).
+    """
+    with Session(bind=bind, expire_on_commit=False) as db:
+        claimed = db.execute(
+            update(ImageUpload)
+            .where(
+                ImageUpload.upload_id == upload_id,
+                ImageUpload.status == 'processing',
+            )
+            .values(status='detected' if results is not None else 'failed')
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount == 0:
+            db.rollback()
+            return None
+        for r in results or []:
+            db.add(
+                CardDetection(
+                    upload_id=upload_id,
+                    card_position=r['card_position'],
+                    detected_value=r['detected_value'],
+                    confidence=r['confidence'],
+                    bbox_x=r.get('bbox_x'),
+                    bbox_y=r.get('bbox_y'),
+                    bbox_width=r.get('bbox_width'),
+                    bbox_height=r.get('bbox_height'),
+                )
+            )
+        db.commit()
+        return db.get(ImageUpload, upload_id)
+
+
+class DetectionQueue:
+    """Runs detection jobs on worker processes, or a thread if stopped."""
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._inflight: set[int] = set()
+        # Jobs started by resume, kept so they are not garbage collected
+        self._resumed: set[asyncio.Task] = set()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: int, detector_factory: Callable[[], CardDetector]) -> None:
+        """Spawn ``workers`` processes that each build a detector up front.
+
+        ``detector_factory`` must be importable by the spawned workers.
+        Blocks until every worker has loaded its detector; ``workers=0``
+        leaves the queue stopped, so jobs run on a thread.
+        """
+        if self._executor is not None or workers <= 0:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(detector_factory,),
+        )
+        for future in [self._executor.submit(_ping) for _ in range(workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def pending(self, upload_id: int) -> bool:
+        with self._lock:
+            return upload_id in self._inflight
+
+    async def run(
+        self,
+        upload_id: int,
+        image_path: str,
+        bind: Engine | Connection,
+        detector: CardDetector,
+    ) -> ImageUpload | None:
+        """Detect and store one upload's cards.
+
+        ``detector`` is used only while the worker pool is stopped. Returns
+        the updated upload, or None if the job was already running or the
+        upload had already been handled.
+        """
+        with self._lock:
+            if upload_id in self._inflight:
+                return None
+            self._inflight.add(upload_id)
+        try:
+            try:
+                if self._executor is None:
+                    results = await asyncio.to_thread(detector.detect, image_path)
+                else:
+                    loop = asyncio.get_running_loop()
+                    results = await loop.run_in_executor(
+                        self._executor, _detect_in_worker, image_path
+                    )
+            except Exception:
+                results = None
+            return await asyncio.to_thread(store_detection, bind, upload_id, results)
+        finally:
+            with self._lock:
+                self._inflight.discard(upload_id)
+
+    def resume(
+        self,
+        bind: Engine | Connection,
+        detector_factory: Callable[[], CardDetector],
+        on_done: Callable[[ImageUpload], None] | None = None,
+    ) -> int:
+        """Queue every upload still ``processing``; returns how many.
+
+        Call from the running event loop, e.g. at startup. ``on_done`` is
+        called with each upload a job finishes.
+        """
+        with Session(bind=bind) as db:
+            pending = db.execute(
+                select(ImageUpload.upload_id, ImageUpload.file_path).where(
+                    ImageUpload.status == 'processing'
+                )
+            ).all()
+        if not pending:
+            return 0
+        detector = detector_factory() if self._executor is None else None
+
+        async def job(upload_id: int, image_path: str) -> None:
+            upload = await self.run(upload_id, image_path, bind, detector)
+            if upload is not None and on_done is not None:
+                on_done(upload)
+
+        for upload_id, image_path in pending:
+            task = asyncio.get_running_loop().create_task(job(upload_id, image_path))
+            self._resumed.add(task)
+            task.add_done_callback(self._resumed.discard)
+        return len(pending)
+
+
+detection_queue = DetectionQueue()
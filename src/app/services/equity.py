@@ -2,26 +2,25 @@
 
 from __future__ import annotations
 
+import json
+import os
 import random
-from itertools import combinations
-
-RANK_VAL = {
-    '2': 0,
-    '3': 1,
-    '4': 2,
-    '5': 3,
-    '6': 4,
-    '7': 5,
-    '8': 6,
-    '9': 7,
-    '10': 8,
-    'T': 8,
-    'J': 9,
-    'Q': 10,
-    'K': 11,
-    'A': 12,
-}
-SUIT_VAL = {'h': 0, 'd': 1, 'c': 2, 's': 3}
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+from itertools import combinations, permutations
+from statistics import NormalDist
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic_models.card_codec import card_id, from_mask
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ENGINES = ('python', 'numpy')
+MONTE_CARLO_ITERS = 5000
 
 B = 14  # base > 13 to avoid collisions
 B5 = B**5
@@ -31,9 +30,21 @@ B5 = B**5
 # ---------------------------------------------------------------------------
 
 
+# A player's hole cards or the board: (rank, suit) tuples, 0–51 card ids, or
+# a 52-bit card mask (see ``pydantic_models.card_codec``)
+Cards = list[tuple[str, str]] | list[int] | int
+
+
 def _to_internal(card: tuple[str, str]) -> tuple[int, int]:
     """Convert (rank, suit) to internal (r, s) ints."""
-    return (RANK_VAL[card[0]], SUIT_VAL[card[1]])
+    return divmod(card_id(*card), 4)
+
+
+def card_ids(cards: Cards) -> list[int]:
+    """Normalize any ``Cards`` form to a list of card ids."""
+    if isinstance(cards, int):
+        return from_mask(cards)
+    return [c if isinstance(c, int) else card_id(*c) for c in cards]
 
 
 def _build_deck(known: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -106,18 +117,150 @@ def _eval5(
     return _score_component(0, ranks)
 
 
+# ---------------------------------------------------------------------------
+# Lookup tables for the 5–7 card evaluator
+# ---------------------------------------------------------------------------
+#
+# A hand is reduced to two integer keys: a rank key (sum of 5**rank, unique
+# per rank multiset because no rank appears more than four times) and a suit
+# key (sum of 8**suit, which holds each suit count in three bits). The suit
+# key tells us whether a flush exists; a flush hand is then scored from the
+# 13-bit rank mask of the flush suit, every other hand from its rank key.
+# Scores are identical to the best ``_eval5`` over all 5-card subsets.
+
+_RANK_KEY = [5**r for r in range(13)]
+_SUIT_KEY = [8**s for s in range(4)]
+
+# (mask, high card) for each straight, best first; the wheel plays as 5-high.
+_STRAIGHTS = [(0b11111 << lo, lo + 4) for lo in range(8, -1, -1)] + [
+    ((1 << 12) | 0b1111, 3)
+]
+
+
+def _top_ranks(mask: int, n: int) -> list[int]:
+    """Return the ``n`` highest ranks set in ``mask``, highest first."""
+    return [r for r in range(12, -1, -1) if mask >> r & 1][:n]
+
+
+def _straight_high(mask: int) -> int:
+    for straight_mask, high in _STRAIGHTS:
+        if mask & straight_mask == straight_mask:
+            return high
+    return -1
+
+
+def _score_flush(mask: int) -> int:
+    """Score the best hand made from a single suit's rank mask (5+ ranks)."""
+    high = _straight_high(mask)
+    if high >= 0:
+        return _score_component(8, [high])
+    return _score_component(5, _top_ranks(mask, 5))
+
+
+def _score_ranks(counts: list[int]) -> int:
+    """Score the best non-flush hand for a rank multiset (5–7 cards)."""
+    quads: list[int] = []
+    trips: list[int] = []
+    pairs: list[int] = []
+    present: list[int] = []
+    mask = 0
+    for r in range(12, -1, -1):
+        n = counts[r]
+        if n:
+            present.append(r)
+            mask |= 1 << r
+            if n == 2:
+                pairs.append(r)
+            elif n == 3:
+                trips.append(r)
+            elif n == 4:
+                quads.append(r)
+
+    if quads:
+        q = quads[0]
+        return _score_component(7, [q, present[1] if present[0] == q else present[0]])
+    if trips and (len(trips) > 1 or pairs):
+        t = trips[0]
+        return _score_component(6, [t, max(trips[1:] + pairs)])
+    high = _straight_high(mask)
+    if high >= 0:
+        return _score_component(4, [high])
+    if trips:
+        t = trips[0]
+        return _score_component(3, [t] + [r for r in present if r != t][:2])
+    if len(pairs) >= 2:
+        p1, p2 = pairs[0], pairs[1]
+        kicker = next(r for r in present if r != p1 and r != p2)
+        return _score_component(2, [p1, p2, kicker])
+    if pairs:
+        p = pairs[0]
+        return _score_component(1, [p] + [r for r in present if r != p][:3])
+    return _score_component(0, present[:5])
+
+
+def _build_rank_table() -> dict[int, int]:
+    """Score every 5-, 6- and 7-card rank multiset, keyed by rank key."""
+    table: dict[int, int] = {}
+    counts = [0] * 13
+
+    def fill(rank: int, cards: int, key: int) -> None:
+        if cards >= 5:
+            table[key] = _score_ranks(counts)
+        if rank == 13 or cards == 7:
+            return
+        for n in range(min(4, 7 - cards) + 1):
+            counts[rank] = n
+            fill(rank + 1, cards + n, key + n * _RANK_KEY[rank])
+        counts[rank] = 0
+
+    fill(0, 0, 0)
+    return table
+
+
+def _build_flush_table() -> list[int]:
+    """Score every 13-bit rank mask with 5+ ranks; other masks map to -1."""
+    return [
+        _score_flush(mask) if mask.bit_count() >= 5 else -1 for mask in range(1 << 13)
+    ]
+
+
+def _build_flush_suit_table() -> list[int]:
+    """Map each suit key to the suit holding 5+ cards, or -1 for no flush."""
+    table = [-1] * (8**4)
+    for key in range(8**4):
+        for s in range(4):
+            if key // _SUIT_KEY[s] % 8 >= 5:
+                table[key] = s
+    return table
+
+
+@cache
+def _tables() -> tuple[dict[int, int], list[int], list[int]]:
+    """Build the (rank, flush, flush-suit) tables once, on first use."""
+    return _build_rank_table(), _build_flush_table(), _build_flush_suit_table()
+
+
 # ---------------------------------------------------------------------------
 # Best-of-7 evaluator
 # ---------------------------------------------------------------------------
 
 
 def _best_score(cards: list[tuple[int, int]]) -> int:
-    best = -1
-    for combo in combinations(cards, 5):
-        s = _eval5(*combo)
-        if s > best:
-            best = s
-    return best
+    """Score the best 5-card hand within 5–7 cards using the lookup tables."""
+    rank_table, flush_table, flush_suit_table = _tables()
+    rank_key = 0
+    suit_key = 0
+    for r, s in cards:
+        rank_key += _RANK_KEY[r]
+        suit_key += _SUIT_KEY[s]
+    flush_suit = flush_suit_table[suit_key]
+    if flush_suit < 0:
+        return rank_table[rank_key]
+    mask = 0
+    for r, s in cards:
+        if s == flush_suit:
+            mask |= 1 << r
+    return flush_table[mask]
 
 
 # ---------------------------------------------------------------------------
@@ -141,27 +284,52 @@ def _eval_board(
 
 
 def calculate_equity(
-    player_hole_cards: list[list[tuple[str, str]]],
-    community_cards: list[tuple[str, str]],
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    engine: str = 'python',
+    exact: bool = False,
 ) -> list[float]:
     """Calculate win equity for each player.
 
     Args:
-        player_hole_cards: Per-player list of 2 hole cards as (rank, suit) tuples.
-        community_cards: 0-5 known community cards as (rank, suit) tuples.
+        player_hole_cards: Per-player 2 hole cards as (rank, suit) tuples, card
+            ids or a card mask.
+        community_cards: 0-5 known community cards, in any ``Cards`` form.
+        engine: ``'python'`` evaluates runouts one at a time; ``'numpy'`` draws
+            and scores all runouts as arrays (requires NumPy).
+        exact: Enumerate every runout even when 3–5 board cards remain,
+            collapsing suit-isomorphic runouts into weighted classes. The
+            result is deterministic; this path always uses NumPy.
 
     Returns:
         List of floats (one per player) representing equity (0.0–1.0), summing to 1.0.
+
+    Raises:
+        ValueError: If ``engine`` is not one of ``ENGINES``.
     """
+    if engine not in ENGINES:
+        raise ValueError(f'Unknown equity engine {engine!r}; expected one of {ENGINES}')
+
     num_players = len(player_hole_cards)
     if num_players == 0:
         return []
     if num_players == 1:
         return [1.0]
 
-    players = [[_to_internal(c) for c in hc] for hc in player_hole_cards]
-    board = [_to_internal(c) for c in community_cards]
+    player_ids = [card_ids(hc) for hc in player_hole_cards]
+    board_ids = card_ids(community_cards)
+
+    if engine == 'numpy' or (exact and len(board_ids) < 3):
+        from app.services import equity_numpy
 
+        if exact:
+            return equity_numpy.exact_equity(player_ids, board_ids)
+        return equity_numpy.calculate_equity(
+            player_ids, board_ids, iters=MONTE_CARLO_ITERS
+        )
+
+    players = [[divmod(c, 4) for c in p] for p in player_ids]
+    board = [divmod(c, 4) for c in board_ids]
     all_known = list(board)
     for p in players:
         all_known.extend(p)
@@ -186,7 +354,7 @@ def calculate_equity(
         return [w / n for w in wins]
 
     # Monte Carlo for 3+ remaining cards
-    iters = 5000
+    iters = MONTE_CARLO_ITERS
     for _ in range(iters):
         random.shuffle(deck)
         b = board + deck[:remaining]
@@ -194,3 +362,308 @@ def calculate_equity(
         for j in range(num_players):
             wins[j] += result[j]
     return [w / iters for w in wins]
+
+
+# ---------------------------------------------------------------------------
+# Adaptive Monte Carlo
+# ---------------------------------------------------------------------------
+
+ADAPTIVE_BATCH_SIZE = 2000
+ADAPTIVE_MAX_SAMPLES = 1_000_000
+
+
+class EquityEstimate(NamedTuple):
+    """Sampled equities with a confidence interval half-width per player.
+
+    ``half_widths`` are all 0.0 when the runouts were enumerated exactly.
+    """
+
+    equities: list[float]
+    half_widths: list[float]
+    samples: int
+    confidence: float
+
+
+def estimate_equity(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    precision: float | None = 0.005,
+    time_budget: float | None = None,
+    confidence: float = 0.95,
+    batch_size: int = ADAPTIVE_BATCH_SIZE,
+    max_samples: int = ADAPTIVE_MAX_SAMPLES,
+    rng: np.random.Generator | None = None,
+) -> EquityEstimate:
+    """Sample runouts in batches until the equities are precise enough.
+
+    After each batch the standard error of every player's mean pot share is
+    updated, and sampling stops once the widest confidence interval is
+    within ``precision`` (e.g. 0.005 for ±0.5%), ``time_budget`` seconds
+    have elapsed, or ``max_samples`` runouts have been drawn — whichever
+    comes first. Spots with 0–2 board cards to come are enumerated exactly.
+
+    Args:
+        player_hole_cards: Per-player 2 hole cards in any ``Cards`` form.
+        community_cards: 0-5 known community cards in any ``Cards`` form.
+        precision: Target confidence interval half-width, or ``None`` to run
+            until the time budget or sample cap.
+        time_budget: Wall-clock limit in seconds, or ``None`` for no limit.
+        confidence: Two-sided confidence level of the reported intervals.
+        batch_size: Runouts scored per vectorized batch.
+        max_samples: Hard cap on the number of runouts drawn.
+        rng: Optional ``numpy.random.Generator`` for reproducible results.
+
+    Returns:
+        An ``EquityEstimate``; ``equities`` sum to 1.0.
+    """
+    num_players = len(player_hole_cards)
+    if num_players < 2:
+        return EquityEstimate([1.0] * num_players, [0.0] * num_players, 0, confidence)
+
+    import numpy as np
+
+    from app.services import equity_numpy
+
+    players = [card_ids(hc) for hc in player_hole_cards]
+    board = card_ids(community_cards)
+    if len(board) >= 3:
+        totals, weight = equity_numpy.exact_share_sums(players, board)
+        return EquityEstimate(
+            [t / weight for t in totals], [0.0] * num_players, weight, confidence
+        )
+
+    rng = rng or np.random.default_rng()
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    sums = np.zeros(num_players)
+    squares = np.zeros(num_players)
+    n = 0
+    while True:
+        batch = min(batch_size, max_samples - n)
+        batch_sums, batch_squares = equity_numpy.sample_share_moments(
+            players, board, batch, rng
+        )
+        sums += batch_sums
+        squares += batch_squares
+        n += batch
+
+        means = sums / n
+        # Standard error of the mean from the unbiased per-runout variance
+        variance = np.maximum(squares / n - means**2, 0.0) / max(n - 1, 1)
+        half_widths = z * np.sqrt(variance)
+        if (
+            n >= max_samples
+            or (precision is not None and half_widths.max() <= precision)
+            or (deadline is not None and time.perf_counter() >= deadline)
+        ):
+            return EquityEstimate(means.tolist(), half_widths.tolist(), n, confidence)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def equity_cache_key(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    exact: bool = False,
+) -> tuple[str, list[int]]:
+    """Build a suit-normalized cache key for a hand state.
+
+    Each player's hole cards and the board are sorted, the players are put
+    in a canonical order, and the suit relabelling that gives the smallest
+    encoding is chosen, so isomorphic spots (e.g. AsKs vs QhQd and AhKh vs
+    QsQd) share one entry.
+
+    Returns:
+        (key, slots) where ``slots[i]`` is player ``i``'s position in the
+        canonical player order that cached equities are stored in.
+    """
+    hands = [card_ids(hc) for hc in player_hole_cards]
+    board = card_ids(community_cards)
+
+    best: tuple | None = None
+    for perm in permutations(range(4)):
+
+        def relabel(cards: list[int], perm=perm) -> tuple[int, ...]:
+            return tuple(sorted(c - c % 4 + perm[c % 4] for c in cards))
+
+        form = (tuple(sorted(relabel(h) for h in hands)), relabel(board))
+        if best is None or form < best[0]:
+            best = (form, [relabel(h) for h in hands])
+
+    (canonical_hands, canonical_board), relabelled = best
+    slots = [canonical_hands.index(h) for h in relabelled]
+    key = '|'.join(
+        ['exact' if exact else 'sampled', '.'.join(map(str, canonical_board))]
+        + ['.'.join(map(str, h)) for h in canonical_hands]
+    )
+    return key, slots
+
+
+class EquityCache:
+    """Two-tier cache of equity results keyed by ``equity_cache_key``.
+
+    An in-process LRU sits in front of an optional SQLite file, so results
+    survive restarts and are shared between worker processes when a path
+    is configured.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: str | None = None) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS equity_cache '
+                '(key TEXT PRIMARY KEY, equities TEXT NOT NULL)'
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                'SELECT equities FROM equity_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            equities = json.loads(row[0])
+            self._remember(key, equities)
+            return equities
+
+    def put(self, key: str, equities: list[float]) -> None:
+        with self._lock:
+            self._remember(key, equities)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO equity_cache (key, equities) VALUES (?, ?)',
+                    (key, json.dumps(equities)),
+                )
+                self._db.commit()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute('DELETE FROM equity_cache WHERE key = ?', (key,))
+                self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM equity_cache')
+                self._db.commit()
+
+    def _remember(self, key: str, equities: list[float]) -> None:
+        self._entries[key] = equities
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+equity_cache = EquityCache(
+    maxsize=int(os.environ.get('EQUITY_CACHE_SIZE', '4096')),
+    path=os.environ.get('EQUITY_CACHE_PATH'),
+)
+
+
+def cache_lookup(
+    cache: EquityCache,
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    exact: bool,
+) -> list[float] | None:
+    """Cached equities for a hand state, in the caller's player order."""
+    key, slots = equity_cache_key(player_hole_cards, community_cards, exact)
+    stored = cache.get(key)
+    return None if stored is None else [stored[slot] for slot in slots]
+
+
+def cache_store(
+    cache: EquityCache,
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    exact: bool,
+    equities: list[float],
+) -> None:
+    """Cache ``equities`` (in the caller's player order) for a hand state."""
+    key, slots = equity_cache_key(player_hole_cards, community_cards, exact)
+    stored = [0.0] * len(equities)
+    for i, slot in enumerate(slots):
+        stored[slot] = equities[i]
+    cache.put(key, stored)
+
+
+def calculate_equity_cached(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    exact: bool = False,
+    cache: EquityCache | None = None,
+) -> list[float]:
+    """``calculate_equity`` behind ``equity_cache`` (or the given cache)."""
+    cache = equity_cache if cache is None else cache
+    if len(player_hole_cards) < 2:
+        return calculate_equity(player_hole_cards, community_cards, exact=exact)
+
+    equities = cache_lookup(cache, player_hole_cards, community_cards, exact)
+    if equities is None:
+        equities = calculate_equity(player_hole_cards, community_cards, exact=exact)
+        cache_store(cache, player_hole_cards, community_cards, exact, equities)
+    return equities
+
+
+# Board cards known at each street, in dealing order
+STREET_BOARD_SIZES = {'preflop': 0, 'flop': 3, 'turn': 4, 'river': 5}
+
+
+def calculate_street_equities(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    cache: EquityCache | None = None,
+) -> dict[str, list[float]]:
+    """Exact equity at each street the board has reached, in one pass.
+
+    Streets already in the cache are reused; otherwise every street is
+    derived from a single enumeration of full boards and written back to
+    the cache under the same keys ``calculate_equity_cached`` uses.
+    ``community_cards`` must be a sequence in dealing order, not a mask.
+
+    Returns:
+        Mapping of street name to per-player equities, in dealing order.
+    """
+    cache = equity_cache if cache is None else cache
+    community_cards = card_ids(community_cards)
+    streets = [
+        s for s, size in STREET_BOARD_SIZES.items() if size <= len(community_cards)
+    ]
+    if len(player_hole_cards) < 2:
+        return {
+            s: calculate_equity(player_hole_cards, community_cards) for s in streets
+        }
+
+    results = {}
+    for street in streets:
+        board = community_cards[: STREET_BOARD_SIZES[street]]
+        results[street] = cache_lookup(cache, player_hole_cards, board, exact=True)
+    if all(v is not None for v in results.values()):
+        return results
+
+    from app.services import equity_numpy
+
+    results = equity_numpy.street_equities(
+        [card_ids(hc) for hc in player_hole_cards], community_cards
+    )
+    for street, equities in results.items():
+        board = community_cards[: STREET_BOARD_SIZES[street]]
+        cache_store(cache, player_hole_cards, board, True, equities)
+    return results
+
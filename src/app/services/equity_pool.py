@@ -0,0 +1,211 @@
+"""Process-pool execution service for CPU-bound equity calculations.
+
+Exact enumeration is split into runout index ranges that workers evaluate
+independently with ``equity_numpy.exact_share_sums`` (or
+``street_share_sums`` for a per-street timeline); the partial sums are
+added back together in the parent. Workers are spawned and their lookup
+tables built once at startup, so requests never pay that cost.
+
+When the pool has not been started (tests, scripts, ``EQUITY_WORKERS=0``)
+the same work runs inline on a thread so the event loop stays free.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import pairwise
+from math import comb
+
+from app.services import equity_numpy
+from app.services.equity import (
+    STREET_BOARD_SIZES,
+    Cards,
+    EquityCache,
+    EquityEstimate,
+    cache_lookup,
+    cache_store,
+    card_ids,
+    equity_cache,
+    estimate_equity,
+)
+
+# Runouts below this are enumerated in one piece; sharding would cost more
+# in process round trips than it saves
+SHARD_MIN_RUNOUTS = 50_000
+
+
+def _warm_worker() -> None:
+    """Build the evaluator arrays in a freshly spawned worker."""
+    equity_numpy._arrays()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def shard_ranges(total: int, shards: int) -> list[tuple[int, int]]:
+    """Split ``range(total)`` into at most ``shards`` contiguous, non-empty ranges."""
+    shards = max(1, min(shards, total))
+    bounds = [total * i // shards for i in range(shards + 1)]
+    return [(lo, hi) for lo, hi in pairwise(bounds) if hi > lo]
+
+
+class EquityPool:
+    """Owns the worker processes that equity calculations are sent to."""
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._workers = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: int | None = None) -> None:
+        """Spawn ``workers`` processes (default: one per CPU) and warm them up.
+
+        Blocks until every worker has built its lookup tables. ``workers=0``
+        leaves the pool stopped, so calculations run inline.
+        """
+        if self._executor is not None:
+            return
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_warm_worker,
+        )
+        self._workers = workers
+        for future in [self._executor.submit(_ping) for _ in range(workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._workers = 0
+
+    async def run(self, fn, *args, **kwargs):
+        """Await ``fn(*args, **kwargs)`` on a worker, or a thread if stopped."""
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def exact_equity(
+        self, players: list[list[int]], board: list[int]
+    ) -> list[float]:
+        """Exact equity on card ids, with the enumeration sharded across workers."""
+        total = comb(52 - 2 * len(players) - len(board), 5 - len(board))
+        if self._executor is None or total < SHARD_MIN_RUNOUTS:
+            return await self.run(equity_numpy.exact_equity, players, board)
+
+        parts = await asyncio.gather(
+            *(
+                self.run(equity_numpy.exact_share_sums, players, board, lo, hi)
+                for lo, hi in shard_ranges(total, self._workers)
+            )
+        )
+        weight = sum(w for _, w in parts)
+        return [
+            sum(col) / weight for col in zip(*(sums for sums, _ in parts), strict=True)
+        ]
+
+    async def street_equities(
+        self, players: list[list[int]], board: list[int]
+    ) -> dict[str, list[float]]:
+        """Exact equity at each street reached by ``board``, sharded across workers."""
+        total = comb(52 - 2 * len(players), 5)
+        if self._executor is None or total < SHARD_MIN_RUNOUTS:
+            return await self.run(equity_numpy.street_equities, players, board)
+
+        parts = await asyncio.gather(
+            *(
+                self.run(equity_numpy.street_share_sums, players, board, lo, hi)
+                for lo, hi in shard_ranges(total, self._workers)
+            )
+        )
+        return {
+            street: [
+                sum(col) / sum(part[street][1] for part in parts)
+                for col in zip(*(part[street][0] for part in parts), strict=True)
+            ]
+            for street in parts[0]
+        }
+
+    async def estimate_equity(self, *args, **kwargs) -> EquityEstimate:
+        """Run ``equity.estimate_equity`` on a worker."""
+        return await self.run(estimate_equity, *args, **kwargs)
+
+
+equity_pool = EquityPool()
+
+
+async def calculate_equity_async(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    cache: EquityCache | None = None,
+    pool: EquityPool | None = None,
+) -> list[float]:
+    """Exact equity behind the result cache, computed on the process pool.
+
+    Async counterpart of ``calculate_equity_cached(..., exact=True)``; both
+    read and write the same cache entries.
+    """
+    cache = equity_cache if cache is None else cache
+    pool = equity_pool if pool is None else pool
+    if len(player_hole_cards) < 2:
+        return [1.0] * len(player_hole_cards)
+
+    equities = cache_lookup(cache, player_hole_cards, community_cards, exact=True)
+    if equities is None:
+        equities = await pool.exact_equity(
+            [card_ids(hc) for hc in player_hole_cards],
+            card_ids(community_cards),
+        )
+        cache_store(cache, player_hole_cards, community_cards, True, equities)
+    return equities
+
+
+async def calculate_street_equities_async(
+    player_hole_cards: list[Cards],
+    community_cards: Cards,
+    cache: EquityCache | None = None,
+    pool: EquityPool | None = None,
+) -> dict[str, list[float]]:
+    """Per-street exact equity behind the result cache, on the process pool.
+
+    Async counterpart of ``calculate_street_equities``; both read and write
+    the same cache entries.
+    """
+    cache = equity_cache if cache is None else cache
+    pool = equity_pool if pool is None else pool
+    community_cards = card_ids(community_cards)
+    streets = {
+        street: community_cards[:size]
+        for street, size in STREET_BOARD_SIZES.items()
+        if size <= len(community_cards)
+    }
+    if len(player_hole_cards) < 2:
+        return {street: [1.0] * len(player_hole_cards) for street in streets}
+
+    results = {
+        street: cache_lookup(cache, player_hole_cards, board, exact=True)
+        for street, board in streets.items()
+    }
+    if all(equities is not None for equities in results.values()):
+        return results
+
+    results = await pool.street_equities(
+        [card_ids(hc) for hc in player_hole_cards], community_cards
+    )
+    for street, equities in results.items():
+        cache_store(cache, player_hole_cards, streets[street], True, equities)
+    return results
@@ -0,0 +1,159 @@
+"""Precompute and store per-street equities for every hand in a game.
+
+Run as a background job when a session is completed, so playback reads
+equities from the ``hand_equities`` table instead of computing them on the
+request path. The enumerations run on ``equity_pool``'s worker processes,
+not in the web process's threadpool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from app.database.models import Hand, HandEquity
+from app.services.equity import STREET_BOARD_SIZES
+from app.services.equity_pool import calculate_street_equities_async
+from pydantic_models.card_codec import encode_cards, encode_mask
+
+
+def dealt_board(hand: Hand) -> list[str]:
+    """Return the contiguous run of dealt board cards: flop, then turn, then river.
+
+    A partial flop counts as no board at all.
+    """
+    board: list[str] = []
+    for card_str in [hand.flop_1, hand.flop_2, hand.flop_3, hand.turn, hand.river]:
+        if card_str is None:
+            break
+        board.append(card_str)
+    return board if len(board) >= 3 else []
+
+
+@dataclass(frozen=True)
+class _PendingHand:
+    """What one hand's equities are computed from, read before computing."""
+
+    hand_id: int
+    version: int
+    player_ids: list[int]
+    hole_cards: list[int]
+    board: list[int]
+
+
+def _pending_hands(bind: Engine, game_id: int) -> list[_PendingHand]:
+    with Session(bind=bind) as db:
+        hands = db.scalars(
+            select(Hand)
+            .options(selectinload(Hand.player_hands))
+            .where(Hand.game_id == game_id)
+            .order_by(Hand.hand_number)
+        ).all()
+        pending = []
+        for hand in hands:
+            player_hands = [
+                ph
+                for ph in hand.player_hands
+                if ph.card_1 is not None and ph.card_2 is not None
+            ]
+            pending.append(
+                _PendingHand(
+                    hand_id=hand.hand_id,
+                    version=hand.version,
+                    player_ids=[ph.player_id for ph in player_hands],
+                    hole_cards=[
+                        encode_mask([ph.card_1, ph.card_2]) for ph in player_hands
+                    ],
+                    board=encode_cards(dealt_board(hand)),
+                )
+            )
+        return pending
+
+
+def _store_timeline(
+    bind: Engine, hand: _PendingHand, timeline: dict[str, list[float]]
+) -> int:
+    """Replace a hand's stored equities in a session of its own.
+
+    Nothing is written if the hand changed or was deleted since it was
+    read; the edit has already cleared its rows.
+    """
+    with Session(bind=bind) as db:
+        version = db.scalar(select(Hand.version).where(Hand.hand_id == hand.hand_id))
+        if version != hand.version:
+            return 0
+        clear_hand_equities(db, hand.hand_id)
+        for street, equities in timeline.items():
+            db.add(
+                HandEquity(
+                    hand_id=hand.hand_id,
+                    street=street,
+                    equities=json.dumps(
+                        {
+                            str(pid): eq
+                            for pid, eq in zip(hand.player_ids, equities, strict=True)
+                        }
+                    ),
+                )
+            )
+        db.commit()
+    return len(timeline)
+
+
+async def precompute_game_equities(game_id: int, bind: Engine) -> int:
+    """Compute and store per-street equities for every hand in a game.
+
+    Runs as a background task once the response has been sent. The hands
+    are read in one short session, each hand's enumeration is awaited on
+    ``equity_pool`` (which checks the shared result cache first, so
+    repeated spots are only enumerated once) and its rows are written in
+    a fresh session. Database work runs on a thread, so the event loop is
+    never blocked.
+
+    Returns:
+        Number of ``hand_equities`` rows written.
+    """
+    written = 0
+    for hand in await asyncio.to_thread(_pending_hands, bind, game_id):
+        if len(hand.hole_cards) < 2:
+            continue
+        timeline = await calculate_street_equities_async(hand.hole_cards, hand.board)
+        written += await asyncio.to_thread(_store_timeline, bind, hand, timeline)
+    return written
+
+
+async def stored_street_equities_async(
+    db: AsyncSession, hand: Hand, street: str
+) -> dict[int, float] | None:
+    """Return precomputed ``{player_id: equity}`` for a street, if stored."""
+    row = await db.scalar(
+        select(HandEquity).where(
+            HandEquity.hand_id == hand.hand_id, HandEquity.street == street
+        )
+    )
+    return _decode_equities(row)
+
+
+def _decode_equities(row: HandEquity | None) -> dict[int, float] | None:
+    if row is None:
+        return None
+    return {int(pid): eq for pid, eq in json.loads(row.equities).items()}
+
+
+def street_for_board_size(size: int) -> str | None:
+    """Map a number of known board cards to its street, or None if invalid."""
+    for street, board_size in STREET_BOARD_SIZES.items():
+        if board_size == size:
+            return street
+    return None
+
+
+def clear_hand_equities(db: Session, hand_id: int) -> None:
+    """Delete stored equities for a hand whose cards are about to change."""
+    db.query(HandEquity).filter(HandEquity.hand_id == hand_id).delete()
@@ -0,0 +1,318 @@
+"""Hero-vs-range equity.
+
+A range is written in the usual shorthand, e.g. ``"QQ+,AKs,A5s-A2s,KQo:0.5"``,
+and expands to weighted two-card combos. Combos that share a card with the
+hero or the board are removed before anything is evaluated.
+
+Postflop, every runout is enumerated once and all villain combos are scored
+against it as one array. Preflop, equity is read from a 169×169 table of
+heads-up hand-class matchups shipped at ``PREFLOP_TABLE_PATH`` (built by
+``scripts/build_preflop_table.py``); if the file is missing, each matchup
+is simulated on first use and memoized.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import cache
+from itertools import permutations
+from typing import NamedTuple
+
+import numpy as np
+
+from app.services import equity_numpy
+from app.services.equity import Cards, card_ids
+
+RANGE_RANKS = '23456789TJQKA'
+RANGE_SUITS = 'hdcs'
+
+_MODELS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..', 'models')
+)
+PREFLOP_TABLE_PATH = os.environ.get(
+    'PREFLOP_TABLE_PATH', os.path.join(_MODELS_DIR, 'preflop_equity.npy')
+)
+# Runouts sampled per class matchup that is missing from the table
+PREFLOP_SAMPLES = 20_000
+
+_R = '[2-9TJQKA]'
+_CLASS = re.compile(rf'^({_R})({_R})([so]?)(\+?)$', re.IGNORECASE)
+_SPAN = re.compile(rf'^({_R})({_R})([so]?)-({_R})({_R})\3$', re.IGNORECASE)
+_COMBO = re.compile(rf'^({_R})([hdcs])({_R})([hdcs])$', re.IGNORECASE)
+
+Combo = tuple[int, int]
+
+
+class RangeEquity(NamedTuple):
+    """Hero equity against a range and how it was obtained."""
+
+    equity: float
+    combos: int
+    method: str
+
+
+# ---------------------------------------------------------------------------
+# Range parsing
+# ---------------------------------------------------------------------------
+
+
+def _rank(ch: str) -> int:
+    return RANGE_RANKS.index(ch.upper())
+
+
+def _combo(a: int, b: int) -> Combo:
+    return (a, b) if a > b else (b, a)
+
+
+def _class_combos(hi: int, lo: int, kind: str = '') -> list[Combo]:
+    """Combos of ranks ``hi``/``lo``; ``kind`` is ``'s'``, ``'o'`` or ``''`` (both)."""
+    if hi == lo:
+        return [
+            _combo(hi * 4 + s1, hi * 4 + s2)
+            for s1 in range(4)
+            for s2 in range(s1 + 1, 4)
+        ]
+    return [
+        _combo(hi * 4 + s1, lo * 4 + s2)
+        for s1 in range(4)
+        for s2 in range(4)
+        if (kind != 's' or s1 == s2) and (kind != 'o' or s1 != s2)
+    ]
+
+
+def _expand_token(token: str) -> list[Combo]:
+    if m := _COMBO.match(token):
+        a = _rank(m[1]) * 4 + RANGE_SUITS.index(m[2].lower())
+        b = _rank(m[3]) * 4 + RANGE_SUITS.index(m[4].lower())
+        if a == b:
+            raise ValueError(f'Invalid range token {token!r}: repeated card')
+        return [_combo(a, b)]
+
+    if m := _SPAN.match(token):
+        hi1, lo1, hi2, lo2 = _rank(m[1]), _rank(m[2]), _rank(m[4]), _rank(m[5])
+        kind = m[3].lower()
+        if hi1 == lo1 and hi2 == lo2 and not kind:
+            # Pair span, e.g. 22-55
+            ranks = range(min(hi1, hi2), max(hi1, hi2) + 1)
+            return [c for r in ranks for c in _class_combos(r, r)]
+        if hi1 == hi2 and lo1 < hi1 and lo2 < hi1:
+            # Kicker span under a fixed top card, e.g. A2s-A5s
+            kickers = range(min(lo1, lo2), max(lo1, lo2) + 1)
+            return [c for k in kickers for c in _class_combos(hi1, k, kind)]
+        raise ValueError(f'Invalid range token {token!r}')
+
+    if m := _CLASS.match(token):
+        hi, lo = sorted((_rank(m[1]), _rank(m[2])), reverse=True)
+        kind, plus = m[3].lower(), m[4]
+        if hi == lo:
+            if kind:
+                raise ValueError(f'Invalid range token {token!r}: pairs take no s/o')
+            ranks = range(hi, 13) if plus else [hi]
+            return [c for r in ranks for c in _class_combos(r, r)]
+        # ATs+ raises the kicker up to, but not including, the top card
+        kickers = range(lo, hi) if plus else [lo]
+        return [c for k in kickers for c in _class_combos(hi, k, kind)]
+
+    raise ValueError(f'Invalid range token {token!r}')
+
+
+def parse_range(text: str) -> dict[Combo, float]:
+    """Expand range shorthand into ``{combo: weight}``.
+
+    Tokens are comma-separated: pairs (``QQ``, ``QQ+``, ``22-55``), unpaired
+    classes (``AK``, ``AKs``, ``ATo+``, ``A2s-A5s``) and exact combos
+    (``AsKs``). A ``:w`` suffix sets the token's weight (default 1); later
+    tokens override earlier ones for the same combo.
+
+    Raises:
+        ValueError: If a token or weight cannot be parsed, or nothing is left.
+    """
+    combos: dict[Combo, float] = {}
+    for raw in text.split(','):
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ':' in token:
+            token, _, raw_weight = token.partition(':')
+            try:
+                weight = float(raw_weight)
+            except ValueError:
+                raise ValueError(
+                    f'Invalid weight in range token {raw.strip()!r}'
+                ) from None
+            if not 0 <= weight <= 1:
+                raise ValueError(f'Weight must be between 0 and 1 in {raw.strip()!r}')
+        for combo in _expand_token(token.strip()):
+            combos[combo] = weight
+    combos = {c: w for c, w in combos.items() if w > 0}
+    if not combos:
+        raise ValueError('Range is empty')
+    return combos
+
+
+# ---------------------------------------------------------------------------
+# Preflop class table
+# ---------------------------------------------------------------------------
+
+
+def hand_class(a: int, b: int) -> int:
+    """Index of a two-card hand in the 13×13 class grid (0–168).
+
+    Pairs sit on the diagonal, suited hands above it (row = high card) and
+    offsuit hands below it (row = low card).
+    """
+    hi, lo = max(a // 4, b // 4), min(a // 4, b // 4)
+    if a % 4 == b % 4:
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def class_combos(cls: int) -> list[Combo]:
+    """Every combo belonging to hand class ``cls``."""
+    row, col = divmod(cls, 13)
+    if row == col:
+        return _class_combos(row, row)
+    if row > col:
+        return _class_combos(row, col, 's')
+    return _class_combos(col, row, 'o')
+
+
+def class_name(cls: int) -> str:
+    """Shorthand for a hand class, e.g. ``'AKs'`` or ``'77'``."""
+    row, col = divmod(cls, 13)
+    hi, lo = max(row, col), min(row, col)
+    suffix = '' if row == col else 's' if row > col else 'o'
+    return f'{RANGE_RANKS[hi]}{RANGE_RANKS[lo]}{suffix}'
+
+
+def matchup_patterns(hero_cls: int, villain_cls: int) -> dict[tuple, int]:
+    """Distinct ``(hero, villain)`` combo pairs of a class matchup, with counts.
+
+    Non-overlapping pairs that are the same up to a suit relabelling have
+    the same equity, so each is stored once under its smallest relabelling.
+    """
+    patterns: dict[tuple, int] = {}
+    for hero in class_combos(hero_cls):
+        for villain in class_combos(villain_cls):
+            if set(hero) & set(villain):
+                continue
+            form = min(
+                tuple(
+                    tuple(sorted(c - c % 4 + perm[c % 4] for c in hand))
+                    for hand in (hero, villain)
+                )
+                for perm in permutations(range(4))
+            )
+            patterns[form] = patterns.get(form, 0) + 1
+    return patterns
+
+
+def simulate_class_matchup(hero_cls: int, villain_cls: int, samples: int) -> float:
+    """Average heads-up equity of one hand class against another.
+
+    Every non-overlapping pair of combos counts equally; each distinct
+    pattern is sampled in proportion to how many pairs it stands for.
+    """
+    patterns = matchup_patterns(hero_cls, villain_cls)
+
+    # A fixed seed per matchup keeps the table reproducible
+    rng = np.random.default_rng(hero_cls * 169 + villain_cls)
+    total = sum(patterns.values())
+    equity = 0.0
+    for (hero, villain), count in patterns.items():
+        n = max(1, round(samples * count / total))
+        sums, _ = equity_numpy.sample_share_moments(
+            [list(hero), list(villain)], [], n, rng
+        )
+        equity += count / total * float(sums[0]) / n
+    return equity
+
+
+@cache
+def _preflop_table() -> np.ndarray:
+    """The 169×169 matchup table; NaN marks matchups not yet computed."""
+    try:
+        return np.load(PREFLOP_TABLE_PATH).astype(np.float64)
+    except FileNotFoundError:
+        return np.full((169, 169), np.nan)
+
+
+def class_equity(hero_cls: int, villain_cls: int) -> float:
+    """Table lookup of a class matchup, simulating and memoizing misses."""
+    table = _preflop_table()
+    if np.isnan(table[hero_cls, villain_cls]):
+        equity = simulate_class_matchup(hero_cls, villain_cls, PREFLOP_SAMPLES)
+        table[hero_cls, villain_cls] = equity
+        table[villain_cls, hero_cls] = 1.0 - equity
+    return float(table[hero_cls, villain_cls])
+
+
+# ---------------------------------------------------------------------------
+# Range equity
+# ---------------------------------------------------------------------------
+
+
+def _postflop_equity(
+    hero: list[int], combos: list[Combo], weights: np.ndarray, board: list[int]
+) -> float:
+    """Enumerate runouts once, score the hero once, then each villain combo."""
+    used = set(hero) | set(board)
+    deck = np.array([c for c in range(52) if c not in used], dtype=np.int64)
+    runouts = equity_numpy.enumerate_runouts(deck, 5 - len(board))
+    known = np.array(board, dtype=np.int64)
+    boards = np.concatenate(
+        [np.broadcast_to(known, (runouts.shape[0], known.size)), runouts], axis=1
+    )
+    hero_scores = equity_numpy.score_players(np.array([hero]), boards)[:, 0]
+    runout_masks = np.left_shift(np.int64(1), runouts).sum(axis=1)
+
+    per_combo = np.empty(len(combos))
+    for i, combo in enumerate(combos):
+        # Skip runouts that deal one of the combo's own cards
+        live = (runout_masks & ((1 << combo[0]) | (1 << combo[1]))) == 0
+        villain = equity_numpy.score_players(np.array([combo]), boards[live])[:, 0]
+        hero_live = hero_scores[live]
+        per_combo[i] = (
+            (hero_live > villain).sum() + 0.5 * (hero_live == villain).sum()
+        ) / live.sum()
+    return float(weights @ per_combo / weights.sum())
+
+
+def range_equity(
+    hero_cards: Cards,
+    villain_range: str,
+    community_cards: Cards,
+) -> RangeEquity:
+    """Equity of two known hole cards against a weighted villain range.
+
+    Args:
+        hero_cards: Hero's 2 hole cards in any ``equity.Cards`` form.
+        villain_range: Range shorthand, see ``parse_range``.
+        community_cards: 0, 3, 4 or 5 board cards in any ``equity.Cards`` form.
+
+    Returns:
+        A ``RangeEquity``; ``method`` is ``'preflop_table'`` (class-level
+        equities, exact suits averaged out) or ``'exact'``.
+
+    Raises:
+        ValueError: If the range cannot be parsed or every combo is blocked.
+    """
+    hero = card_ids(hero_cards)
+    board = card_ids(community_cards)
+    dead = set(hero) | set(board)
+    live = {c: w for c, w in parse_range(villain_range).items() if not set(c) & dead}
+    if not live:
+        raise ValueError('Every combo in the range is blocked by known cards')
+
+    combos = list(live)
+    weights = np.array(list(live.values()))
+    if not board:
+        hero_cls = hand_class(*hero)
+        equities = np.array([class_equity(hero_cls, hand_class(*c)) for c in combos])
+        equity = float(weights @ equities / weights.sum())
+        return RangeEquity(equity, len(combos), 'preflop_table')
+    return RangeEquity(
+        _postflop_equity(hero, combos, weights, board), len(combos), 'exact'
+    )
@@ -0,0 +1,116 @@
+"""In-process pub/sub for live game updates.
+
+Write routes publish a small delta for a game after they commit, and every
+open ``/games/{game_id}/events`` stream for that game receives it. Routes
+publish from threadpool threads as well as from the event loop, so
+delivery is handed to each subscriber's loop with ``call_soon_threadsafe``.
+
+Subscribers only see writes handled by the same process, which matches the
+single uvicorn worker the app is deployed with.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Events queued for one subscriber before it is treated as lagging
+MAX_QUEUED_EVENTS = 256
+
+# Delivered in place of the dropped backlog of a lagging subscriber
+RESYNC = 'resync'
+
+
+class Subscription:
+    """The event queue of one open stream, owned by its event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queued: int) -> None:
+        self._loop = loop
+        self._queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        self._max_queued = max_queued
+
+    def push(self, event: str, data: Any) -> None:
+        """Queue ``(event, data)`` from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event, data)
+        except RuntimeError:
+            pass  # Loop already closed; the stream is gone
+
+    def _put(self, event: str, data: Any) -> None:
+        if self._queue.qsize() >= self._max_queued:
+            # Too far behind for deltas to be useful; start over from a snapshot
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait((RESYNC, None))
+            return
+        self._queue.put_nowait((event, data))
+
+    async def get(self) -> tuple[str, Any]:
+        """Wait for the next ``(event, data)``."""
+        return await self._queue.get()
+
+
+class GameEventBroker:
+    """Fans published game events out to the subscribed streams."""
+
+    def __init__(self, max_queued: int = MAX_QUEUED_EVENTS) -> None:
+        self._max_queued = max_queued
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[Subscription]] = {}
+
+    def subscriber_count(self, game_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(game_id, ()))
+
+    @contextmanager
+    def subscribe(self, game_id: int) -> Iterator[Subscription]:
+        """Receive ``game_id``'s events on the running loop until exit."""
+        subscription = Subscription(asyncio.get_running_loop(), self._max_queued)
+        with self._lock:
+            self._subscriptions.setdefault(game_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscriptions = self._subscriptions.get(game_id, set())
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    self._subscriptions.pop(game_id, None)
+
+    async def wait_until(
+        self,
+        game_id: int,
+        done: Callable[[], Awaitable[bool]],
+        timeout: float,
+    ) -> None:
+        """Await ``done()`` until it is true, or ``timeout`` seconds pass.
+
+        ``done`` is checked once up front and again after each event of the
+        game, so it should be a cheap read that holds no connection after
+        it returns.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Subscribed before the first check, so a write in between still wakes us
+        with self.subscribe(game_id) as subscription:
+            while not await done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(subscription.get(), remaining)
+                except TimeoutError:
+                    return
+
+    def publish(self, game_id: int, event: str, data: Any = None) -> None:
+        """Send ``event`` to every stream of ``game_id``; call after commit."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(game_id, ()))
+        for subscription in subscriptions:
+            subscription.push(event, data)
+
+
+game_events = GameEventBroker()
@@ -0,0 +1,76 @@
+"""Maintain the ``hand_cards`` search index.
+
+Every dealt card of a hand is one ``hand_cards`` row keyed by its integer
+card code, so searching hands by card is an index lookup instead of a scan
+over the seven card columns. Call ``index_hand_cards`` whenever a hand's
+board or hole cards change, before ``db.commit()``, and
+``clear_hand_cards`` before deleting a hand.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.database.models import Hand, HandCard, PlayerHand
+from pydantic_models.card_codec import encode_card
+
+BOARD_LOCATIONS = (
+    ('flop_1', 'flop'),
+    ('flop_2', 'flop'),
+    ('flop_3', 'flop'),
+    ('turn', 'turn'),
+    ('river', 'river'),
+)
+
+
+def hand_card_rows(hand: Hand, player_hands: Iterable[PlayerHand]) -> list[dict]:
+    """``hand_cards`` rows for a hand's board and the given player hands."""
+    rows = [
+        {
+            'hand_id': hand.hand_id,
+            'player_hand_id': None,
+            'card_code': encode_card(getattr(hand, column)),
+            'location': location,
+        }
+        for column, location in BOARD_LOCATIONS
+        if getattr(hand, column) is not None
+    ]
+    for ph in player_hands:
+        for card_str in (ph.card_1, ph.card_2):
+            if card_str is not None:
+                rows.append(
+                    {
+                        'hand_id': hand.hand_id,
+                        'player_hand_id': ph.player_hand_id,
+                        'card_code': encode_card(card_str),
+                        'location': 'hole',
+                    }
+                )
+    return rows
+
+
+def add_hand_cards(db: Session, rows: list[dict]) -> None:
+    """Insert prepared ``hand_card_rows`` in one statement."""
+    if rows:
+        db.execute(insert(HandCard), rows)
+
+
+def clear_hand_cards(db: Session, hand_id: int) -> None:
+    """Delete a hand's rows; call before deleting the hand or its player hands."""
+    db.query(HandCard).filter(HandCard.hand_id == hand_id).delete()
+
+
+def index_hand_cards(db: Session, hand: Hand) -> None:
+    """Replace a hand's rows with its current board and hole cards.
+
+    Pending changes are flushed first so added or removed player hands are
+    seen; the old rows go before that flush so no row outlives its player
+    hand.
+    """
+    clear_hand_cards(db, hand.hand_id)
+    db.flush()
+    player_hands = db.query(PlayerHand).filter(PlayerHand.hand_id == hand.hand_id)
+    add_hand_cards(db, hand_card_rows(hand, player_hands))
@@ -0,0 +1,131 @@
+"""Process-wide cache of loaded card detection models.
+
+Loading YOLO weights takes far longer than one inference, so each weights
+file is loaded and warmed up once per process and then shared by every
+detection. The file's mtime and size are checked on each use; when the
+file is replaced on disk the next detection reloads it, while concurrent
+detections keep using the previous model until the new one is ready.
+
+Ultralytics models are not safe to call from several threads at once, so
+inference on each loaded model is serialized; worker processes each hold
+their own registry and run in parallel.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.services.card_detector import CardDetector, YoloCardDetector
+
+
+@dataclass
+class _Entry:
+    detector: CardDetector
+    # (mtime_ns, size) of the weights file the detector was loaded from
+    stamp: tuple[int, int]
+    # Held while the detector runs an inference
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _stamp(weights_path: str) -> tuple[int, int]:
+    stat = os.stat(weights_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModelRegistry:
+    """Loads each weights file once and reloads it when the file changes."""
+
+    def __init__(
+        self, loader: Callable[[str], CardDetector] = YoloCardDetector
+    ) -> None:
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        # One per weights path, held while that path is being (re)loaded
+        self._loading: dict[str, threading.Lock] = {}
+
+    def get(self, weights_path: str) -> CardDetector:
+        """The warmed-up detector for ``weights_path``, loading it if needed.
+
+        Blocks only when there is no model for the path yet. A failed
+        reload keeps the previous model until the file changes again.
+        """
+        return self._entry(weights_path).detector
+
+    def detect(self, weights_path: str, image_path: str) -> list[dict]:
+        """Run ``weights_path``'s current model on ``image_path``."""
+        entry = self._entry(weights_path)
+        with entry.lock:
+            return entry.detector.detect(image_path)
+
+    def _entry(self, weights_path: str) -> _Entry:
+        path = os.path.abspath(weights_path)
+        with self._lock:
+            entry = self._entries.get(path)
+            loading = self._loading.setdefault(path, threading.Lock())
+        try:
+            stamp = _stamp(path)
+        except FileNotFoundError:
+            # Mid-replace or removed; keep serving what is loaded
+            if entry is not None:
+                return entry
+            raise
+        if entry is not None and entry.stamp == stamp:
+            return entry
+
+        if entry is not None:
+            if not loading.acquire(blocking=False):
+                return entry  # Another thread is already reloading
+        else:
+            loading.acquire()
+        try:
+            with self._lock:
+                current = self._entries.get(path)
+            if current is not None and current.stamp == stamp:
+                return current  # Loaded while we waited
+            try:
+                detector = self._loader(path)
+                warmup = getattr(detector, 'warmup', None)
+                if warmup is not None:
+                    warmup()
+            except Exception:
+                if current is None:
+                    raise
+                # Don't retry a broken file on every detection
+                current.stamp = stamp
+                return current
+            entry = _Entry(detector, stamp)
+            with self._lock:
+                self._entries[path] = entry
+            return entry
+        finally:
+            loading.release()
+
+    def clear(self) -> None:
+        """Forget every loaded model."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RegisteredCardDetector:
+    """A detector that runs the registry's current model for one weights file.
+
+    Cheap to create: nothing is loaded until the first ``detect`` or
+    ``warmup``, and every call picks up a reloaded model.
+    """
+
+    def __init__(self, weights_path: str, registry: ModelRegistry | None = None):
+        self.weights_path = weights_path
+        self._registry = registry or model_registry
+
+    def warmup(self) -> None:
+        self._registry.get(self.weights_path)
+
+    def detect(self, image_path: str) -> list[dict]:
+        return self._registry.detect(self.weights_path, image_path)
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,231 @@
+"""Maintain the ``player_stats_agg`` table.
+
+Each player has one row per game they have results in, plus a career row
+under ``OVERALL_GAME_ID``. Whenever results or a hand's board change, the
+affected per-game rows are recomputed from that game's hands alone and the
+career row is re-summed from the player's per-game rows in one SQL
+statement, so writes cost one game and stats reads cost one row no matter
+how long a player's history is. Summing in SQL rather than shifting the
+career row by a delta computed in Python means two writes to different
+games cannot overwrite each other's change.
+
+Call ``refresh_game_stats`` in the same transaction as the write, before
+``db.commit()``; bulk imports of brand-new games use ``add_new_game_stats``
+instead. ``rebuild_player_stats`` recomputes everything from scratch for
+backfills.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database.models import Hand, PlayerHand, PlayerStatsAgg
+
+OVERALL_GAME_ID = 0
+
+STAT_FIELDS = (
+    'hands_played',
+    'hands_won',
+    'hands_lost',
+    'hands_folded',
+    'total_profit_loss',
+    'turn_reached',
+    'river_reached',
+    'sessions_played',
+)
+
+
+def _aggregate_query(db: Session):
+    """Result totals grouped by (player_id, game_id), one column per stat."""
+    return (
+        db.query(
+            PlayerHand.player_id,
+            Hand.game_id,
+            func.count(PlayerHand.player_hand_id),
+            func.sum(case((PlayerHand.result == 'won', 1), else_=0)),
+            func.sum(case((PlayerHand.result == 'lost', 1), else_=0)),
+            func.sum(case((PlayerHand.result == 'folded', 1), else_=0)),
+            func.coalesce(func.sum(PlayerHand.profit_loss), 0.0),
+            func.sum(case((Hand.turn.isnot(None), 1), else_=0)),
+            func.sum(case((Hand.river.isnot(None), 1), else_=0)),
+        )
+        .join(Hand, PlayerHand.hand_id == Hand.hand_id)
+        .filter(PlayerHand.result.isnot(None), PlayerHand.result != 'handed_back')
+        .group_by(PlayerHand.player_id, Hand.game_id)
+    )
+
+
+def _totals(row) -> tuple:
+    # A per-game row with results always counts as one session
+    return (*row[2:], 1)
+
+
+def _values(agg: PlayerStatsAgg | None) -> tuple:
+    if agg is None:
+        return (0,) * len(STAT_FIELDS)
+    return tuple(getattr(agg, field) for field in STAT_FIELDS)
+
+
+def refresh_game_stats(
+    db: Session, game_id: int, player_ids: Iterable[int] | None = None
+) -> None:
+    """Recompute one game's stats rows and re-sum the affected career rows.
+
+    Args:
+        db: Session holding the pending write; it is flushed first so the
+            recount sees it.
+        game_id: Game whose hands changed.
+        player_ids: Players to refresh; defaults to everyone with a row or
+            a result in the game.
+    """
+    db.flush()
+    fresh_query = _aggregate_query(db).filter(Hand.game_id == game_id)
+    stored_query = db.query(PlayerStatsAgg).filter(PlayerStatsAgg.game_id == game_id)
+    if player_ids is not None:
+        player_ids = set(player_ids)
+        fresh_query = fresh_query.filter(PlayerHand.player_id.in_(player_ids))
+        stored_query = stored_query.filter(PlayerStatsAgg.player_id.in_(player_ids))
+    fresh = {row[0]: _totals(row) for row in fresh_query.all()}
+    stored = {agg.player_id: agg for agg in stored_query.all()}
+
+    changed = set()
+    for player_id in fresh.keys() | stored.keys():
+        new = fresh.get(player_id, (0,) * len(STAT_FIELDS))
+        if _values(stored.get(player_id)) == new:
+            continue
+        changed.add(player_id)
+        if player_id in stored and player_id not in fresh:
+            db.delete(stored[player_id])
+        else:
+            _write(db, stored.get(player_id), player_id, game_id, new)
+    _resum_career_rows(db, changed)
+
+
+def add_new_game_stats(db: Session, game_ids: Iterable[int]) -> None:
+    """Write stats rows for games that have none yet, e.g. after an import.
+
+    One grouped query covers every game, the per-game rows go in as a single
+    insert, and the affected players' career rows are then re-summed from
+    all their per-game rows in SQL. Use ``refresh_game_stats`` for games
+    that already have rows.
+    """
+    game_ids = list(game_ids)
+    if not game_ids:
+        return
+    db.flush()
+    per_game = [
+        {
+            'player_id': row[0],
+            'game_id': row[1],
+            **dict(zip(STAT_FIELDS, _totals(row), strict=True)),
+        }
+        for row in _aggregate_query(db).filter(Hand.game_id.in_(game_ids)).all()
+    ]
+    if not per_game:
+        return
+    db.execute(insert(PlayerStatsAgg), per_game)
+    _resum_career_rows(db, {row['player_id'] for row in per_game})
+
+
+def _resum_career_rows(db: Session, player_ids: set[int]) -> None:
+    """Replace the players' career rows with the sum of their per-game rows.
+
+    Players left with no per-game rows lose their career row as well.
+    """
+    db.flush()
+    if not player_ids:
+        return
+    table = PlayerStatsAgg.__table__
+    # Core statements; stale career rows in the session are dropped below
+    db.execute(
+        delete(table).where(
+            table.c.game_id == OVERALL_GAME_ID, table.c.player_id.in_(player_ids)
+        )
+    )
+    db.execute(
+        insert(table).from_select(
+            ['player_id', 'game_id', *STAT_FIELDS, 'updated_at'],
+            select(
+                table.c.player_id,
+                literal(OVERALL_GAME_ID),
+                *(func.sum(table.c[field]) for field in STAT_FIELDS),
+                literal(datetime.now(timezone.utc), table.c.updated_at.type),
+            )
+            .where(
+                table.c.game_id != OVERALL_GAME_ID,
+                table.c.player_id.in_(player_ids),
+            )
+            .group_by(table.c.player_id),
+        )
+    )
+    for obj in list(db.identity_map.values()):
+        if (
+            isinstance(obj, PlayerStatsAgg)
+            and obj.game_id == OVERALL_GAME_ID
+            and obj.player_id in player_ids
+        ):
+            db.expunge(obj)
+
+
+def _write(
+    db: Session,
+    agg: PlayerStatsAgg | None,
+    player_id: int,
+    game_id: int,
+    values: tuple,
+) -> None:
+    if agg is None:
+        agg = PlayerStatsAgg(player_id=player_id, game_id=game_id)
+        db.add(agg)
+    for field, value in zip(STAT_FIELDS, values, strict=True):
+        setattr(agg, field, value)
+
+
+def rebuild_player_stats(db: Session) -> int:
+    """Recompute every stats row from the hands table; returns rows written.
+
+    Does not commit.
+    """
+    db.query(PlayerStatsAgg).delete()
+    career: dict[int, list] = {}
+    written = 0
+    for row in _aggregate_query(db).all():
+        values = _totals(row)
+        _write(db, None, row[0], row[1], values)
+        written += 1
+        if row[0] in career:
+            career[row[0]] = [
+                c + v for c, v in zip(career[row[0]], values, strict=True)
+            ]
+        else:
+            career[row[0]] = list(values)
+    for player_id, values in career.items():
+        _write(db, None, player_id, OVERALL_GAME_ID, tuple(values))
+        written += 1
+    db.flush()
+    return written
+
+
+def player_stats_row(
+    db: Session, player_id: int, game_id: int = OVERALL_GAME_ID
+) -> PlayerStatsAgg | None:
+    """A player's stored totals for one game, or career totals by default."""
+    return (
+        db.query(PlayerStatsAgg)
+        .filter(
+            PlayerStatsAgg.player_id == player_id, PlayerStatsAgg.game_id == game_id
+        )
+        .first()
+    )
+
+
+async def player_stats_row_async(
+    db: AsyncSession, player_id: int, game_id: int = OVERALL_GAME_ID
+) -> PlayerStatsAgg | None:
+    """``player_stats_row`` for an ``AsyncSession``."""
+    return await db.get(PlayerStatsAgg, (player_id, game_id))
@@ -0,0 +1,33 @@
+"""Maintain the version counters behind game and hand ETags.
+
+``GameSession.version`` goes up whenever anything shown for the game
+changes, its hands included, and ``Hand.version`` whenever the hand or one
+of its player hands does. New rows start at 1. Call ``bump_versions`` in
+every route that changes either, before ``db.commit()``, so the bump lands
+in the same transaction as the write.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.database.models import GameSession, Hand
+
+
+def bump_versions(db: Session, game_id: int, hand_id: int | None = None) -> None:
+    """Increment the game's version and, if given, the hand's."""
+    # Incremented in SQL so concurrent writers cannot both store the same value
+    db.execute(
+        update(GameSession)
+        .where(GameSession.game_id == game_id)
+        .values(version=GameSession.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if hand_id is not None:
+        db.execute(
+            update(Hand)
+            .where(Hand.hand_id == hand_id)
+            .values(version=Hand.version + 1)
+            .execution_options(synchronize_session=False)
+        )
@@ -10,6 +10,8 @@ from pydantic import (
     model_validator,
 )
 
+from pydantic_models.card_codec import encode_card
+
 
 class ResultEnum(str, Enum):
     WON = 'won'
@@ -110,6 +112,11 @@ class Card(BaseModel):
     def __str__(self) -> str:
         return f'{self.rank}{self.suit}'
 
+    @property
+    def card_id(self) -> int:
+        """The card's 0–51 id in ``card_codec`` encoding."""
+        return encode_card(str(self))
+
 
 # === Game/Hand/Player Request/Response Models ===
 
@@ -332,10 +339,13 @@ class HandSearchResult(BaseModel):
 
 
 class PaginatedHandSearchResponse(BaseModel):
-    total: int
-    page: int
+    # Cursor pages carry a cached total, or None when include_total=false
+    total: int | None
+    # Page number in offset mode; None when paging by cursor
+    page: int | None
     per_page: int
     results: list[HandSearchResult]
+    next_cursor: str | None = None
 
 
 class ConfirmCommunityCards(BaseModel):
@@ -371,10 +381,46 @@ class CSVCommitSummary(BaseModel):
 class PlayerEquityEntry(BaseModel):
     player_name: str
     equity: float
+    ci_low: float | None = None
+    ci_high: float | None = None
 
 
 class EquityResponse(BaseModel):
     equities: list[PlayerEquityEntry] = []
+    samples: int | None = None
+    confidence: float | None = None
+
+
+class StreetEquityEntry(BaseModel):
+    street: StreetEnum
+    equities: list[PlayerEquityEntry]
+
+
+class EquityTimelineResponse(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
+    streets: list[StreetEquityEntry] = []
+
+
+class RangeEquityRequest(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
+    hero_cards: list[Card] = Field(..., min_length=2, max_length=2)
+    villain_range: str = Field(..., min_length=1, examples=['QQ+,AKs,AQo:0.5'])
+    board: list[Card] = Field(default=[], max_length=5)
+
+    @model_validator(mode='after')
+    def _check_board_size(self):
+        if len(self.board) not in (0, 3, 4, 5):
+            msg = 'board must have 0, 3, 4 or 5 cards'
+            raise ValueError(msg)
+        return self
+
+
+class RangeEquityResponse(BaseModel):
+    equity: float
+    villain_combos: int
+    method: str
 
 
 class PlayerStatusEntry(BaseModel):
@@ -388,5 +434,6 @@ class PlayerStatusEntry(BaseModel):
 
 class HandStatusResponse(BaseModel):
     hand_number: int
+    version: int
     community_recorded: bool
     players: list[PlayerStatusEntry]
@@ -0,0 +1,96 @@
+"""Compact integer encoding for playing cards.
+
+A card is an integer 0–51, ``rank * 4 + suit``, with ranks 2..A as 0..12
+and suits H, D, C, S as 0..3 — the layout the equity engine scores with. A
+set of cards is a 52-bit mask with bit ``card_id`` set for each card, so
+overlap between card groups is a single ``&``.
+
+The string form is the one stored in the database and accepted by the API:
+``'AS'``, ``'KH'``, ``'10D'``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('H', 'D', 'C', 'S')
+
+_RANK_INDEX = {r: i for i, r in enumerate(RANKS)}
+_SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
+# Every card string -> id, built once so encoding is a dict lookup
+_CARD_IDS = {
+    f'{r}{s}': i * 4 + j for r, i in _RANK_INDEX.items() for s, j in _SUIT_INDEX.items()
+}
+_CARD_STRS = {i: s for s, i in _CARD_IDS.items()}
+
+
+def is_valid_card(card_str: str) -> bool:
+    """Return True if card_str is a valid card token (e.g. 'AS', '10D')."""
+    return card_str in _CARD_IDS
+
+
+def encode_card(card_str: str) -> int:
+    """Return the 0–51 id of a card string such as ``'AS'`` or ``'10D'``.
+
+    Raises:
+        ValueError: If ``card_str`` is not a valid card.
+    """
+    try:
+        return _CARD_IDS[card_str]
+    except KeyError:
+        raise ValueError(f'Invalid card string: {card_str!r}') from None
+
+
+def card_id(rank: str, suit: str) -> int:
+    """Return the id of a (rank, suit) pair; accepts ``'T'`` and any suit case."""
+    rank = '10' if rank.upper() == 'T' else rank.upper()
+    return encode_card(rank + suit.upper())
+
+
+def decode_card(card: int) -> str:
+    """Return the string form of a card id, e.g. ``51`` -> ``'AS'``."""
+    return _CARD_STRS[card]
+
+
+def encode_cards(cards: Iterable[str]) -> list[int]:
+    """Encode card strings to ids, keeping their order."""
+    return [encode_card(c) for c in cards]
+
+
+def decode_cards(cards: Iterable[int]) -> list[str]:
+    """Decode card ids to strings, keeping their order."""
+    return [_CARD_STRS[c] for c in cards]
+
+
+def to_mask(cards: Iterable[int]) -> int:
+    """OR card ids into a 52-bit mask."""
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+
+def from_mask(mask: int) -> list[int]:
+    """Card ids set in ``mask``, ascending."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
+
+def encode_mask(cards: Iterable[str]) -> int:
+    """Encode card strings straight to a mask."""
+    return to_mask(encode_card(c) for c in cards)
+
+
+def overlapping_cards(*masks: int) -> int:
+    """Mask of cards that appear in more than one of ``masks``."""
+    seen = 0
+    repeated = 0
+    for mask in masks:
+        repeated |= seen & mask
+        seen |= mask
+    return repeated
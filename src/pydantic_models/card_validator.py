@@ -1,12 +1,21 @@
 """Card validation utilities for poker card handling."""
 
+from pydantic_models.card_codec import (
+    decode_cards,
+    encode_card,
+    from_mask,
+    is_valid_card,
+    overlapping_cards,
+)
 
-def validate_no_duplicate_cards(cards: list[str]) -> None:
+
+def validate_no_duplicate_cards(cards: list[str] | list[int]) -> None:
     """
     Validate that a list of cards contains no duplicates.
 
     Args:
-        cards: List of card strings (e.g., ['AS', 'KH', '2D'])
+        cards: List of card strings (e.g., ['AS', 'KH', '2D']), or of 52-bit
+            card masks (see ``card_codec``) for groups that must not overlap.
 
     Raises:
         ValueError: If duplicate cards are found in the list
@@ -14,17 +23,30 @@ def validate_no_duplicate_cards(cards: list[str]) -> None:
     Example:
         >>> validate_no_duplicate_cards(['AS', 'KH', '2D'])  # OK
         >>> validate_no_duplicate_cards(['AS', 'KH', 'AS'])  # Raises ValueError
+        >>> validate_no_duplicate_cards([0b11, 0b100])  # OK: 2H 2D vs 2C
     """
     if not cards:
         return
 
-    seen = set()
-    duplicates = set()
-
-    for card in cards:
-        if card in seen:
-            duplicates.add(card)
-        seen.add(card)
+    if all(isinstance(card, int) for card in cards):
+        repeated = overlapping_cards(*cards)
+        duplicates = set(decode_cards(from_mask(repeated)))
+    else:
+        # Known cards are tracked as bits; anything else is compared as is
+        seen_mask = 0
+        repeated = 0
+        seen: set = set()
+        duplicates = set()
+        for card in cards:
+            if isinstance(card, str) and is_valid_card(card):
+                bit = 1 << encode_card(card)
+                repeated |= seen_mask & bit
+                seen_mask |= bit
+            else:
+                if card in seen:
+                    duplicates.add(card)
+                seen.add(card)
+        duplicates.update(decode_cards(from_mask(repeated)))
 
     if duplicates:
         duplicate_list = ', '.join(sorted(duplicates))
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
 
-from pydantic_models.app_models import CardRank, CardSuit, ResultEnum
+from pydantic_models.app_models import ResultEnum
+from pydantic_models.card_codec import is_valid_card
 
 CSV_COLUMNS = [
     'game_date',
@@ -43,170 +47,255 @@ REQUIRED_CARD_FIELDS = ['hole_card_1', 'hole_card_2']
 FLOP_CARD_FIELDS = ['flop_1', 'flop_2', 'flop_3']
 OPTIONAL_CARD_FIELDS = ['turn', 'river']
 
-_VALID_RANKS = {r.value for r in CardRank}
-_VALID_SUITS = {s.value for s in CardSuit}
 _VALID_RESULTS = {r.value for r in ResultEnum}
 
 
-def is_valid_card(card_str: str) -> bool:
-    """Return True if card_str is a valid card token (e.g. 'AS', '10D')."""
-    if not card_str:
-        return False
-    suit = card_str[-1]
-    rank = card_str[:-1]
-    return rank in _VALID_RANKS and suit in _VALID_SUITS
+HandKey = tuple[str, str]
 
+# Bytes read from an upload per chunk when streaming
+READ_CHUNK_SIZE = 64 * 1024
 
-def validate_csv_rows(
-    grouped: dict[tuple[str, str], list[dict[str, str]]],
+_COMMUNITY_FIELDS = ['flop_1', 'flop_2', 'flop_3', 'turn', 'river']
+_HOLE_FIELDS = ['hole_card_1', 'hole_card_2']
+
+
+def _invalid_card(row_index: int, field: str, value: str) -> dict:
+    return {
+        'row': row_index,
+        'field': field,
+        'value': value,
+        'message': f'Invalid card value: {value}',
+    }
+
+
+def validate_hand_group(
+    key: HandKey, rows: list[dict[str, str]], row_index: int
 ) -> list[dict]:
-    """Validate parsed CSV rows for card values and duplicates.
+    """Validate the rows of one hand for card values and duplicates.
 
     Args:
-        grouped: Output of parse_csv — rows keyed by (game_date, hand_number).
+        key: The hand's (game_date, hand_number).
+        rows: Its player rows, in file order.
+        row_index: Report number of the first row (2 = first data row).
 
     Returns:
         List of error dicts with keys: row, field, value, message.
     """
+    game_date, hand_number = key
     errors: list[dict] = []
 
-    # Build a flat list with row numbers to report per-row errors.
-    # Row index 2 = first data row (1-based, 1 = header).
-    row_index = 2
-    for (game_date, hand_number), rows in grouped.items():
-        # Community card fields are shared across all player rows in a hand.
-        # Hole card fields are unique per player.
-        COMMUNITY_FIELDS = ['flop_1', 'flop_2', 'flop_3', 'turn', 'river']
-        HOLE_FIELDS = ['hole_card_1', 'hole_card_2']
-
-        # Cards to include in duplicate check: community once + each player's hole cards.
-        hand_cards: list[str] = []
-        community_added = False
-
-        hand_row_start = row_index
-        for row in rows:
-            for field in REQUIRED_CARD_FIELDS:
-                value = row.get(field, '').strip()
+    # Cards to include in duplicate check: community once + each player's hole cards.
+    hand_cards: list[str] = []
+    community_added = False
+
+    hand_row_start = row_index
+    for row in rows:
+        for field in REQUIRED_CARD_FIELDS:
+            value = row.get(field, '').strip()
+            if not is_valid_card(value):
+                errors.append(_invalid_card(row_index, field, value))
+
+        # Flop cards: all 3 must be present or all 3 empty (preflop hand).
+        flop_values = [row.get(f, '').strip() for f in FLOP_CARD_FIELDS]
+        if any(flop_values):
+            # Some flop cards present — validate all 3
+            for field, value in zip(FLOP_CARD_FIELDS, flop_values, strict=True):
                 if not is_valid_card(value):
-                    errors.append(
-                        {
-                            'row': row_index,
-                            'field': field,
-                            'value': value,
-                            'message': f'Invalid card value: {value}',
-                        }
-                    )
-
-            # Flop cards: all 3 must be present or all 3 empty (preflop hand).
-            flop_values = [row.get(f, '').strip() for f in FLOP_CARD_FIELDS]
-            flop_present = [v for v in flop_values if v]
-            if flop_present:
-                # Some flop cards present — validate all 3
-                for field in FLOP_CARD_FIELDS:
-                    value = row.get(field, '').strip()
-                    if not is_valid_card(value):
-                        errors.append(
-                            {
-                                'row': row_index,
-                                'field': field,
-                                'value': value,
-                                'message': f'Invalid card value: {value}',
-                            }
-                        )
-
-            for field in OPTIONAL_CARD_FIELDS:
-                value = row.get(field, '').strip()
-                if value and not is_valid_card(value):
-                    errors.append(
-                        {
-                            'row': row_index,
-                            'field': field,
-                            'value': value,
-                            'message': f'Invalid card value: {value}',
-                        }
-                    )
-
-            # Validate result against ResultEnum
-            result_value = row.get('result', '').strip()
-            if result_value and result_value not in _VALID_RESULTS:
-                errors.append(
-                    {
-                        'row': row_index,
-                        'field': 'result',
-                        'value': result_value,
-                        'message': (
-                            f'Invalid result: {result_value}. '
-                            f'Must be one of: {", ".join(sorted(_VALID_RESULTS))}'
-                        ),
-                    }
-                )
-
-            # Add community cards once (from first row) and hole cards per player.
-            if not community_added:
-                for field in COMMUNITY_FIELDS:
-                    v = row.get(field, '').strip()
-                    if is_valid_card(v):
-                        hand_cards.append(v)
-                community_added = True
-
-            for field in HOLE_FIELDS:
+                    errors.append(_invalid_card(row_index, field, value))
+
+        for field in OPTIONAL_CARD_FIELDS:
+            value = row.get(field, '').strip()
+            if value and not is_valid_card(value):
+                errors.append(_invalid_card(row_index, field, value))
+
+        # Validate result against ResultEnum
+        result_value = row.get('result', '').strip()
+        if result_value and result_value not in _VALID_RESULTS:
+            errors.append(
+                {
+                    'row': row_index,
+                    'field': 'result',
+                    'value': result_value,
+                    'message': (
+                        f'Invalid result: {result_value}. '
+                        f'Must be one of: {", ".join(sorted(_VALID_RESULTS))}'
+                    ),
+                }
+            )
+
+        # Add community cards once (from first row) and hole cards per player.
+        if not community_added:
+            for field in _COMMUNITY_FIELDS:
                 v = row.get(field, '').strip()
                 if is_valid_card(v):
                     hand_cards.append(v)
-
-            row_index += 1
-
-        # Duplicate check across the whole hand
-        seen: set[str] = set()
-        for card in hand_cards:
-            if card in seen:
-                errors.append(
-                    {
-                        'row': hand_row_start,
-                        'field': 'hand',
-                        'value': card,
-                        'message': (
-                            f'Duplicate card {card} in hand '
-                            f'(game_date={game_date}, hand_number={hand_number})'
-                        ),
-                    }
-                )
-                break
-            seen.add(card)
+            community_added = True
+
+        for field in _HOLE_FIELDS:
+            v = row.get(field, '').strip()
+            if is_valid_card(v):
+                hand_cards.append(v)
+
+        row_index += 1
+
+    # Duplicate check across the whole hand
+    seen: set[str] = set()
+    for card in hand_cards:
+        if card in seen:
+            errors.append(
+                {
+                    'row': hand_row_start,
+                    'field': 'hand',
+                    'value': card,
+                    'message': (
+                        f'Duplicate card {card} in hand '
+                        f'(game_date={game_date}, hand_number={hand_number})'
+                    ),
+                }
+            )
+            break
+        seen.add(card)
 
     return errors
 
 
-def parse_csv(csv_text: str) -> dict[tuple[str, str], list[dict[str, str]]]:
-    """Parse CSV text and return rows grouped by (game_date, hand_number).
+def validate_hand_groups(
+    groups: Iterable[tuple[HandKey, list[dict[str, str]]]],
+) -> Iterator[tuple[HandKey, list[dict[str, str]], list[dict]]]:
+    """Validate hand groups one at a time as they arrive.
+
+    Rows are numbered in the order the groups are seen. Each hand's rows
+    must be contiguous: a hand whose rows come back after another hand
+    started is reported rather than merged (``parse_csv`` used to merge
+    them), so only the current group is ever held in memory.
+
+    Yields:
+        ``(key, rows, errors)`` for each group.
+    """
+    seen: set[HandKey] = set()
+    row_index = 2
+    for key, rows in groups:
+        errors = validate_hand_group(key, rows, row_index)
+        if key in seen:
+            game_date, hand_number = key
+            errors.insert(
+                0,
+                {
+                    'row': row_index,
+                    'field': 'hand',
+                    'value': hand_number,
+                    'message': (
+                        f'Rows for hand (game_date={game_date}, '
+                        f'hand_number={hand_number}) must be contiguous; '
+                        'move them next to its earlier rows'
+                    ),
+                },
+            )
+        seen.add(key)
+        row_index += len(rows)
+        yield key, rows, errors
+
+
+def validate_csv_rows(
+    grouped: dict[HandKey, list[dict[str, str]]],
+) -> list[dict]:
+    """Validate parsed CSV rows for card values and duplicates.
 
     Args:
-        csv_text: Raw CSV content as a string (with headers).
+        grouped: Output of parse_csv — rows keyed by (game_date, hand_number).
 
     Returns:
-        Dict mapping (game_date, hand_number) tuples to lists of row dicts.
+        List of error dicts with keys: row, field, value, message.
+    """
+    return [
+        error
+        for _, _, errors in validate_hand_groups(grouped.items())
+        for error in errors
+    ]
+
+
+def iter_text_lines(
+    stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[str]:
+    """Decode a UTF-8 byte stream chunk by chunk and yield its lines.
+
+    Lines keep their ``\n`` so ``csv.reader`` sees quoted newlines intact.
 
     Raises:
-        ValueError: If CSV headers don't match the expected schema.
+        UnicodeDecodeError: If the bytes are not valid UTF-8.
     """
-    reader = csv.reader(io.StringIO(csv_text))
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    while chunk := stream.read(chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def _data_rows(lines: Iterable[str]) -> Iterator[dict[str, str]]:
+    reader = csv.reader(lines)
 
     # Validate headers
     try:
         headers = next(reader)
     except StopIteration:
-        return {}
+        return
 
     headers = [h.strip() for h in headers]
     if headers != CSV_COLUMNS:
         raise ValueError(f'Invalid CSV header. Expected {CSV_COLUMNS}, got {headers}')
 
-    grouped: dict[tuple[str, str], list[dict[str, str]]] = defaultdict(list)
-
     for row in reader:
         if not row or all(cell.strip() == '' for cell in row):
             continue
-        row_dict = dict(zip(headers, row))
+        # Ragged rows are kept: missing cells surface as per-field errors
+        yield dict(zip(headers, row, strict=False))
+
+
+def iter_hand_groups(
+    lines: Iterable[str],
+) -> Iterator[tuple[HandKey, list[dict[str, str]]]]:
+    """Stream CSV lines as hand groups, yielding each when the next begins.
+
+    Unlike ``parse_csv`` only consecutive rows are grouped; feed the result
+    to ``validate_hand_groups`` to flag hands split across the file.
+
+    Raises:
+        ValueError: If CSV headers don't match the expected schema. This is
+            raised on the first ``next()``, before any group is yielded.
+    """
+    key: HandKey | None = None
+    rows: list[dict[str, str]] = []
+    for row_dict in _data_rows(lines):
+        row_key = (row_dict['game_date'], row_dict['hand_number'])
+        if row_key != key and rows:
+            yield key, rows
+            rows = []
+        key = row_key
+        rows.append(row_dict)
+    if rows:
+        yield key, rows
+
+
+def parse_csv(csv_text: str) -> dict[HandKey, list[dict[str, str]]]:
+    """Parse CSV text and return rows grouped by (game_date, hand_number).
+
+    Args:
+        csv_text: Raw CSV content as a string (with headers).
+
+    Returns:
+        Dict mapping (game_date, hand_number) tuples to lists of row dicts.
+
+    Raises:
+        ValueError: If CSV headers don't match the expected schema.
+    """
+    grouped: dict[HandKey, list[dict[str, str]]] = defaultdict(list)
+
+    for row_dict in _data_rows(io.StringIO(csv_text)):
         key = (row_dict['game_date'], row_dict['hand_number'])
         grouped[key].append(row_dict)
 
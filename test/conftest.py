@@ -1,11 +1,16 @@
+import asyncio
+
+import aiosqlite
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.database.models import Base
-from app.database.session import get_db
+from app.database.session import create_async_db_engine, get_async_db, get_db
 from app.main import app
+from app.services.detection_queue import detection_queue
 
 DATABASE_URL = 'sqlite:///:memory:'  # In-memory database for testing
 engine = create_engine(
@@ -36,3 +41,100 @@ def client():
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+
+# Hand 1 of the ``game_id`` fixture: AK suited against queens on a dealt flop
+FLOP_HAND = {
+    'flop_1': '2C',
+    'flop_2': '7D',
+    'flop_3': 'JS',
+    'player_entries': [
+        {'player_name': 'Alice', 'card_1': 'AS', 'card_2': 'KS'},
+        {'player_name': 'Bob', 'card_1': 'QH', 'card_2': 'QD'},
+    ],
+}
+
+
+def new_game(client, player_names=('Alice', 'Bob', 'Cara'), game_date='2026-03-11'):
+    """Create a game through the API and return its id."""
+    resp = client.post(
+        '/games', json={'game_date': game_date, 'player_names': list(player_names)}
+    )
+    assert resp.status_code == 201
+    return resp.json()['game_id']
+
+
+@pytest.fixture
+def game_id(client):
+    """A game for Alice, Bob and Cara whose hand 1 is ``FLOP_HAND``."""
+    game_id = new_game(client)
+    resp = client.post(f'/games/{game_id}/hands', json=FLOP_HAND)
+    assert resp.status_code == 201
+    return game_id
+
+
+# Async engines keyed by the sync engine they mirror; see override_get_async_db
+_async_engines = {}
+
+
+def _async_engine_for(sync_engine):
+    """An async engine reading the same database as ``sync_engine``.
+
+    Test modules bind their sessions to an in-memory SQLite database held on
+    one StaticPool connection, which a second driver cannot open by URL, so
+    aiosqlite is handed that very sqlite3 connection instead.
+    """
+    if sync_engine not in _async_engines:
+        if sync_engine.url.database in (None, '', ':memory:'):
+            shared = sync_engine.raw_connection().driver_connection
+
+            async def creator():
+                return await aiosqlite.Connection(lambda: shared, 64)
+
+            _async_engines[sync_engine] = create_async_engine(
+                'sqlite+aiosqlite://', poolclass=StaticPool, async_creator=creator
+            )
+        else:
+            _async_engines[sync_engine] = create_async_db_engine(str(sync_engine.url))
+    return _async_engines[sync_engine]
+
+
+async def override_get_async_db():
+    """``get_async_db`` on whatever database the ``get_db`` override uses."""
+    sync_db = next(app.dependency_overrides.get(get_db, get_db)())
+    try:
+        engine = _async_engine_for(sync_db.get_bind())
+    finally:
+        sync_db.close()
+    async with AsyncSession(engine, autoflush=False, expire_on_commit=False) as db:
+        yield db
+
+
+@pytest.fixture(autouse=True)
+def async_db_override():
+    """Point async routes at the test database; module fixtures may clear it."""
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield
+    app.dependency_overrides.pop(get_async_db, None)
+
+
+@pytest.fixture
+def detection_pending(monkeypatch):
+    """Leave uploads ``processing``, as if their detection job had not run yet."""
+
+    async def never_run(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(detection_queue, 'run', never_run)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def dispose_async_engines():
+    """Stop aiosqlite's worker threads so the interpreter can exit."""
+    yield
+
+    async def dispose():
+        for engine in _async_engines.values():
+            await engine.dispose()
+
+    asyncio.run(dispose())
@@ -0,0 +1,100 @@
+"""Tests for the async database layer: get_async_db and its engine."""
+
+import asyncio
+import inspect
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import session
+from app.routes import hands, search, stats
+
+
+class TestAsyncUrl:
+    @pytest.mark.parametrize(
+        'url, expected',
+        [
+            ('sqlite:///./poker.db', 'sqlite+aiosqlite:///./poker.db'),
+            ('sqlite://', 'sqlite+aiosqlite://'),
+            # No undeclared driver is assumed for other databases
+            (
+                'postgresql+asyncpg://u:pw@db/poker',
+                'postgresql+asyncpg://u:pw@db/poker',
+            ),
+            ('mysql+aiomysql://u@db/poker', 'mysql+aiomysql://u@db/poker'),
+        ],
+    )
+    def test_driver_swapped(self, url, expected):
+        assert session.async_database_url(url) == expected
+
+
+class TestAsyncEngine:
+    def test_tuned_profile_applies_pragmas(self, tmp_path):
+        engine = session.create_async_db_engine(f'sqlite:///{tmp_path}/a.db', 'tuned')
+
+        async def pragmas():
+            try:
+                async with engine.connect() as conn:
+                    return [
+                        (await conn.exec_driver_sql(f'PRAGMA {name}')).scalar()
+                        for name in ('journal_mode', 'synchronous', 'busy_timeout')
+                    ]
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(pragmas()) == ['wal', 1, 5000]
+
+    def test_get_async_db_yields_session(self, tmp_path, monkeypatch):
+        engine = session.create_async_db_engine(f'sqlite:///{tmp_path}/b.db')
+        factory = session.async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(session, 'AsyncSessionLocal', factory)
+
+        async def use():
+            try:
+                async for db in session.get_async_db():
+                    assert isinstance(db, AsyncSession)
+                    return (await db.execute(text('SELECT 1'))).scalar()
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(use()) == 1
+
+
+PORTED_ROUTES = [
+    hands.get_hand_status,
+    hands.list_hands,
+    hands.get_hand_equity,
+    hands.get_hand_equity_timeline,
+    search.search_hands,
+    stats.get_player_stats,
+    stats.get_leaderboard,
+    stats.get_game_stats,
+]
+
+
+class TestPortedRoutes:
+    @pytest.mark.parametrize('endpoint', PORTED_ROUTES)
+    def test_hot_reads_are_async(self, endpoint):
+        assert inspect.iscoroutinefunction(endpoint)
+
+    @pytest.mark.parametrize('endpoint', PORTED_ROUTES)
+    def test_no_blocking_session_on_the_loop(self, endpoint):
+        dependencies = [
+            meta.dependency
+            for param in inspect.signature(endpoint).parameters.values()
+            for meta in getattr(param.annotation, '__metadata__', ())
+            if hasattr(meta, 'dependency')
+        ]
+        assert session.get_db not in dependencies
+        assert session.get_async_db in dependencies
+
+    def test_async_read_sees_sync_write(self, client):
+        resp = client.post(
+            '/games', json={'game_date': '2026-03-11', 'player_names': ['Ann']}
+        )
+        game_id = resp.json()['game_id']
+        client.post(f'/games/{game_id}/hands', json={})
+        status = client.get(f'/games/{game_id}/hands/1/status').json()
+        assert [p['name'] for p in status['players']] == ['Ann']
+        assert len(client.get(f'/games/{game_id}/hands').json()) == 1
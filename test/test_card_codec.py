@@ -0,0 +1,79 @@
+"""Tests for the shared integer card codec."""
+
+import pytest
+
+from app.services.equity import calculate_equity
+from pydantic_models.app_models import Card
+from pydantic_models.card_codec import (
+    card_id,
+    decode_card,
+    decode_cards,
+    encode_card,
+    encode_cards,
+    encode_mask,
+    from_mask,
+    overlapping_cards,
+    to_mask,
+)
+
+ALL_CARDS = [
+    f'{r}{s}'
+    for r in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+    for s in 'HDCS'
+]
+
+
+class TestEncodeDecode:
+    def test_every_card_round_trips_to_a_unique_id(self):
+        ids = encode_cards(ALL_CARDS)
+        assert sorted(ids) == list(range(52))
+        assert decode_cards(ids) == ALL_CARDS
+
+    def test_layout_matches_equity_engine(self):
+        # rank * 4 + suit with suits h, d, c, s
+        assert encode_card('2H') == 0
+        assert encode_card('10D') == 8 * 4 + 1
+        assert encode_card('AS') == 51
+
+    @pytest.mark.parametrize('bad', ['', 'A', '1S', 'AX', 'as', 'TS', '10'])
+    def test_invalid_strings_raise(self, bad):
+        with pytest.raises(ValueError, match='Invalid card'):
+            encode_card(bad)
+
+    def test_card_id_accepts_tuple_forms(self):
+        assert card_id('T', 's') == card_id('10', 'S') == encode_card('10S')
+
+    def test_card_model_exposes_id(self):
+        assert Card.model_validate('10D').card_id == encode_card('10D')
+        assert decode_card(Card.model_validate('KH').card_id) == 'KH'
+
+
+class TestMasks:
+    def test_mask_round_trip(self):
+        ids = [3, 17, 51]
+        assert from_mask(to_mask(ids)) == ids
+
+    def test_encode_mask(self):
+        assert encode_mask(['2H', '2D']) == 0b11
+
+    def test_overlapping_cards(self):
+        a = encode_mask(['AS', 'KS'])
+        b = encode_mask(['QH', 'QD'])
+        c = encode_mask(['KS', 'QH'])
+        assert overlapping_cards(a, b) == 0
+        assert from_mask(overlapping_cards(a, b, c)) == encode_cards(['QH', 'KS'])
+
+
+class TestEquityAcceptsMasks:
+    def test_masks_and_tuples_give_the_same_equity(self):
+        tuples = [[('A', 's'), ('K', 's')], [('Q', 'h'), ('Q', 'd')]]
+        board = [('2', 'c'), ('7', 'd'), ('J', 's')]
+        masks = [encode_mask(['AS', 'KS']), encode_mask(['QH', 'QD'])]
+        assert calculate_equity(
+            masks, encode_mask(['2C', '7D', 'JS'])
+        ) == pytest.approx(calculate_equity(tuples, board))
+
+    def test_card_id_lists_are_accepted(self):
+        players = [encode_cards(['AS', 'AH']), encode_cards(['KS', 'KH'])]
+        result = calculate_equity(players, encode_cards(['2C', '7D', 'JS', '3H']))
+        assert sum(result) == pytest.approx(1.0)
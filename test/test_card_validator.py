@@ -3,6 +3,7 @@
 import pytest
 
 from pydantic_models.app_models import Card, CardRank, CardSuit
+from pydantic_models.card_codec import encode_mask
 from pydantic_models.card_validator import validate_no_duplicate_cards
 
 
@@ -90,3 +91,14 @@ def test_validate_all_same_cards():
     cards = ['AS', 'AS', 'AS', 'AS']
     with pytest.raises(ValueError):
         validate_no_duplicate_cards(cards)
+
+
+def test_validate_disjoint_masks_passes():
+    """Masks of card groups that share no card are accepted."""
+    validate_no_duplicate_cards([encode_mask(['AS', 'KH']), encode_mask(['2D', '10C'])])
+
+
+def test_validate_overlapping_masks_raises():
+    """Overlapping masks are reported by card string."""
+    with pytest.raises(ValueError, match='Duplicate cards found: AS'):
+        validate_no_duplicate_cards([encode_mask(['AS', 'KH']), encode_mask(['AS'])])
@@ -0,0 +1,124 @@
+"""Tests for ETag/If-None-Match on game and hand reads and their version counters."""
+
+import pytest
+from sqlalchemy import event
+
+from app.database.models import GameSession, Hand
+from conftest import SessionLocal, engine
+
+
+def _versions(game_id: int) -> tuple[int, list[int]]:
+    db = SessionLocal()
+    try:
+        game = db.get(GameSession, game_id)
+        hands = (
+            db.query(Hand).filter(Hand.game_id == game_id).order_by(Hand.hand_number)
+        )
+        return game.version, [hand.version for hand in hands]
+    finally:
+        db.close()
+
+
+READS = [
+    '/games/{game_id}',
+    '/games/{game_id}/hands',
+    '/games/{game_id}/hands/1',
+    '/games/{game_id}/hands/1/status',
+]
+
+
+class TestConditionalGet:
+    @pytest.mark.parametrize('path', READS)
+    def test_unchanged_is_304(self, client, game_id, path):
+        url = path.format(game_id=game_id)
+        first = client.get(url)
+        etag = first.headers['etag']
+        again = client.get(url, headers={'If-None-Match': etag})
+        assert again.status_code == 304
+        assert again.content == b''
+        assert again.headers['etag'] == etag
+
+    @pytest.mark.parametrize('path', READS)
+    def test_changed_hand_refetches(self, client, game_id, path):
+        url = path.format(game_id=game_id)
+        etag = client.get(url).headers['etag']
+        client.patch(
+            f'/games/{game_id}/hands/1/players/Alice',
+            json={'card_1': 'AH', 'card_2': 'KD'},
+        )
+        resp = client.get(url, headers={'If-None-Match': etag})
+        assert resp.status_code == 200
+        assert resp.headers['etag'] != etag
+
+    def test_other_hand_keeps_hand_etag(self, client, game_id):
+        etag = client.get(f'/games/{game_id}/hands/1/status').headers['etag']
+        client.post(f'/games/{game_id}/hands', json={})
+        resp = client.get(
+            f'/games/{game_id}/hands/1/status', headers={'If-None-Match': etag}
+        )
+        assert resp.status_code == 304
+
+    def test_if_none_match_list_and_star(self, client, game_id):
+        url = f'/games/{game_id}'
+        etag = client.get(url).headers['etag']
+        listed = client.get(url, headers={'If-None-Match': f'W/"stale", {etag}'})
+        assert listed.status_code == 304
+        strong = etag.removeprefix('W/')
+        assert client.get(url, headers={'If-None-Match': strong}).status_code == 304
+        assert client.get(url, headers={'If-None-Match': '*'}).status_code == 304
+        assert client.get(url, headers={'If-None-Match': '"x"'}).status_code == 200
+
+    def test_304_costs_one_query(self, client, game_id):
+        url = f'/games/{game_id}/hands/1'
+        etag = client.get(url).headers['etag']
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+        assert len(statements) == 1
+
+    def test_missing_still_404(self, client, game_id):
+        assert client.get('/games/999').status_code == 404
+        assert client.get('/games/999/hands').status_code == 404
+        assert client.get(f'/games/{game_id}/hands/9').status_code == 404
+        assert client.get(f'/games/{game_id}/hands/9/status').status_code == 404
+
+
+class TestVersionBumps:
+    def test_new_rows_start_at_one(self, client, game_id):
+        # Game created at 1, then bumped once by the new hand
+        assert _versions(game_id) == (2, [1])
+
+    def test_hand_writes_bump_game_and_hand(self, client, game_id):
+        client.patch(
+            f'/games/{game_id}/hands/1/flop',
+            json={'flop_1': '3C', 'flop_2': '7D', 'flop_3': 'JS'},
+        )
+        client.patch(
+            f'/games/{game_id}/hands/1/players/Alice/result',
+            json={'result': 'won', 'profit_loss': 1.0},
+        )
+        client.post(
+            f'/games/{game_id}/hands/1/players',
+            json={'player_name': 'Cara', 'result': 'lost', 'profit_loss': -1.0},
+        )
+        client.delete(f'/games/{game_id}/hands/1/players/Cara')
+        assert _versions(game_id) == (6, [5])
+
+    def test_game_writes_bump_game_only(self, client, game_id):
+        client.post(f'/games/{game_id}/hands', json={})
+        client.patch(f'/games/{game_id}/complete')
+        client.patch(f'/games/{game_id}/reactivate')
+        client.delete(f'/games/{game_id}/hands/2')
+        assert _versions(game_id) == (6, [1])
+
+    def test_rejected_write_does_not_bump(self, client, game_id):
+        resp = client.patch(f'/games/{game_id}/hands/1/turn', json={'turn': 'AS'})
+        assert resp.status_code == 400
+        assert _versions(game_id) == (2, [1])
@@ -305,7 +305,7 @@ class TestConfirmEndpointErrors:
         )
         assert resp.status_code == 404
 
-    def test_upload_not_detected_returns_409(self, client, game_id):
+    def test_upload_not_detected_returns_409(self, client, game_id, detection_pending):
         """Upload still in 'processing' status should be rejected."""
         resp = client.post(
             f'/games/{game_id}/hands/image',
@@ -0,0 +1,140 @@
+"""Tests for the bulk CSV import service behind POST /upload/csv/commit."""
+
+import csv
+import io
+
+import pytest
+from sqlalchemy import event
+
+from app.database.models import GamePlayer, Hand, PlayerHand, PlayerStatsAgg
+from app.services import csv_import
+from app.services.player_stats import rebuild_player_stats
+from conftest import SessionLocal, engine
+from pydantic_models.csv_schema import CSV_COLUMNS, parse_csv
+
+
+def _csv(lines: list[str]) -> str:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_COLUMNS)
+    for line in lines:
+        writer.writerow(line.split(','))
+    return buf.getvalue()
+
+
+def _lines(games: int, hands: int) -> list[str]:
+    lines = []
+    for g in range(1, games + 1):
+        for h in range(1, hands + 1):
+            lines += [
+                f'03-{g:02d}-2026,{h},Adam,AS,KH,2C,3D,4S,5H,,won,5',
+                f'03-{g:02d}-2026,{h},Gil,JH,QD,2C,3D,4S,5H,,lost,-5',
+                f'03-{g:02d}-2026,{h},Zoe,9C,9D,2C,3D,4S,5H,,folded,',
+            ]
+    return lines
+
+
+def _stats() -> dict:
+    db = SessionLocal()
+    try:
+        return {
+            (agg.player_id, agg.game_id): (
+                agg.hands_played,
+                agg.hands_won,
+                agg.total_profit_loss,
+                agg.turn_reached,
+                agg.sessions_played,
+            )
+            for agg in db.query(PlayerStatsAgg).all()
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+class TestImport:
+    def test_creates_rows(self, db):
+        summary = csv_import.import_csv_hands(db, parse_csv(_csv(_lines(2, 3))))
+        db.commit()
+        assert summary == (2, 6, 3, 0)
+        assert db.query(Hand).count() == 6
+        assert db.query(PlayerHand).count() == 18
+        assert db.query(GamePlayer).count() == 6
+        hand = db.query(Hand).filter(Hand.hand_number == 2).first()
+        assert (hand.flop_1, hand.turn, hand.river) == ('2C', '5H', None)
+
+    def test_existing_players_matched_case_insensitively(self, client, db):
+        client.post(
+            '/games', json={'game_date': '2026-01-01', 'player_names': ['adam']}
+        )
+        summary = csv_import.import_csv_hands(db, parse_csv(_csv(_lines(1, 1))))
+        assert summary.players_matched == 1
+        assert summary.players_created == 2
+
+    def test_lookup_is_batched(self, db, monkeypatch):
+        monkeypatch.setattr(csv_import, 'LOOKUP_BATCH_SIZE', 2)
+        summary = csv_import.import_csv_hands(db, parse_csv(_csv(_lines(1, 1))))
+        assert summary.players_created == 3
+
+    def test_stats_match_full_rebuild(self, client, db):
+        # A prior game gives the career rows something to add to
+        resp = client.post(
+            '/games', json={'game_date': '2026-01-01', 'player_names': ['Adam']}
+        )
+        client.post(
+            f'/games/{resp.json()["game_id"]}/hands',
+            json={
+                'flop_1': '2C',
+                'flop_2': '7D',
+                'flop_3': 'JS',
+                'player_entries': [
+                    {'player_name': 'Adam', 'result': 'won', 'profit_loss': 3}
+                ],
+            },
+        )
+        csv_import.import_csv_hands(db, parse_csv(_csv(_lines(2, 2))))
+        db.commit()
+        incremental = _stats()
+        rebuild_player_stats(db)
+        db.commit()
+        assert incremental == _stats()
+
+    def test_statement_count_independent_of_size(self, db):
+        def count(lines):
+            statements = []
+
+            def listener(*args):
+                statements.append(args)
+
+            event.listen(engine, 'before_cursor_execute', listener)
+            try:
+                csv_import.import_csv_hands(db, parse_csv(_csv(lines)))
+            finally:
+                event.remove(engine, 'before_cursor_execute', listener)
+            db.rollback()
+            return len(statements)
+
+        assert count(_lines(1, 1)) == count(_lines(4, 10))
+
+    def test_empty_input(self, db):
+        assert csv_import.import_csv_hands(db, {}) == (0, 0, 0, 0)
+
+
+class TestCommitRoute:
+    def test_failure_rolls_back(self, client, monkeypatch):
+        def fail(*args):
+            raise RuntimeError('boom')
+
+        monkeypatch.setattr(csv_import, 'add_new_game_stats', fail)
+        resp = client.post(
+            '/upload/csv/commit',
+            files={'file': ('hands.csv', _csv(_lines(1, 2)).encode(), 'text/csv')},
+        )
+        assert resp.status_code == 500
+        assert client.get('/games').json() == []
@@ -0,0 +1,178 @@
+"""Tests for the streaming CSV pipeline behind the upload endpoints."""
+
+import csv
+import io
+
+import pytest
+
+from app.database.models import GameSession, Hand, PlayerHand
+from app.services import csv_import
+from conftest import SessionLocal
+from pydantic_models.csv_schema import (
+    CSV_COLUMNS,
+    iter_hand_groups,
+    iter_text_lines,
+    parse_csv,
+    validate_csv_rows,
+    validate_hand_groups,
+)
+
+
+def _csv(lines: list[str]) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_COLUMNS)
+    for line in lines:
+        writer.writerow(line.split(','))
+    return buf.getvalue().encode()
+
+
+def _hand(date: str, number: int, board: str = '2C,3D,4S,5H,6C') -> list[str]:
+    return [
+        f'{date},{number},Adam,AS,KH,{board},won,5',
+        f'{date},{number},Gil,JH,QD,{board},lost,-5',
+    ]
+
+
+def _upload(client, data: bytes, path: str = '/upload/csv'):
+    return client.post(path, files={'file': ('hands.csv', data, 'text/csv')})
+
+
+class TestTextLines:
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 4096])
+    def test_lines_survive_any_chunking(self, chunk_size):
+        text = 'a,b\r\n"Zoë\nQuoted",ü\n€,last'
+        stream = io.BytesIO(text.encode())
+        lines = list(iter_text_lines(stream, chunk_size=chunk_size))
+        assert ''.join(lines) == text
+        assert list(csv.reader(lines)) == list(csv.reader(io.StringIO(text)))
+
+    def test_invalid_utf8_raises(self):
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_text_lines(io.BytesIO(b'ok\n\xff\n')))
+
+
+class TestHandGroups:
+    def test_groups_consecutive_rows(self):
+        data = _csv(_hand('03-09-2026', 1) + _hand('03-09-2026', 2))
+        groups = list(iter_hand_groups(iter_text_lines(io.BytesIO(data))))
+        assert [key for key, _ in groups] == [('03-09-2026', '1'), ('03-09-2026', '2')]
+        assert all(len(rows) == 2 for _, rows in groups)
+
+    def test_header_checked_on_first_next(self):
+        groups = iter_hand_groups(['bad,header\n'])
+        with pytest.raises(ValueError, match='Invalid CSV header'):
+            next(groups)
+
+    def test_matches_batch_validation(self):
+        lines = _hand('03-09-2026', 1) + _hand('03-09-2026', 2, 'AS,3D,4S,5H,XX')
+        data = _csv(lines)
+        streamed = [
+            error
+            for _, _, errors in validate_hand_groups(
+                iter_hand_groups(iter_text_lines(io.BytesIO(data)))
+            )
+            for error in errors
+        ]
+        assert streamed == validate_csv_rows(parse_csv(data.decode()))
+        assert {e['row'] for e in streamed} == {4, 5}
+
+    def test_split_hand_reported(self):
+        lines = _hand('03-09-2026', 1)[:1] + _hand('03-09-2026', 2)
+        lines += _hand('03-09-2026', 1)[1:]
+        groups = iter_hand_groups(iter_text_lines(io.BytesIO(_csv(lines))))
+        errors = [e for _, _, errs in validate_hand_groups(groups) for e in errs]
+        assert len(errors) == 1
+        assert errors[0]['row'] == 5
+        assert 'must be contiguous' in errors[0]['message']
+
+
+class TestUploadReport:
+    def test_report_shape_unchanged(self, client):
+        lines = _hand('03-09-2026', 1) + _hand('03-09-2026', 2, 'AS,3D,4S,5H,XX')
+        resp = _upload(client, _csv(lines))
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body['valid'] is False
+        assert body['total_rows'] == 4
+        assert body['error_count'] == len(body['errors']) == 3
+
+    def test_valid_file(self, client):
+        body = _upload(client, _csv(_hand('03-09-2026', 1))).json()
+        assert body == {'errors': [], 'valid': True, 'total_rows': 2, 'error_count': 0}
+
+    def test_empty_file(self, client):
+        body = _upload(client, b'').json()
+        assert body['valid'] is True
+        assert body['total_rows'] == 0
+
+    def test_bad_utf8_after_first_chunk_reported(self, client):
+        # Past the first read chunk the response has already started
+        lines = [line for n in range(1, 1001) for line in _hand('03-09-2026', n)]
+        resp = _upload(client, _csv(lines) + b'\xff\xfe\n')
+        body = resp.json()
+        assert body['valid'] is False
+        assert 0 < body['total_rows'] < 2000
+        assert body['errors'][-1]['field'] == 'file'
+
+    def test_bad_utf8_in_first_chunk_is_400(self, client):
+        resp = _upload(client, _csv(_hand('03-09-2026', 1)) + b'\xff\n')
+        assert resp.status_code == 400
+
+
+class TestStreamedCommit:
+    def test_batches_share_games(self, client, monkeypatch):
+        monkeypatch.setattr('app.routes.upload.IMPORT_BATCH_HANDS', 2)
+        lines = []
+        for number in range(1, 6):
+            lines += _hand('03-09-2026', number)
+        lines += _hand('03-10-2026', 1)
+        resp = _upload(client, _csv(lines), '/upload/csv/commit')
+        assert resp.status_code == 201
+        assert resp.json() == {
+            'games_created': 2,
+            'hands_created': 6,
+            'players_created': 2,
+            'players_matched': 0,
+        }
+        db = SessionLocal()
+        try:
+            assert db.query(GameSession).count() == 2
+            assert db.query(Hand).count() == 6
+            assert db.query(PlayerHand).count() == 12
+        finally:
+            db.close()
+
+    def test_late_error_rolls_back_earlier_batches(self, client, monkeypatch):
+        monkeypatch.setattr('app.routes.upload.IMPORT_BATCH_HANDS', 1)
+        spy = []
+        original = csv_import.CSVImporter.add
+        monkeypatch.setattr(
+            csv_import.CSVImporter,
+            'add',
+            lambda self, groups: spy.append(len(groups)) or original(self, groups),
+        )
+        lines = _hand('03-09-2026', 1) + _hand('03-09-2026', 2)
+        lines += _hand('03-09-2026', 3, 'AS,3D,4S,5H,6C')
+        resp = _upload(client, _csv(lines), '/upload/csv/commit')
+        assert resp.status_code == 400
+        assert resp.json()['detail']['error_count'] == 1
+        assert spy == [1, 1]
+        assert client.get('/games').json() == []
+
+    def test_split_hand_is_rejected(self, client):
+        # Unlike the old whole-file parser, split rows are not merged
+        lines = _hand('03-09-2026', 1)[:1] + _hand('03-09-2026', 2)
+        lines += _hand('03-09-2026', 1)[1:]
+        resp = _upload(client, _csv(lines), '/upload/csv/commit')
+        assert resp.status_code == 400
+        [error] = resp.json()['detail']['errors']
+        assert error['row'] == 5
+        assert 'must be contiguous' in error['message']
+        assert client.get('/games').json() == []
+
+    def test_bad_utf8_is_400(self, client):
+        data = _csv(_hand('03-09-2026', 1)) + b'\xff\n'
+        resp = _upload(client, data, '/upload/csv/commit')
+        assert resp.status_code == 400
+        assert client.get('/games').json() == []
@@ -46,6 +46,11 @@ def setup_db():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def _no_detection(detection_pending):
+    """Detections are seeded by hand, so the queued jobs never run."""
+
+
 @pytest.fixture
 def client():
     app.dependency_overrides[get_db] = override_get_db
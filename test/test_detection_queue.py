@@ -0,0 +1,202 @@
+"""Tests for background card detection and GET /games/{id}/hands/image/{upload_id}?wait=."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.database.models import CardDetection, ImageUpload
+from app.routes.events import publish_upload
+from app.routes.images import DETECTION_MAX_WAIT
+from app.services.card_detector import MockCardDetector
+from app.services.detection_queue import (
+    DetectionQueue,
+    detection_queue,
+    store_detection,
+)
+from app.services.game_events import game_events
+from conftest import SessionLocal, engine
+
+
+class _FailingDetector:
+    def detect(self, image_path: str) -> list[dict]:
+        raise OSError('Corrupt image file')
+
+
+def _game(client) -> int:
+    resp = client.post(
+        '/games', json={'game_date': '2026-07-01', 'player_names': ['Ann', 'Ben']}
+    )
+    return resp.json()['game_id']
+
+
+def _upload(client, game_id: int) -> dict:
+    resp = client.post(
+        f'/games/{game_id}/hands/image',
+        files={'file': ('hand.jpg', b'\xff\xd8\xff\xe0' + b'\x00' * 96, 'image/jpeg')},
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def _stored(upload_id: int) -> tuple[str, int]:
+    with SessionLocal() as db:
+        status = db.get(ImageUpload, upload_id).status
+        count = db.query(CardDetection).filter_by(upload_id=upload_id).count()
+    return status, count
+
+
+@pytest.fixture
+def pending_upload(client, detection_pending):
+    game_id = _game(client)
+    upload = _upload(client, game_id)
+    return game_id, upload['upload_id']
+
+
+@pytest.fixture(scope='module')
+def started_queue():
+    queue = DetectionQueue()
+    queue.start(1, MockCardDetector)
+    yield queue
+    queue.shutdown()
+
+
+class TestDetectionQueue:
+    def test_zero_workers_leaves_queue_stopped(self):
+        queue = DetectionQueue()
+        queue.start(0, MockCardDetector)
+        assert not queue.started
+
+    def test_thread_fallback_stores_detections(self, pending_upload):
+        _, upload_id = pending_upload
+        upload = asyncio.run(
+            DetectionQueue().run(upload_id, 'hand.jpg', engine, MockCardDetector())
+        )
+        assert upload.status == 'detected'
+        assert _stored(upload_id) == ('detected', 7)
+
+    def test_worker_process_stores_detections(self, pending_upload, started_queue):
+        _, upload_id = pending_upload
+        # The job's detector is unused while workers are running
+        upload = asyncio.run(
+            started_queue.run(upload_id, 'hand.jpg', engine, _FailingDetector())
+        )
+        assert upload.status == 'detected'
+        assert _stored(upload_id) == ('detected', 7)
+
+    def test_failure_marks_upload_failed(self, pending_upload):
+        _, upload_id = pending_upload
+        upload = asyncio.run(
+            DetectionQueue().run(upload_id, 'hand.jpg', engine, _FailingDetector())
+        )
+        assert upload.status == 'failed'
+        assert _stored(upload_id) == ('failed', 0)
+
+    def test_result_stored_exactly_once(self, pending_upload):
+        _, upload_id = pending_upload
+        queue = DetectionQueue()
+
+        async def twice():
+            return await asyncio.gather(
+                queue.run(upload_id, 'hand.jpg', engine, MockCardDetector()),
+                queue.run(upload_id, 'hand.jpg', engine, MockCardDetector()),
+            )
+
+        first, second = asyncio.run(twice())
+        assert (first is None) != (second is None)
+        again = asyncio.run(
+            queue.run(upload_id, 'hand.jpg', engine, MockCardDetector())
+        )
+        assert again is None
+        assert store_detection(engine, upload_id, None) is None
+        assert _stored(upload_id) == ('detected', 7)
+
+    def test_resume_requeues_processing_uploads(self, client, detection_pending):
+        game_id = _game(client)
+        upload_ids = [_upload(client, game_id)['upload_id'] for _ in range(2)]
+        store_detection(engine, upload_ids[0], None)
+        finished = []
+        queue = DetectionQueue()
+
+        async def resume():
+            count = queue.resume(engine, MockCardDetector, finished.append)
+            await asyncio.gather(*queue._resumed)
+            return count
+
+        assert asyncio.run(resume()) == 1
+        assert [upload.upload_id for upload in finished] == [upload_ids[1]]
+        assert _stored(upload_ids[0]) == ('failed', 0)
+        assert _stored(upload_ids[1]) == ('detected', 7)
+
+
+class TestUploadDetection:
+    def test_upload_is_detected_in_background(self, client):
+        game_id = _game(client)
+        upload = _upload(client, game_id)
+        assert upload['status'] == 'processing'
+        resp = client.get(f'/games/{game_id}/hands/image/{upload["upload_id"]}')
+        data = resp.json()
+        assert data['status'] == 'detected'
+        assert len(data['detections']) == 7
+
+    def test_read_does_not_detect(self, client, pending_upload):
+        game_id, upload_id = pending_upload
+        data = client.get(f'/games/{game_id}/hands/image/{upload_id}').json()
+        assert data['status'] == 'processing'
+        assert data['detections'] == []
+        assert _stored(upload_id) == ('processing', 0)
+
+    def test_wait_returns_when_detection_finishes(self, client, pending_upload):
+        game_id, upload_id = pending_upload
+        result = {}
+
+        def poll():
+            start = time.monotonic()
+            result['response'] = client.get(
+                f'/games/{game_id}/hands/image/{upload_id}', params={'wait': 30}
+            )
+            result['elapsed'] = time.monotonic() - start
+
+        thread = threading.Thread(target=poll, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while game_events.subscriber_count(game_id) == 0:
+            assert time.monotonic() < deadline, 'poll never parked'
+            time.sleep(0.01)
+
+        publish_upload(
+            store_detection(engine, upload_id, MockCardDetector().detect(''))
+        )
+        thread.join(timeout=5)
+        assert not thread.is_alive(), 'poll did not return'
+        assert result['elapsed'] < 5
+        data = result['response'].json()
+        assert data['status'] == 'detected'
+        assert len(data['detections']) == 7
+
+    def test_wait_times_out_while_processing(self, client, pending_upload):
+        game_id, upload_id = pending_upload
+        resp = client.get(
+            f'/games/{game_id}/hands/image/{upload_id}', params={'wait': 0.2}
+        )
+        assert resp.status_code == 200
+        assert resp.json()['status'] == 'processing'
+        assert game_events.subscriber_count(game_id) == 0
+
+    def test_wait_bounded(self, client, pending_upload):
+        game_id, upload_id = pending_upload
+        resp = client.get(
+            f'/games/{game_id}/hands/image/{upload_id}',
+            params={'wait': DETECTION_MAX_WAIT + 1},
+        )
+        assert resp.status_code == 422
+
+    def test_missing_upload_404_with_wait(self, client):
+        game_id = _game(client)
+        resp = client.get(f'/games/{game_id}/hands/image/999', params={'wait': 5})
+        assert resp.status_code == 404
+
+
+def test_singleton_not_started_in_tests():
+    assert not detection_queue.started
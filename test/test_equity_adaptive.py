@@ -0,0 +1,101 @@
+"""Tests for adaptive Monte Carlo equity with confidence-interval stopping."""
+
+import numpy as np
+import pytest
+
+from app.services.equity import calculate_equity, estimate_equity
+
+AA_VS_72 = [[('A', 's'), ('A', 'h')], [('7', 'd'), ('2', 'c')]]
+AK_VS_QQ = [[('A', 's'), ('K', 's')], [('Q', 'h'), ('Q', 'd')]]
+FLOP = [('2', 'c'), ('7', 'd'), ('J', 's')]
+
+
+class TestEstimateEquity:
+    def test_stops_once_precision_is_met(self):
+        result = estimate_equity(
+            AK_VS_QQ, [], precision=0.01, rng=np.random.default_rng(3)
+        )
+        assert max(result.half_widths) <= 0.01
+        assert result.samples < 1_000_000
+        assert sum(result.equities) == pytest.approx(1.0)
+
+    def test_lopsided_spot_needs_fewer_samples(self):
+        lopsided = estimate_equity(
+            AA_VS_72, [], precision=0.005, rng=np.random.default_rng(1)
+        )
+        close = estimate_equity(
+            AK_VS_QQ, [], precision=0.005, rng=np.random.default_rng(1)
+        )
+        assert lopsided.samples < close.samples
+
+    def test_interval_covers_exact_equity(self):
+        exact = calculate_equity(AK_VS_QQ, [], exact=True)
+        result = estimate_equity(
+            AK_VS_QQ, [], precision=0.005, rng=np.random.default_rng(5)
+        )
+        for eq, hw, truth in zip(
+            result.equities, result.half_widths, exact, strict=True
+        ):
+            assert abs(eq - truth) <= 2 * hw
+
+    def test_sample_cap_is_respected(self):
+        result = estimate_equity(
+            AK_VS_QQ, [], precision=1e-6, batch_size=500, max_samples=1500
+        )
+        assert result.samples == 1500
+
+    def test_time_budget_stops_sampling(self):
+        result = estimate_equity(AK_VS_QQ, [], precision=None, time_budget=0.0)
+        assert result.samples == 2000
+
+    def test_flop_is_enumerated_exactly(self):
+        result = estimate_equity(AK_VS_QQ, FLOP)
+        assert result.half_widths == [0.0, 0.0]
+        assert result.equities == pytest.approx(calculate_equity(AK_VS_QQ, FLOP))
+
+    def test_single_player_short_circuits(self):
+        assert estimate_equity(AK_VS_QQ[:1], []).equities == [1.0]
+
+
+class TestAdaptiveEquityEndpoint:
+    @pytest.fixture
+    def hand_url(self, client):
+        resp = client.post(
+            '/games', json={'game_date': '2026-03-11', 'player_names': ['Alice', 'Bob']}
+        )
+        game_id = resp.json()['game_id']
+        resp = client.post(
+            f'/games/{game_id}/hands',
+            json={
+                'player_entries': [
+                    {'player_name': 'Alice', 'card_1': 'AS', 'card_2': 'KS'},
+                    {'player_name': 'Bob', 'card_1': 'QH', 'card_2': 'QD'},
+                ],
+            },
+        )
+        return f'/games/{game_id}/hands/{resp.json()["hand_number"]}'
+
+    def test_precision_reports_interval_and_samples(self, client, hand_url):
+        resp = client.get(f'{hand_url}/equity', params={'precision': 0.01})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data['samples'] > 0
+        assert data['confidence'] == 0.95
+        for entry in data['equities']:
+            assert entry['ci_low'] <= entry['equity'] <= entry['ci_high']
+            assert entry['ci_high'] - entry['ci_low'] <= 0.0201
+
+    def test_time_budget_alone_switches_to_sampling(self, client, hand_url):
+        resp = client.get(f'{hand_url}/equity', params={'time_budget_ms': 1})
+        assert resp.status_code == 200
+        assert resp.json()['samples'] >= 2000
+
+    def test_default_response_is_exact_without_interval(self, client, hand_url):
+        data = client.get(f'{hand_url}/equity').json()
+        assert 'samples' not in data
+        assert 'ci_low' not in data['equities'][0]
+
+    @pytest.mark.parametrize('precision', [0, -0.1, 0.9])
+    def test_invalid_precision_rejected(self, client, hand_url, precision):
+        resp = client.get(f'{hand_url}/equity', params={'precision': precision})
+        assert resp.status_code == 422
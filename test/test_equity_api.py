@@ -253,3 +253,30 @@ class TestEquityEndpointNullCardsExcluded:
         data = resp.json()
         total = sum(e['equity'] for e in data['equities'])
         assert abs(total - 1.0) < 0.02
+
+
+class TestEquityEndpointDeterministic:
+    """Preflop and flop equities are computed exactly, so repeat calls agree."""
+
+    def test_preflop_equity_identical_across_calls(self, client, game_with_players):
+        hand_number = _create_hand(
+            client,
+            game_with_players,
+            player_entries=[
+                {
+                    'player_name': 'Alice',
+                    'card_1': {'rank': 'A', 'suit': 'S'},
+                    'card_2': {'rank': 'K', 'suit': 'D'},
+                },
+                {
+                    'player_name': 'Bob',
+                    'card_1': {'rank': 'Q', 'suit': 'H'},
+                    'card_2': {'rank': 'J', 'suit': 'C'},
+                },
+            ],
+        )
+
+        url = f'/games/{game_with_players}/hands/{hand_number}/equity'
+        first = client.get(url).json()
+        second = client.get(url).json()
+        assert first == second
@@ -0,0 +1,141 @@
+"""Tests for the equity result cache and how card edits interact with it."""
+
+import pytest
+
+from app.services import equity
+from app.services.equity import (
+    EquityCache,
+    calculate_equity_cached,
+    equity_cache,
+    equity_cache_key,
+)
+
+AK_VS_QQ = [[('A', 's'), ('K', 's')], [('Q', 'h'), ('Q', 'd')]]
+FLOP = [('2', 'c'), ('7', 'd'), ('J', 's')]
+
+
+@pytest.fixture(autouse=True)
+def clear_equity_cache():
+    equity_cache.clear()
+    yield
+    equity_cache.clear()
+
+
+class TestEquityCacheKey:
+    def test_suit_isomorphic_spots_share_a_key(self):
+        relabelled = [[('A', 'h'), ('K', 'h')], [('Q', 's'), ('Q', 'c')]]
+        assert equity_cache_key(AK_VS_QQ, [])[0] == equity_cache_key(relabelled, [])[0]
+
+    def test_hole_card_order_is_ignored(self):
+        flipped = [[('K', 's'), ('A', 's')], [('Q', 'd'), ('Q', 'h')]]
+        assert equity_cache_key(AK_VS_QQ, FLOP) == equity_cache_key(flipped, FLOP)
+
+    def test_player_order_is_normalized_with_slots(self):
+        key, slots = equity_cache_key(AK_VS_QQ, FLOP)
+        swapped_key, swapped_slots = equity_cache_key(AK_VS_QQ[::-1], FLOP)
+        assert key == swapped_key
+        assert slots == swapped_slots[::-1]
+
+    def test_different_board_changes_key(self):
+        other = [('2', 'c'), ('7', 'd'), ('Q', 's')]
+        assert (
+            equity_cache_key(AK_VS_QQ, FLOP)[0] != equity_cache_key(AK_VS_QQ, other)[0]
+        )
+
+    def test_exact_and_sampled_keys_differ(self):
+        assert (
+            equity_cache_key(AK_VS_QQ, [], exact=True)[0]
+            != equity_cache_key(AK_VS_QQ, [], exact=False)[0]
+        )
+
+
+class TestEquityCache:
+    def test_lru_evicts_least_recently_used(self):
+        cache = EquityCache(maxsize=2)
+        cache.put('a', [1.0])
+        cache.put('b', [0.5, 0.5])
+        cache.get('a')
+        cache.put('c', [0.0, 1.0])
+        assert cache.get('a') == [1.0]
+        assert cache.get('b') is None
+
+    def test_sqlite_tier_survives_new_instance(self, tmp_path):
+        path = str(tmp_path / 'equity_cache.db')
+        EquityCache(path=path).put('k', [0.25, 0.75])
+        assert EquityCache(path=path).get('k') == [0.25, 0.75]
+
+    def test_invalidate_removes_from_both_tiers(self, tmp_path):
+        path = str(tmp_path / 'equity_cache.db')
+        cache = EquityCache(path=path)
+        cache.put('k', [0.25, 0.75])
+        cache.invalidate('k')
+        assert cache.get('k') is None
+        assert EquityCache(path=path).get('k') is None
+
+
+class TestCalculateEquityCached:
+    def test_repeat_call_skips_calculation(self, mocker):
+        spy = mocker.spy(equity, 'calculate_equity')
+        first = calculate_equity_cached(AK_VS_QQ, FLOP, exact=True)
+        second = calculate_equity_cached(AK_VS_QQ, FLOP, exact=True)
+        assert first == second
+        assert spy.call_count == 1
+
+    def test_swapped_players_get_their_own_equity(self):
+        forward = calculate_equity_cached(AK_VS_QQ, FLOP, exact=True)
+        backward = calculate_equity_cached(AK_VS_QQ[::-1], FLOP, exact=True)
+        assert backward == forward[::-1]
+
+
+class TestCardEditsKeepCachedEquity:
+    @pytest.fixture
+    def hand_url(self, client):
+        resp = client.post(
+            '/games', json={'game_date': '2026-03-11', 'player_names': ['Alice', 'Bob']}
+        )
+        game_id = resp.json()['game_id']
+        resp = client.post(
+            f'/games/{game_id}/hands',
+            json={
+                'flop_1': '2C',
+                'flop_2': '7D',
+                'flop_3': 'JS',
+                'player_entries': [
+                    {'player_name': 'Alice', 'card_1': 'AS', 'card_2': 'KS'},
+                    {'player_name': 'Bob', 'card_1': 'QH', 'card_2': 'QD'},
+                ],
+            },
+        )
+        return f'/games/{game_id}/hands/{resp.json()["hand_number"]}'
+
+    def _cached_key(self):
+        return equity_cache_key(AK_VS_QQ, FLOP, exact=True)[0]
+
+    def test_equity_request_populates_cache(self, client, hand_url):
+        client.get(f'{hand_url}/equity')
+        assert equity_cache.get(self._cached_key()) is not None
+
+    def _equities(self, client, hand_url):
+        resp = client.get(f'{hand_url}/equity')
+        return [e['equity'] for e in resp.json()['equities']]
+
+    def test_hole_card_patch_serves_new_cards(self, client, hand_url):
+        self._equities(client, hand_url)
+        resp = client.patch(
+            f'{hand_url}/players/Alice', json={'card_1': 'AH', 'card_2': 'KH'}
+        )
+        assert resp.status_code == 200
+        # Keys are content-addressed, so the old entry is never stale
+        assert equity_cache.get(self._cached_key()) is not None
+        expected = equity.calculate_equity(
+            [[('A', 'h'), ('K', 'h')], AK_VS_QQ[1]], FLOP, exact=True
+        )
+        assert self._equities(client, hand_url) == [round(e, 4) for e in expected]
+
+    def test_turn_patch_serves_new_board(self, client, hand_url):
+        self._equities(client, hand_url)
+        resp = client.patch(f'{hand_url}/turn', json={'turn': '3H'})
+        assert resp.status_code == 200
+        assert equity_cache.get(self._cached_key()) is not None
+        expected = equity.calculate_equity(AK_VS_QQ, FLOP + [('3', 'h')], exact=True)
+        assert self._equities(client, hand_url) == [round(e, 4) for e in expected]
@@ -0,0 +1,66 @@
+"""Tests for the lookup-table 7-card evaluator in app.services.equity."""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from app.services.equity import _best_score, _eval5, _to_internal
+
+DECK = [(r, s) for r in range(13) for s in range(4)]
+
+
+def _reference_score(cards):
+    """Best score over all 5-card subsets — the original evaluator."""
+    return max(_eval5(*combo) for combo in combinations(cards, 5))
+
+
+def _cards(*tokens):
+    return [_to_internal((t[:-1], t[-1])) for t in tokens]
+
+
+class TestMatchesReferenceEvaluator:
+    """The table evaluator must return exactly the _eval5 best-of-N score."""
+
+    @pytest.mark.parametrize('num_cards', [5, 6, 7])
+    def test_random_hands_match_reference(self, num_cards):
+        rng = random.Random(num_cards)
+        for _ in range(3000):
+            cards = rng.sample(DECK, num_cards)
+            assert _best_score(cards) == _reference_score(cards), cards
+
+    @pytest.mark.parametrize(
+        'tokens',
+        [
+            ('Ah', 'Kh', 'Qh', 'Jh', 'Th', '2c', '3d'),  # royal flush
+            ('Ah', '2h', '3h', '4h', '5h', 'Kc', 'Kd'),  # steel wheel
+            ('9s', '9h', '9d', '9c', 'Ks', 'Kh', '2d'),  # quads with pair
+            ('7s', '7h', '7d', '5c', '5s', '5h', 'Ad'),  # two trips
+            ('Ah', '2c', '3d', '4s', '5h', '9c', '9d'),  # wheel straight
+            ('2h', '5h', '8h', 'Jh', 'Kh', '3h', 'Ac'),  # six-card flush
+            ('Qs', 'Qh', '8d', '8c', '4s', '4h', 'Ad'),  # three pairs
+            ('2s', '4h', '6d', '8c', 'Ts', 'Qh', '3d'),  # high card
+        ],
+    )
+    def test_specific_hands_match_reference(self, tokens):
+        cards = _cards(*tokens)
+        assert _best_score(cards) == _reference_score(cards)
+
+
+class TestHandOrdering:
+    """Category ordering must be preserved across table lookups."""
+
+    def test_straight_flush_beats_quads(self):
+        sf = _cards('9h', '8h', '7h', '6h', '5h', '2c', '2d')
+        quads = _cards('Ah', 'Ad', 'Ac', 'As', 'Kh', '2c', '3d')
+        assert _best_score(sf) > _best_score(quads)
+
+    def test_wheel_loses_to_six_high_straight(self):
+        wheel = _cards('Ah', '2c', '3d', '4s', '5h', '9c', 'Jd')
+        six_high = _cards('2c', '3d', '4s', '5h', '6c', '9c', 'Jd')
+        assert _best_score(six_high) > _best_score(wheel)
+
+    def test_flush_beats_straight_on_same_cards(self):
+        flush = _cards('2h', '4h', '6h', '7h', '9h', '8c', '5d')
+        straight = _cards('2c', '4h', '6h', '7h', '9s', '8c', '5d')
+        assert _best_score(flush) > _best_score(straight)
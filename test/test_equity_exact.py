@@ -0,0 +1,113 @@
+"""Tests for exact equity enumeration with suit-isomorphism reduction."""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from app.services import equity_numpy
+from app.services.equity import calculate_equity
+
+AA_VS_KK = [[('A', 's'), ('A', 'h')], [('K', 's'), ('K', 'h')]]
+
+
+def _ids(*tokens):
+    ranks = '23456789TJQKA'
+    suits = 'hdcs'
+    return [ranks.index(t[0]) * 4 + suits.index(t[1]) for t in tokens]
+
+
+class TestCombinationIndex:
+    @pytest.mark.parametrize(('n', 'k'), [(6, 1), (7, 3), (10, 5), (12, 4)])
+    def test_matches_itertools(self, n, k):
+        index = equity_numpy._combination_index(n, k)
+        assert index.tolist() == [list(c) for c in combinations(range(n), k)]
+
+
+class TestSuitSymmetries:
+    def test_identity_always_present(self):
+        perms = equity_numpy.suit_symmetries([_ids('As', 'Kd'), _ids('Qh', 'Jc')], [])
+        assert perms == [(0, 1, 2, 3)]
+
+    def test_unused_suits_are_interchangeable(self):
+        # Only spades are known, so hearts, diamonds and clubs can be permuted
+        perms = equity_numpy.suit_symmetries([_ids('As', 'Ks'), _ids('Qs', 'Js')], [])
+        assert len(perms) == 6
+
+    def test_suits_shared_by_each_player_swap(self):
+        # AsAh vs KsKh: swap s<->h and/or d<->c
+        perms = equity_numpy.suit_symmetries([_ids('As', 'Ah'), _ids('Ks', 'Kh')], [])
+        assert len(perms) == 4
+
+
+class TestCanonicalRunouts:
+    def test_weights_cover_every_runout(self):
+        players = [_ids('As', 'Ks'), _ids('Qs', 'Js')]
+        used = set(players[0] + players[1])
+        deck = np.array([c for c in range(52) if c not in used])
+        runouts = deck[equity_numpy._combination_index(deck.size, 3)]
+        symmetries = equity_numpy.suit_symmetries(players, [])
+
+        reps, weights = equity_numpy.canonical_runouts(runouts, symmetries)
+
+        assert weights.sum() == runouts.shape[0]
+        assert reps.shape[0] < runouts.shape[0]
+
+    def test_reduced_equity_equals_full_enumeration(self, monkeypatch):
+        players = [_ids('As', 'Ah'), _ids('Ks', 'Kh')]
+        board = _ids('2c', '7d')
+
+        reduced = equity_numpy.exact_equity(players, board)
+        monkeypatch.setattr(equity_numpy, 'suit_symmetries', lambda p, b: [])
+        full = equity_numpy.exact_equity(players, board)
+
+        assert reduced == pytest.approx(full, abs=1e-12)
+
+
+class TestExactEquity:
+    def test_preflop_exact_is_deterministic(self):
+        r1 = calculate_equity(AA_VS_KK, [], exact=True)
+        r2 = calculate_equity(AA_VS_KK, [], exact=True)
+        assert r1 == r2
+
+    def test_aa_vs_kk_exact_value(self):
+        result = calculate_equity(AA_VS_KK, [], exact=True)
+        assert result[0] == pytest.approx(0.8264, abs=1e-4)
+        assert sum(result) == pytest.approx(1.0)
+
+    def test_exact_flop_matches_exhaustive_engine(self):
+        board = [('A', 'd'), ('K', 'd'), ('2', 'c')]
+        assert calculate_equity(AA_VS_KK, board, exact=True) == pytest.approx(
+            calculate_equity(AA_VS_KK, board)
+        )
+
+    def test_range_sums_add_up_to_full_enumeration(self):
+        players = [_ids('As', 'Ah'), _ids('Ks', 'Kh')]
+        board = _ids('2c', '7d')
+        total, weight = equity_numpy.exact_share_sums(players, board)
+        first, w1 = equity_numpy.exact_share_sums(players, board, 0, 5000)
+        rest, w2 = equity_numpy.exact_share_sums(players, board, 5000)
+        assert w1 + w2 == weight
+        assert [a + b for a, b in zip(first, rest, strict=True)] == pytest.approx(total)
+
+
+class TestStreetEquities:
+    @pytest.mark.parametrize(
+        'board', [[], _ids('2c', '7d', 'Jh'), _ids('2c', '7d', 'Jh', '3s')]
+    )
+    def test_reduced_streets_equal_full_enumeration(self, monkeypatch, board):
+        players = [_ids('As', 'Ah'), _ids('Ks', 'Kh')]
+
+        reduced = equity_numpy.street_equities(players, board)
+        monkeypatch.setattr(equity_numpy, 'suit_symmetries', lambda p, b: [])
+        full = equity_numpy.street_equities(players, board)
+
+        assert reduced.keys() == full.keys()
+        for street in full:
+            assert reduced[street] == pytest.approx(full[street], abs=1e-12)
+
+    def test_weights_count_every_board_with_the_dealt_cards(self):
+        players = [_ids('As', 'Ah'), _ids('Ks', 'Kh')]
+        sums = equity_numpy.street_share_sums(players, _ids('2c', '7d', 'Jh'))
+        assert sums['preflop'][1] == 1_712_304  # C(48, 5)
+        assert sums['flop'][1] == 990  # C(45, 2)
@@ -0,0 +1,84 @@
+"""Tests for the vectorized NumPy equity engine."""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.services import equity_numpy
+from app.services.equity import _best_score, calculate_equity
+
+AA_VS_KK = [[('A', 's'), ('A', 'h')], [('K', 's'), ('K', 'h')]]
+
+
+class TestScorePlayers:
+    """Vectorized scores must equal the scalar lookup evaluator."""
+
+    def test_matches_best_score_on_random_boards(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            cards = rng.sample(range(52), 9)
+            players = np.array([cards[0:2], cards[2:4]])
+            board = np.array([cards[4:9]])
+            scores = equity_numpy.score_players(players, board)
+            for p in range(2):
+                expected = _best_score(
+                    [(c // 4, c % 4) for c in cards[2 * p : 2 * p + 2] + cards[4:9]]
+                )
+                assert scores[0, p] == expected
+
+    def test_board_shares_split_ties(self):
+        scores = np.array([[5, 5, 1], [3, 9, 2]])
+        shares = equity_numpy.board_shares(scores)
+        assert shares.tolist() == [[0.5, 0.5, 0.0], [0.0, 1.0, 0.0]]
+
+
+class TestSampleRunouts:
+    def test_runouts_are_distinct_deck_cards(self):
+        deck = np.arange(10, 58) % 52
+        runouts = equity_numpy.sample_runouts(deck, 5, 1000, np.random.default_rng(1))
+        assert runouts.shape == (1000, 5)
+        assert all(len(set(row)) == 5 for row in runouts.tolist())
+        assert set(runouts.ravel().tolist()) <= set(deck.tolist())
+
+
+class TestNumpyEngine:
+    """calculate_equity(engine='numpy') agrees with the Python engine."""
+
+    @pytest.mark.parametrize(
+        'board',
+        [
+            [('A', 'd'), ('K', 'd'), ('2', 'c')],
+            [('2', 'c'), ('7', 'd'), ('J', 's'), ('3', 'h')],
+            [('2', 'c'), ('7', 'd'), ('J', 's'), ('3', 'h'), ('9', 'c')],
+        ],
+    )
+    def test_exhaustive_spots_match_python_engine(self, board):
+        python = calculate_equity(AA_VS_KK, board)
+        vectorized = calculate_equity(AA_VS_KK, board, engine='numpy')
+        assert vectorized == pytest.approx(python)
+
+    def test_preflop_monte_carlo_close_to_known_equity(self):
+        result = calculate_equity(AA_VS_KK, [], engine='numpy')
+        assert abs(result[0] - 0.81) < 0.04
+        assert sum(result) == pytest.approx(1.0)
+
+    def test_multiway_preflop_sums_to_one(self):
+        players = [
+            [('A', 's'), ('A', 'h')],
+            [('K', 's'), ('K', 'h')],
+            [('Q', 'c'), ('J', 'c')],
+            [('7', 'd'), ('2', 'c')],
+            [('9', 'h'), ('9', 'd')],
+            [('5', 's'), ('4', 's')],
+        ]
+        result = calculate_equity(players, [], engine='numpy')
+        assert len(result) == 6
+        assert sum(result) == pytest.approx(1.0)
+
+    def test_single_player_short_circuits(self):
+        assert calculate_equity([[('A', 's'), ('K', 'h')]], [], engine='numpy') == [1.0]
+
+    def test_unknown_engine_raises(self):
+        with pytest.raises(ValueError, match='Unknown equity engine'):
+            calculate_equity(AA_VS_KK, [], engine='gpu')
@@ -0,0 +1,119 @@
+"""Tests for the process-pool equity execution service."""
+
+import asyncio
+
+import pytest
+
+from app.services import equity_pool as pool_module
+from app.services.equity import (
+    calculate_equity,
+    calculate_street_equities,
+    equity_cache,
+    equity_cache_key,
+)
+from app.services.equity_pool import (
+    EquityPool,
+    calculate_equity_async,
+    calculate_street_equities_async,
+    shard_ranges,
+)
+
+AA_VS_KK = [[('A', 's'), ('A', 'h')], [('K', 's'), ('K', 'h')]]
+THREE_WAY = AA_VS_KK + [[('Q', 'c'), ('J', 'c')]]
+FLOP = [('2', 'c'), ('7', 'd'), ('J', 's')]
+
+
+def _ids(player_hole_cards):
+    ranks = '23456789TJQKA'
+    suits = 'hdcs'
+    return [
+        [ranks.index(r) * 4 + suits.index(s) for r, s in hc] for hc in player_hole_cards
+    ]
+
+
+@pytest.fixture(scope='module')
+def started_pool():
+    pool = EquityPool()
+    pool.start(2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clear_equity_cache():
+    equity_cache.clear()
+    yield
+    equity_cache.clear()
+
+
+class TestShardRanges:
+    def test_ranges_cover_total_without_overlap(self):
+        ranges = shard_ranges(10, 3)
+        assert ranges == [(0, 3), (3, 6), (6, 10)]
+
+    def test_more_shards_than_items(self):
+        assert shard_ranges(2, 8) == [(0, 1), (1, 2)]
+
+
+class TestEquityPool:
+    def test_zero_workers_leaves_pool_stopped(self):
+        pool = EquityPool()
+        pool.start(0)
+        assert not pool.started
+
+    def test_inline_fallback_matches_exact_equity(self):
+        result = asyncio.run(EquityPool().exact_equity(_ids(AA_VS_KK), []))
+        assert result == pytest.approx(calculate_equity(AA_VS_KK, [], exact=True))
+
+    def test_sharded_preflop_matches_exact_equity(self, started_pool):
+        result = asyncio.run(started_pool.exact_equity(_ids(THREE_WAY), []))
+        assert result == pytest.approx(
+            calculate_equity(THREE_WAY, [], exact=True), abs=1e-12
+        )
+
+    def test_small_spots_are_not_sharded(self, started_pool, mocker):
+        spy = mocker.spy(pool_module, 'shard_ranges')
+        asyncio.run(started_pool.exact_equity(_ids(AA_VS_KK), []))
+        asyncio.run(started_pool.exact_equity(_ids(AA_VS_KK), [12, 25, 38]))
+        assert spy.call_count == 1
+
+    def test_sharded_streets_match_one_enumeration(self, started_pool):
+        board = _ids([FLOP])[0]
+        result = asyncio.run(started_pool.street_equities(_ids(AA_VS_KK), board))
+        expected = calculate_street_equities(AA_VS_KK, FLOP)
+        assert result.keys() == expected.keys()
+        for street in expected:
+            assert result[street] == pytest.approx(expected[street], abs=1e-12)
+
+    def test_estimate_runs_on_worker(self, started_pool):
+        result = asyncio.run(started_pool.estimate_equity(AA_VS_KK, [], precision=0.01))
+        assert max(result.half_widths) <= 0.01
+        assert sum(result.equities) == pytest.approx(1.0)
+
+
+class TestCalculateEquityAsync:
+    def test_result_is_cached_under_exact_key(self):
+        result = asyncio.run(calculate_equity_async(AA_VS_KK, FLOP))
+        key, slots = equity_cache_key(AA_VS_KK, FLOP, exact=True)
+        assert [equity_cache.get(key)[s] for s in slots] == result
+
+    def test_cache_hit_skips_pool(self, mocker):
+        asyncio.run(calculate_equity_async(AA_VS_KK, FLOP))
+        spy = mocker.spy(EquityPool, 'exact_equity')
+        asyncio.run(calculate_equity_async(AA_VS_KK, FLOP))
+        assert spy.call_count == 0
+
+
+class TestCalculateStreetEquitiesAsync:
+    def test_streets_are_cached_under_exact_keys(self):
+        result = asyncio.run(calculate_street_equities_async(AA_VS_KK, FLOP))
+        assert list(result) == ['preflop', 'flop']
+        for street, board in [('preflop', []), ('flop', FLOP)]:
+            key, slots = equity_cache_key(AA_VS_KK, board, exact=True)
+            assert [equity_cache.get(key)[s] for s in slots] == result[street]
+
+    def test_cache_hit_skips_pool(self, mocker):
+        asyncio.run(calculate_street_equities_async(AA_VS_KK, FLOP))
+        spy = mocker.spy(EquityPool, 'street_equities')
+        asyncio.run(calculate_street_equities_async(AA_VS_KK, FLOP))
+        assert spy.call_count == 0
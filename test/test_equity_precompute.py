@@ -0,0 +1,126 @@
+"""Tests for whole-game equity precomputation on PATCH /games/{id}/complete."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.database.models import Hand, HandEquity
+from app.routes import hands
+from app.services import equity_precompute
+from app.services.equity import calculate_equity, equity_cache
+from app.services.equity_precompute import dealt_board, precompute_game_equities
+from app.services.versions import bump_versions
+from conftest import SessionLocal, engine
+
+AK_VS_QQ = [[('A', 's'), ('K', 's')], [('Q', 'h'), ('Q', 'd')]]
+FLOP = [('2', 'c'), ('7', 'd'), ('J', 's')]
+
+
+@pytest.fixture(autouse=True)
+def clear_equity_cache():
+    equity_cache.clear()
+    yield
+    equity_cache.clear()
+
+
+@pytest.fixture
+def game_id(game_id, client):
+    client.post(
+        f'/games/{game_id}/hands',
+        json={
+            'player_entries': [
+                {'player_name': 'Alice', 'card_1': 'AH', 'card_2': 'KH'},
+            ],
+        },
+    )
+    return game_id
+
+
+def _rows():
+    db = SessionLocal()
+    try:
+        return {
+            (row.hand_id, row.street): json.loads(row.equities)
+            for row in db.query(HandEquity).all()
+        }
+    finally:
+        db.close()
+
+
+class TestDealtBoard:
+    def test_partial_flop_is_no_board(self):
+        assert dealt_board(Hand(flop_1='2C', flop_2='7D')) == []
+
+    def test_stops_at_first_missing_street(self):
+        hand = Hand(flop_1='2C', flop_2='7D', flop_3='JS', river='9C')
+        assert dealt_board(hand) == ['2C', '7D', 'JS']
+
+
+class TestPrecomputeGameEquities:
+    def test_writes_one_row_per_dealt_street(self, client, game_id):
+        written = asyncio.run(precompute_game_equities(game_id, engine))
+        assert written == 2
+        assert {street for _, street in _rows()} == {'preflop', 'flop'}
+
+    def test_rows_hold_exact_equity_by_player(self, client, game_id):
+        asyncio.run(precompute_game_equities(game_id, engine))
+        flop = next(v for (_, street), v in _rows().items() if street == 'flop')
+        expected = calculate_equity(AK_VS_QQ, FLOP, exact=True)
+        assert sorted(flop.values()) == pytest.approx(sorted(expected))
+
+    def test_rerun_replaces_rows(self, client, game_id):
+        asyncio.run(precompute_game_equities(game_id, engine))
+        asyncio.run(precompute_game_equities(game_id, engine))
+        assert len(_rows()) == 2
+
+    def test_hand_edited_while_computing_is_skipped(self, client, game_id, mocker):
+        compute = equity_precompute.calculate_street_equities_async
+
+        async def edit_then_compute(*args):
+            with SessionLocal() as db:
+                hand = db.query(Hand).filter_by(game_id=game_id).first()
+                bump_versions(db, game_id, hand.hand_id)
+                db.commit()
+            return await compute(*args)
+
+        mocker.patch.object(
+            equity_precompute, 'calculate_street_equities_async', edit_then_compute
+        )
+        assert asyncio.run(precompute_game_equities(game_id, engine)) == 0
+        assert _rows() == {}
+
+
+class TestCompleteTriggersPrecompute:
+    def test_complete_stores_equities(self, client, game_id):
+        resp = client.patch(f'/games/{game_id}/complete')
+        assert resp.status_code == 200
+        assert len(_rows()) == 2
+
+    def test_equity_endpoint_serves_stored_rows(self, client, game_id, mocker):
+        client.patch(f'/games/{game_id}/complete')
+        equity_cache.clear()
+        spy = mocker.spy(hands, 'calculate_equity_async')
+        resp = client.get(f'/games/{game_id}/hands/1/equity')
+        assert resp.status_code == 200
+        assert len(resp.json()['equities']) == 2
+        assert spy.call_count == 0
+
+    def test_timeline_serves_stored_rows(self, client, game_id, mocker):
+        client.patch(f'/games/{game_id}/complete')
+        spy = mocker.spy(hands, 'calculate_street_equities_async')
+        resp = client.get(f'/games/{game_id}/hands/1/equity/timeline')
+        streets = [s['street'] for s in resp.json()['streets']]
+        assert streets == ['preflop', 'flop']
+        assert spy.call_count == 0
+
+    def test_card_edit_clears_stored_rows(self, client, game_id):
+        client.patch(f'/games/{game_id}/complete')
+        resp = client.patch(f'/games/{game_id}/hands/1/turn', json={'turn': '3H'})
+        assert resp.status_code == 200
+        assert len(_rows()) == 0
+
+    def test_delete_hand_clears_stored_rows(self, client, game_id):
+        client.patch(f'/games/{game_id}/complete')
+        assert client.delete(f'/games/{game_id}/hands/1').status_code == 204
+        assert len(_rows()) == 0
@@ -0,0 +1,193 @@
+"""Tests for hero-vs-range equity and POST /equity/range."""
+
+import numpy as np
+import pytest
+
+from app.services import equity_numpy, equity_range
+from app.services.equity import calculate_equity
+from app.services.equity_range import (
+    PREFLOP_TABLE_PATH,
+    class_combos,
+    class_equity,
+    class_name,
+    hand_class,
+    matchup_patterns,
+    parse_range,
+    range_equity,
+)
+
+CLASSES = {class_name(cls): cls for cls in range(169)}
+
+AK = [('A', 's'), ('K', 'd')]
+FLOP = [('2', 'c'), ('7', 'd'), ('J', 's')]
+
+
+class TestParseRange:
+    @pytest.mark.parametrize(
+        ('text', 'count'),
+        [
+            ('AA', 6),
+            ('QQ+', 18),
+            ('22-55', 24),
+            ('AKs', 4),
+            ('AKo', 12),
+            ('AK', 16),
+            ('ATs+', 16),
+            ('A2s-A5s', 16),
+            ('AsKs', 1),
+            ('QQ+,AKs', 22),
+        ],
+    )
+    def test_combo_counts(self, text, count):
+        assert len(parse_range(text)) == count
+
+    def test_case_insensitive(self):
+        assert parse_range('aks') == parse_range('AKs')
+
+    def test_weights_and_overrides(self):
+        combos = parse_range('AK:0.5,AKs')
+        assert sorted(set(combos.values())) == [0.5, 1.0]
+        assert sum(combos.values()) == pytest.approx(4 + 12 * 0.5)
+
+    def test_zero_weight_drops_combos(self):
+        assert len(parse_range('AA,KK:0')) == 6
+
+    @pytest.mark.parametrize('text', ['AX', 'AAs', 'AK:2', 'AK:x', '', 'AsAs', 'AK-QJ'])
+    def test_invalid_ranges_raise(self, text):
+        with pytest.raises(ValueError):
+            parse_range(text)
+
+
+class TestHandClass:
+    def test_every_combo_lands_in_one_of_169_classes(self):
+        counts = {}
+        for a in range(52):
+            for b in range(a):
+                cls = hand_class(a, b)
+                counts[cls] = counts.get(cls, 0) + 1
+        assert len(counts) == 169
+        assert sorted(set(counts.values())) == [4, 6, 12]
+
+    @pytest.mark.parametrize('cls', [0, 14, 155, 168, 25])
+    def test_class_combos_round_trip(self, cls):
+        assert {hand_class(*c) for c in class_combos(cls)} == {cls}
+
+    def test_class_name(self):
+        names = {class_name(hand_class(*c)) for c in parse_range('AKs,AKo,77')}
+        assert names == {'AKs', 'AKo', '77'}
+
+
+class TestRangeEquity:
+    def test_single_combo_matches_exact_equity(self):
+        result = range_equity(AK, 'QhQd', FLOP)
+        expected = calculate_equity([AK, [('Q', 'h'), ('Q', 'd')]], FLOP)[0]
+        assert result.equity == pytest.approx(expected)
+        assert result.method == 'exact'
+
+    def test_blocked_combos_are_removed(self):
+        # Hero holds As and Kd, the flop has Js
+        assert range_equity(AK, 'AA', FLOP).combos == 3
+        assert range_equity(AK, 'JJ', FLOP).combos == 3
+
+    def test_fully_blocked_range_raises(self):
+        with pytest.raises(ValueError, match='blocked'):
+            range_equity(AK, 'AsKd', [])
+
+    def test_weights_shift_equity(self):
+        heavy_aces = range_equity(AK, 'AA,22:0.1', FLOP).equity
+        heavy_deuces = range_equity(AK, 'AA:0.1,22', FLOP).equity
+        assert heavy_aces > heavy_deuces
+
+    def test_preflop_uses_class_table(self):
+        result = range_equity([('A', 's'), ('A', 'h')], 'KK', [])
+        assert result.method == 'preflop_table'
+        assert result.equity == pytest.approx(0.82, abs=0.01)
+
+    def test_preflop_matchups_are_memoized(self, mocker, missing_table):
+        range_equity([('T', 's'), ('9', 's')], '44', [])
+        spy = mocker.spy(equity_range, 'simulate_class_matchup')
+        range_equity([('T', 'h'), ('9', 'h')], '44', [])
+        assert spy.call_count == 0
+
+
+@pytest.fixture
+def missing_table(monkeypatch, tmp_path):
+    """Run without the shipped table, so matchups are simulated."""
+    monkeypatch.setattr(equity_range, 'PREFLOP_TABLE_PATH', str(tmp_path / 'no.npy'))
+    equity_range._preflop_table.cache_clear()
+    yield
+    equity_range._preflop_table.cache_clear()
+
+
+@pytest.fixture(scope='module')
+def table():
+    return np.load(PREFLOP_TABLE_PATH)
+
+
+class TestPreflopTable:
+    def test_table_is_complete_and_zero_sum(self, table):
+        assert table.shape == (169, 169)
+        assert not np.isnan(table).any()
+        assert np.allclose(table + table.T, 1.0)
+
+    @pytest.mark.parametrize(('hero', 'villain'), [('AA', 'KK'), ('AKs', 'QQ')])
+    def test_matchups_match_exact_equity(self, table, hero, villain):
+        patterns = matchup_patterns(CLASSES[hero], CLASSES[villain])
+        total = sum(patterns.values())
+        exact = 0.0
+        for (hero_cards, villain_cards), count in patterns.items():
+            sums, weight = equity_numpy.exact_share_sums(
+                [list(hero_cards), list(villain_cards)], []
+            )
+            exact += count / total * sums[0] / weight
+        assert table[CLASSES[hero], CLASSES[villain]] == pytest.approx(exact, abs=0.005)
+
+    def test_lookups_do_not_simulate(self, table, mocker):
+        equity_range._preflop_table.cache_clear()
+        spy = mocker.spy(equity_range, 'simulate_class_matchup')
+        equity = class_equity(CLASSES['AA'], CLASSES['KK'])
+        assert equity == pytest.approx(0.82, abs=0.01)
+        assert equity == pytest.approx(float(table[CLASSES['AA'], CLASSES['KK']]))
+        range_equity([('A', 's'), ('A', 'h')], '22+,A2+,K2+,Q2+,J2+', [])
+        assert spy.call_count == 0
+
+
+class TestRangeEquityEndpoint:
+    def test_returns_equity_and_combo_count(self, client):
+        resp = client.post(
+            '/equity/range',
+            json={
+                'hero_cards': ['AS', 'KD'],
+                'villain_range': 'QQ+,AKs',
+                'board': ['2C', '7D', 'JS'],
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert 0 < data['equity'] < 1
+        assert data['villain_combos'] == 14
+        assert data['method'] == 'exact'
+
+    def test_invalid_range_is_400(self, client):
+        resp = client.post(
+            '/equity/range', json={'hero_cards': ['AS', 'KD'], 'villain_range': 'ZZ'}
+        )
+        assert resp.status_code == 400
+
+    def test_duplicate_cards_are_400(self, client):
+        resp = client.post(
+            '/equity/range',
+            json={
+                'hero_cards': ['AS', 'KD'],
+                'villain_range': 'QQ',
+                'board': ['AS', '7D', 'JS'],
+            },
+        )
+        assert resp.status_code == 400
+
+    def test_partial_board_is_422(self, client):
+        resp = client.post(
+            '/equity/range',
+            json={'hero_cards': ['AS', 'KD'], 'villain_range': 'QQ', 'board': ['2C']},
+        )
+        assert resp.status_code == 422
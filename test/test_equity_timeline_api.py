@@ -0,0 +1,96 @@
+"""Tests for GET /games/{game_id}/hands/{hand_number}/equity/timeline."""
+
+import pytest
+
+from app.services import equity_numpy
+from app.services.equity import calculate_equity, equity_cache, equity_cache_key
+
+ALICE = {'player_name': 'Alice', 'card_1': 'AS', 'card_2': 'KD'}
+BOB = {'player_name': 'Bob', 'card_1': 'QH', 'card_2': 'JC'}
+BOARD = {'flop_1': '2C', 'flop_2': '7D', 'flop_3': 'JS', 'turn': '3H', 'river': '9C'}
+
+HOLE = [[('A', 's'), ('K', 'd')], [('Q', 'h'), ('J', 'c')]]
+COMMUNITY = [('2', 'c'), ('7', 'd'), ('J', 's'), ('3', 'h'), ('9', 'c')]
+
+
+@pytest.fixture(autouse=True)
+def clear_equity_cache():
+    equity_cache.clear()
+    yield
+    equity_cache.clear()
+
+
+@pytest.fixture
+def game_id(client):
+    resp = client.post(
+        '/games',
+        json={'game_date': '2026-03-11', 'player_names': ['Alice', 'Bob', 'Charlie']},
+    )
+    return resp.json()['game_id']
+
+
+def _timeline(client, game_id, community=None, entries=(ALICE, BOB)):
+    payload = dict(community or {})
+    payload['player_entries'] = list(entries)
+    hand_number = client.post(f'/games/{game_id}/hands', json=payload).json()[
+        'hand_number'
+    ]
+    return client.get(f'/games/{game_id}/hands/{hand_number}/equity/timeline')
+
+
+class TestTimelineStreets:
+    def test_full_board_returns_all_four_streets(self, client, game_id):
+        resp = _timeline(client, game_id, BOARD)
+        assert resp.status_code == 200
+        streets = [s['street'] for s in resp.json()['streets']]
+        assert streets == ['preflop', 'flop', 'turn', 'river']
+
+    def test_flop_only_returns_preflop_and_flop(self, client, game_id):
+        flop = {k: BOARD[k] for k in ('flop_1', 'flop_2', 'flop_3')}
+        resp = _timeline(client, game_id, flop)
+        streets = [s['street'] for s in resp.json()['streets']]
+        assert streets == ['preflop', 'flop']
+
+    def test_no_community_cards_returns_preflop_only(self, client, game_id):
+        resp = _timeline(client, game_id)
+        streets = [s['street'] for s in resp.json()['streets']]
+        assert streets == ['preflop']
+
+    def test_fewer_than_two_players_with_cards_is_empty(self, client, game_id):
+        resp = _timeline(client, game_id, BOARD, entries=(ALICE,))
+        assert resp.json() == {'streets': []}
+
+
+class TestTimelineValues:
+    def test_each_street_matches_single_street_equity(self, client, game_id):
+        resp = _timeline(client, game_id, BOARD)
+        by_street = {s['street']: s['equities'] for s in resp.json()['streets']}
+        for street, size in [('preflop', 0), ('flop', 3), ('turn', 4), ('river', 5)]:
+            expected = calculate_equity(HOLE, COMMUNITY[:size], exact=True)
+            got = [e['equity'] for e in by_street[street]]
+            assert got == pytest.approx([round(x, 4) for x in expected], abs=1e-4)
+
+    def test_player_names_attached(self, client, game_id):
+        resp = _timeline(client, game_id, BOARD)
+        for street in resp.json()['streets']:
+            assert [e['player_name'] for e in street['equities']] == ['Alice', 'Bob']
+
+    def test_streets_are_cached_for_the_equity_endpoint(self, client, game_id):
+        _timeline(client, game_id, BOARD)
+        for size in (0, 3, 4, 5):
+            key = equity_cache_key(HOLE, COMMUNITY[:size], exact=True)[0]
+            assert equity_cache.get(key) is not None
+
+    def test_enumerates_once_for_all_streets(self, client, game_id, mocker):
+        spy = mocker.spy(equity_numpy, 'street_share_sums')
+        _timeline(client, game_id, BOARD)
+        assert spy.call_count == 1
+
+
+class TestTimeline404:
+    def test_missing_game(self, client):
+        assert client.get('/games/999/hands/1/equity/timeline').status_code == 404
+
+    def test_missing_hand(self, client, game_id):
+        resp = client.get(f'/games/{game_id}/hands/99/equity/timeline')
+        assert resp.status_code == 404
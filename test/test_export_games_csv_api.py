@@ -0,0 +1,112 @@
+"""Tests for the streamed CSV exports: GET /games/export/csv and per game."""
+
+import csv
+import io
+
+import pytest
+
+from app.services import csv_export
+from conftest import SessionLocal
+from pydantic_models.csv_schema import CSV_COLUMNS, parse_csv
+
+
+def _game(client, game_date: str, hands: int) -> int:
+    resp = client.post(
+        '/games', json={'game_date': game_date, 'player_names': ['Ann', 'Ben']}
+    )
+    game_id = resp.json()['game_id']
+    for _ in range(hands):
+        client.post(
+            f'/games/{game_id}/hands',
+            json={
+                'flop_1': '2C',
+                'flop_2': '7D',
+                'flop_3': 'JS',
+                'player_entries': [
+                    {'player_name': 'Ann', 'result': 'won', 'profit_loss': 2.5},
+                    {'player_name': 'Ben', 'result': 'lost', 'profit_loss': -2.5},
+                ],
+            },
+        )
+    return game_id
+
+
+def _rows(resp) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(resp.text)))
+
+
+@pytest.fixture
+def season(client):
+    return [
+        _game(client, '2026-01-05', 2),
+        _game(client, '2026-02-10', 3),
+        _game(client, '2026-03-15', 1),
+    ]
+
+
+class TestExportGames:
+    def test_all_games(self, client, season):
+        resp = client.get('/games/export/csv')
+        assert resp.status_code == 200
+        assert resp.headers['content-type'].startswith('text/csv')
+        rows = _rows(resp)
+        assert rows[0] == CSV_COLUMNS
+        assert len(rows) == 1 + 2 * 6
+        dates = [row[0] for row in rows[1:]]
+        assert dates == sorted(dates, key=lambda d: (d[6:], d[:5]))
+
+    def test_date_range(self, client, season):
+        resp = client.get(
+            '/games/export/csv',
+            params={'date_from': '2026-02-01', 'date_to': '2026-03-15'},
+        )
+        rows = _rows(resp)[1:]
+        assert {row[0] for row in rows} == {'02-10-2026', '03-15-2026'}
+        assert len(rows) == 8
+        assert 'games_2026-02-01_2026-03-15.csv' in resp.headers['content-disposition']
+
+    def test_open_ended_range(self, client, season):
+        rows = _rows(client.get('/games/export/csv', params={'date_to': '2026-01-31'}))
+        assert {row[0] for row in rows[1:]} == {'01-05-2026'}
+
+    def test_empty_range_is_header_only(self, client, season):
+        resp = client.get('/games/export/csv', params={'date_from': '2027-01-01'})
+        assert _rows(resp) == [CSV_COLUMNS]
+
+    def test_inverted_range_400(self, client):
+        resp = client.get(
+            '/games/export/csv',
+            params={'date_from': '2026-03-01', 'date_to': '2026-02-01'},
+        )
+        assert resp.status_code == 400
+
+    def test_round_trips_through_import(self, client, season):
+        text = client.get('/games/export/csv').text
+        grouped = parse_csv(text)
+        assert len(grouped) == 6
+        assert all(len(rows) == 2 for rows in grouped.values())
+
+
+class TestStreaming:
+    def test_rows_written_in_batches(self, client, season, monkeypatch):
+        monkeypatch.setattr(csv_export, 'EXPORT_BATCH_ROWS', 4)
+        db = SessionLocal()
+        try:
+            chunks = list(csv_export.iter_csv(db, csv_export.export_rows_query()))
+        finally:
+            db.close()
+        assert chunks[0] == ','.join(CSV_COLUMNS) + '\r\n'
+        # 12 rows in batches of 4 after the header
+        assert [chunk.count('\n') for chunk in chunks] == [1, 4, 4, 4]
+        assert ''.join(chunks) == client.get('/games/export/csv').text
+
+    def test_single_game_matches_multi_game_rows(self, client, season):
+        single = _rows(client.get(f'/games/{season[1]}/export/csv'))
+        ranged = _rows(
+            client.get(
+                '/games/export/csv',
+                params={'date_from': '2026-02-10', 'date_to': '2026-02-10'},
+            )
+        )
+        assert single == ranged
+        assert single[1][11] == '2.5'
@@ -0,0 +1,221 @@
+"""Tests for the live game event stream: GET /games/{game_id}/events."""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+import pytest
+
+from app.routes import events as events_route
+from app.services.game_events import RESYNC, GameEventBroker, game_events
+
+# Set per game once a stream has read its first snapshot
+_snapshots_taken: defaultdict[int, threading.Event] = defaultdict(threading.Event)
+
+
+@pytest.fixture(autouse=True)
+def track_snapshots(monkeypatch):
+    """Lets _Stream wait for the snapshot, not just the subscription.
+
+    Tests share one SQLite connection between sessions, so a write made
+    while the snapshot is being read would show through half-applied.
+    """
+    original = events_route._snapshot
+
+    async def snapshot(db, game_id):
+        try:
+            return await original(db, game_id)
+        finally:
+            _snapshots_taken[game_id].set()
+
+    monkeypatch.setattr(events_route, '_snapshot', snapshot)
+    yield
+    _snapshots_taken.clear()
+
+
+def _game(client, players=('Ann', 'Ben')) -> int:
+    resp = client.post(
+        '/games', json={'game_date': '2026-04-02', 'player_names': list(players)}
+    )
+    return resp.json()['game_id']
+
+
+def _parse(body: str) -> list[tuple[str, object]]:
+    events = []
+    for block in body.strip().split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines())
+        if 'event' in fields:
+            events.append((fields['event'], json.loads(fields['data'])))
+    return events
+
+
+class _Stream:
+    """Reads one event stream on a thread until the server ends it."""
+
+    def __init__(self, client, game_id: int):
+        self.game_id = game_id
+        self.response = None
+        self._thread = threading.Thread(target=self._read, args=(client,), daemon=True)
+        self._thread.start()
+        assert _snapshots_taken[game_id].wait(5), 'stream never sent a snapshot'
+
+    def _read(self, client):
+        self.response = client.get(f'/games/{self.game_id}/events')
+
+    def events(self) -> list[tuple[str, object]]:
+        self._thread.join(timeout=5)
+        assert not self._thread.is_alive(), 'stream did not end'
+        return _parse(self.response.text)
+
+
+class TestEventStream:
+    def test_unknown_game_404(self, client):
+        assert client.get('/games/999/events').status_code == 404
+
+    def test_snapshot_then_deltas(self, client):
+        game_id = _game(client)
+        stream = _Stream(client, game_id)
+
+        client.post(
+            f'/games/{game_id}/hands',
+            json={'player_entries': [{'player_name': 'Ann'}]},
+        )
+        client.patch(
+            f'/games/{game_id}/hands/1/players/Ann',
+            json={'card_1': 'AS', 'card_2': 'KD'},
+        )
+        client.patch(
+            f'/games/{game_id}/hands/1/flop',
+            json={'flop_1': '2C', 'flop_2': '7D', 'flop_3': 'JS'},
+        )
+        client.patch(
+            f'/games/{game_id}/hands/1/players/Ann/result',
+            json={'result': 'won', 'profit_loss': 5.0},
+        )
+        client.delete(f'/games/{game_id}')
+
+        events = stream.events()
+        assert stream.response.headers['content-type'].startswith('text/event-stream')
+        assert [name for name, _ in events] == [
+            'snapshot',
+            'hand',
+            'player',
+            'board',
+            'player',
+            'game_deleted',
+        ]
+        snapshot, hand, joined, board, result, _ = (data for _, data in events)
+        assert snapshot is None
+        assert hand['hand_number'] == 1
+        assert {p['name']: p['participation_status'] for p in hand['players']} == {
+            'Ann': 'pending',
+            'Ben': 'idle',
+        }
+        assert joined['participation_status'] == 'joined'
+        assert joined['card_1'] == 'AS'
+        assert board['community_recorded'] is True
+        assert board['flop_3'] == 'JS'
+        assert result == {
+            'hand_number': 1,
+            'name': 'Ann',
+            'participation_status': 'won',
+            'card_1': 'AS',
+            'card_2': 'KD',
+            'result': 'won',
+            'outcome_street': None,
+        }
+
+    def test_snapshot_is_latest_hand_status(self, client):
+        game_id = _game(client)
+        client.post(f'/games/{game_id}/hands', json={})
+        client.post(
+            f'/games/{game_id}/hands',
+            json={'player_entries': [{'player_name': 'Ben', 'result': 'folded'}]},
+        )
+        stream = _Stream(client, game_id)
+        client.delete(f'/games/{game_id}')
+
+        (_, snapshot), _ = stream.events()
+        assert snapshot['hand_number'] == 2
+        assert {p['name']: p['participation_status'] for p in snapshot['players']} == {
+            'Ann': 'idle',
+            'Ben': 'folded',
+        }
+
+    def test_removals_and_game_status(self, client):
+        game_id = _game(client)
+        client.post(
+            f'/games/{game_id}/hands',
+            json={'player_entries': [{'player_name': 'Ann'}]},
+        )
+        stream = _Stream(client, game_id)
+
+        client.delete(f'/games/{game_id}/hands/1/players/Ann')
+        client.delete(f'/games/{game_id}/hands/1')
+        client.patch(f'/games/{game_id}/complete')
+        client.delete(f'/games/{game_id}')
+
+        events = stream.events()[1:]
+        assert events == [
+            (
+                'player',
+                {
+                    'hand_number': 1,
+                    'name': 'Ann',
+                    'participation_status': 'idle',
+                    'card_1': None,
+                    'card_2': None,
+                    'result': None,
+                    'outcome_street': None,
+                },
+            ),
+            ('hand_deleted', {'hand_number': 1}),
+            ('game', {'status': 'completed'}),
+            ('game_deleted', {'game_id': game_id}),
+        ]
+        assert game_events.subscriber_count(game_id) == 0
+
+    def test_other_games_not_streamed(self, client):
+        game_id = _game(client)
+        other_id = _game(client)
+        stream = _Stream(client, game_id)
+        client.post(f'/games/{other_id}/hands', json={})
+        client.delete(f'/games/{game_id}')
+        assert [name for name, _ in stream.events()] == ['snapshot', 'game_deleted']
+
+
+class TestBroker:
+    def test_publish_from_another_thread(self):
+        broker = GameEventBroker()
+
+        async def receive():
+            with broker.subscribe(1) as subscription:
+                thread = threading.Thread(
+                    target=broker.publish, args=(1, 'board', {'hand_number': 3})
+                )
+                thread.start()
+                thread.join()
+                return await asyncio.wait_for(subscription.get(), 1)
+
+        assert asyncio.run(receive()) == ('board', {'hand_number': 3})
+        assert broker.subscriber_count(1) == 0
+
+    def test_lagging_subscriber_gets_resync(self):
+        broker = GameEventBroker(max_queued=3)
+
+        async def receive():
+            with broker.subscribe(1) as subscription:
+                for n in range(5):
+                    broker.publish(1, 'player', n)
+                await asyncio.sleep(0)
+                first = await subscription.get()
+                second = await subscription.get()
+                return first, second
+
+        assert asyncio.run(receive()) == ((RESYNC, None), ('player', 4))
+
+    def test_publish_without_subscribers_is_noop(self):
+        broker = GameEventBroker()
+        broker.publish(1, 'hand', None)
+        assert broker.subscriber_count(1) == 0
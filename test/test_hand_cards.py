@@ -0,0 +1,108 @@
+"""Tests for the hand_cards search index and its maintenance on writes."""
+
+import csv
+import io
+
+from app.database.models import Hand, HandCard, PlayerHand
+from app.services.hand_cards import BOARD_LOCATIONS
+from conftest import SessionLocal
+from pydantic_models.card_codec import encode_card
+from pydantic_models.csv_schema import CSV_COLUMNS
+
+
+def _indexed() -> set:
+    db = SessionLocal()
+    try:
+        return {
+            (row.hand_id, row.player_hand_id, row.card_code, row.location)
+            for row in db.query(HandCard).all()
+        }
+    finally:
+        db.close()
+
+
+def _expected() -> set:
+    """What hand_cards should hold, derived from the card columns."""
+    db = SessionLocal()
+    try:
+        rows = set()
+        for hand in db.query(Hand).all():
+            for column, location in BOARD_LOCATIONS:
+                if (card := getattr(hand, column)) is not None:
+                    rows.add((hand.hand_id, None, encode_card(card), location))
+        for ph in db.query(PlayerHand).all():
+            for card in (ph.card_1, ph.card_2):
+                if card is not None:
+                    rows.add((ph.hand_id, ph.player_hand_id, encode_card(card), 'hole'))
+        return rows
+    finally:
+        db.close()
+
+
+class TestMaintenance:
+    def test_record_hand_indexes_every_card(self, client, game_id):
+        rows = _indexed()
+        assert len(rows) == 7
+        assert rows == _expected()
+
+    def test_edits_keep_index_in_sync(self, client, game_id):
+        base = f'/games/{game_id}/hands/1'
+        client.patch(f'{base}/turn', json={'turn': '3H'})
+        client.patch(f'{base}/river', json={'river': '4H'})
+        client.patch(f'{base}/players/Bob', json={'card_1': '9C', 'card_2': '9D'})
+        client.post(
+            f'{base}/players',
+            json={'player_name': 'Cara', 'card_1': '5S', 'card_2': '6S'},
+        )
+        client.patch(
+            base,
+            json={'flop_1': '8C', 'flop_2': '7D', 'flop_3': 'JS', 'turn': '3H'},
+        )
+        assert _indexed() == _expected()
+        client.delete(f'{base}/players/Alice')
+        assert _indexed() == _expected()
+
+    def test_delete_hand_and_game_remove_rows(self, client, game_id):
+        client.post(
+            f'/games/{game_id}/hands',
+            json={'flop_1': 'AH', 'flop_2': 'KH', 'flop_3': 'QH'},
+        )
+        client.delete(f'/games/{game_id}/hands/1')
+        assert _indexed() == _expected()
+        assert len(_indexed()) == 3
+        client.delete(f'/games/{game_id}')
+        assert _indexed() == set()
+
+    def test_csv_commit_indexes_cards(self, client):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(CSV_COLUMNS)
+        for line in (
+            '03-09-2026,1,Adam,AS,KH,2C,3D,4S,5H,6C,won,5',
+            '03-09-2026,1,Gil,JH,QD,2C,3D,4S,5H,6C,lost,-5',
+        ):
+            writer.writerow(line.split(','))
+        resp = client.post(
+            '/upload/csv/commit',
+            files={'file': ('hands.csv', buf.getvalue().encode(), 'text/csv')},
+        )
+        assert resp.status_code == 201
+        assert len(_indexed()) == 9
+        assert _indexed() == _expected()
+
+
+class TestSearchUsesIndex:
+    def test_board_and_hole_matches(self, client, game_id):
+        results = client.get('/hands', params={'card': 'JS'}).json()['results']
+        assert {r['player_hand']['player_name'] for r in results} == {'Alice', 'Bob'}
+        results = client.get('/hands', params={'card': 'QH'}).json()['results']
+        assert [r['player_hand']['player_name'] for r in results] == ['Bob']
+
+    def test_location_filters(self, client, game_id):
+        params = {'card': 'AS', 'location': 'community'}
+        assert client.get('/hands', params=params).json()['total'] == 0
+        params['location'] = 'hole'
+        assert client.get('/hands', params=params).json()['total'] == 1
+
+    def test_unknown_card_matches_nothing(self, client, game_id):
+        assert client.get('/hands', params={'card': 'ZZ'}).json()['total'] == 0
@@ -0,0 +1,109 @@
+"""Hand endpoints load players eagerly, in a number of queries independent of size."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from conftest import _async_engine_for, engine
+
+PLAYERS = ['Alice', 'Bob', 'Charlie', 'Dana']
+HOLE_CARDS = [('AS', 'KS'), ('QH', 'QD'), ('7C', '8C'), ('2D', '3D')]
+
+
+@contextmanager
+def count_queries():
+    statements: list[str] = []
+
+    def before(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Async routes run their statements on the async engine's sync_engine
+    engines = [engine, _async_engine_for(engine).sync_engine]
+    for target in engines:
+        event.listen(target, 'before_cursor_execute', before)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, 'before_cursor_execute', before)
+
+
+def _make_game(client, hands: int) -> int:
+    resp = client.post(
+        '/games', json={'game_date': '2026-03-11', 'player_names': PLAYERS}
+    )
+    game_id = resp.json()['game_id']
+    for _ in range(hands):
+        client.post(
+            f'/games/{game_id}/hands',
+            json={
+                'flop_1': '9H',
+                'flop_2': '10H',
+                'flop_3': 'JC',
+                'player_entries': [
+                    {'player_name': name, 'card_1': c1, 'card_2': c2}
+                    for name, (c1, c2) in zip(PLAYERS, HOLE_CARDS, strict=True)
+                ],
+            },
+        )
+    return game_id
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        '/games/{game_id}/hands',
+        '/games/{game_id}/hands/1',
+        '/games/{game_id}/export/csv',
+    ],
+)
+def test_query_count_does_not_grow_with_hands(client, path):
+    small = _make_game(client, 1)
+    large = _make_game(client, 6)
+
+    with count_queries() as small_queries:
+        assert client.get(path.format(game_id=small)).status_code == 200
+    with count_queries() as large_queries:
+        assert client.get(path.format(game_id=large)).status_code == 200
+
+    assert len(large_queries) == len(small_queries)
+    assert 0 < len(small_queries) <= 3
+
+
+def test_list_hands_includes_player_names(client):
+    game_id = _make_game(client, 2)
+    hands = client.get(f'/games/{game_id}/hands').json()
+    assert [ph['player_name'] for ph in hands[1]['player_hands']] == PLAYERS
+
+
+def test_results_response_reflects_update(client):
+    game_id = _make_game(client, 1)
+    resp = client.patch(
+        f'/games/{game_id}/hands/1/results',
+        json=[
+            {'player_name': 'alice', 'result': 'won', 'profit_loss': 30.0},
+            {'player_name': 'Bob', 'result': 'lost', 'profit_loss': -30.0},
+        ],
+    )
+    assert resp.status_code == 200
+    by_name = {ph['player_name']: ph for ph in resp.json()['player_hands']}
+    assert by_name['Alice']['result'] == 'won'
+    assert by_name['Bob']['profit_loss'] == -30.0
+
+
+def test_results_unknown_player_still_404s(client):
+    game_id = _make_game(client, 1)
+    client.post('/players', json={'name': 'Eve'})
+    resp = client.patch(
+        f'/games/{game_id}/hands/1/results',
+        json=[{'player_name': 'Eve', 'result': 'won', 'profit_loss': 1.0}],
+    )
+    assert resp.status_code == 404
+    assert 'not found in this hand' in resp.json()['detail']
+    resp = client.patch(
+        f'/games/{game_id}/hands/1/results',
+        json=[{'player_name': 'Nobody', 'result': 'won', 'profit_loss': 1.0}],
+    )
+    assert resp.status_code == 404
+    assert resp.json()['detail'] == "Player 'Nobody' not found"
@@ -0,0 +1,117 @@
+"""Tests for long-polling GET /games/{id}/hands/{n}/status?wait=&since_version=."""
+
+import threading
+import time
+
+import pytest
+
+from app.routes.hands import LONG_POLL_MAX_WAIT
+from app.services.game_events import game_events
+
+
+@pytest.fixture
+def hand(client):
+    resp = client.post(
+        '/games', json={'game_date': '2026-06-01', 'player_names': ['Ann', 'Ben']}
+    )
+    game_id = resp.json()['game_id']
+    client.post(
+        f'/games/{game_id}/hands', json={'player_entries': [{'player_name': 'Ann'}]}
+    )
+    status = client.get(f'/games/{game_id}/hands/1/status').json()
+    return game_id, status['version']
+
+
+class _Poll:
+    """Issues one long poll on a thread and waits until it is parked."""
+
+    def __init__(self, client, game_id: int, **params):
+        self.response = None
+        self.elapsed = None
+        url = f'/games/{game_id}/hands/1/status'
+
+        def run():
+            start = time.monotonic()
+            self.response = client.get(url, params=params)
+            self.elapsed = time.monotonic() - start
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 5
+        while game_events.subscriber_count(game_id) == 0:
+            assert time.monotonic() < deadline, 'poll never parked'
+            time.sleep(0.01)
+
+    def result(self):
+        self._thread.join(timeout=5)
+        assert not self._thread.is_alive(), 'poll did not return'
+        return self.response
+
+
+class TestLongPoll:
+    def test_stale_version_returns_at_once(self, client, hand):
+        game_id, version = hand
+        start = time.monotonic()
+        resp = client.get(
+            f'/games/{game_id}/hands/1/status',
+            params={'wait': 30, 'since_version': version - 1},
+        )
+        assert time.monotonic() - start < 5
+        assert resp.json()['version'] == version
+
+    def test_write_wakes_parked_request(self, client, hand):
+        game_id, version = hand
+        poll = _Poll(client, game_id, wait=30, since_version=version)
+        client.patch(
+            f'/games/{game_id}/hands/1/players/Ann',
+            json={'card_1': 'AS', 'card_2': 'KD'},
+        )
+        resp = poll.result()
+        assert poll.elapsed < 5
+        data = resp.json()
+        assert data['version'] == version + 1
+        ann = next(p for p in data['players'] if p['name'] == 'Ann')
+        assert ann['participation_status'] == 'joined'
+        assert game_events.subscriber_count(game_id) == 0
+
+    def test_other_hand_does_not_answer(self, client, hand):
+        game_id, version = hand
+        poll = _Poll(client, game_id, wait=0.5, since_version=version)
+        client.post(f'/games/{game_id}/hands', json={})
+        resp = poll.result()
+        assert poll.elapsed >= 0.5
+        assert resp.json()['version'] == version
+
+    def test_timeout_returns_current_status(self, client, hand):
+        game_id, version = hand
+        resp = client.get(
+            f'/games/{game_id}/hands/1/status',
+            params={'wait': 0.2, 'since_version': version},
+        )
+        assert resp.status_code == 200
+        assert resp.json()['version'] == version
+
+    def test_timeout_with_etag_is_304(self, client, hand):
+        game_id, version = hand
+        url = f'/games/{game_id}/hands/1/status'
+        etag = client.get(url).headers['etag']
+        resp = client.get(
+            url,
+            params={'wait': 0.2, 'since_version': version},
+            headers={'If-None-Match': etag},
+        )
+        assert resp.status_code == 304
+
+    def test_deleted_hand_is_404(self, client, hand):
+        game_id, version = hand
+        poll = _Poll(client, game_id, wait=30, since_version=version)
+        client.delete(f'/games/{game_id}/hands/1')
+        assert poll.result().status_code == 404
+
+    def test_wait_bounded(self, client, hand):
+        game_id, version = hand
+        resp = client.get(
+            f'/games/{game_id}/hands/1/status',
+            params={'wait': LONG_POLL_MAX_WAIT + 1, 'since_version': version},
+        )
+        assert resp.status_code == 422
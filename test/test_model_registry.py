@@ -0,0 +1,148 @@
+"""Tests for the process-wide card detection model registry."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from app.routes import images
+from app.services.model_registry import (
+    ModelRegistry,
+    RegisteredCardDetector,
+    model_registry,
+)
+
+
+class _FakeModel:
+    """Stands in for YoloCardDetector; records loads and warmups."""
+
+    def __init__(self, weights_path: str, log: list):
+        with open(weights_path) as f:
+            self.contents = f.read()
+        if self.contents == 'corrupt':
+            raise RuntimeError('bad weights')
+        self.warmed = False
+        log.append(self)
+
+    def warmup(self) -> None:
+        self.warmed = True
+
+    def detect(self, image_path: str) -> list[dict]:
+        return [{'card_position': 'card_1', 'detected_value': self.contents}]
+
+
+@pytest.fixture
+def weights(tmp_path):
+    path = tmp_path / 'best.pt'
+    path.write_text('v1')
+    return path
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def registry(loads):
+    return ModelRegistry(loader=lambda path: _FakeModel(path, loads))
+
+
+def _replace(path, contents: str) -> None:
+    path.write_text(contents)
+    # Make sure the mtime moves even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestModelRegistry:
+    def test_loads_and_warms_once(self, registry, loads, weights):
+        first = registry.get(str(weights))
+        assert registry.get(str(weights)) is first
+        assert len(loads) == 1
+        assert first.warmed
+
+    def test_concurrent_first_use_loads_once(self, registry, loads, weights):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get(str(weights))))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(loads) == 1
+        assert all(model is loads[0] for model in results)
+
+    def test_changed_file_is_reloaded(self, registry, loads, weights):
+        assert registry.detect(str(weights), 'x.jpg')[0]['detected_value'] == 'v1'
+        _replace(weights, 'v2')
+        assert registry.detect(str(weights), 'x.jpg')[0]['detected_value'] == 'v2'
+        assert len(loads) == 2
+
+    def test_failed_reload_keeps_previous_model(self, registry, loads, weights):
+        first = registry.get(str(weights))
+        _replace(weights, 'corrupt')
+        assert registry.get(str(weights)) is first
+        assert registry.get(str(weights)) is first
+        _replace(weights, 'v3')
+        assert registry.get(str(weights)).contents == 'v3'
+
+    def test_first_load_failure_raises(self, registry, weights):
+        weights.write_text('corrupt')
+        with pytest.raises(RuntimeError):
+            registry.get(str(weights))
+
+    def test_missing_file(self, registry, weights):
+        with pytest.raises(FileNotFoundError):
+            registry.get(str(weights.with_name('missing.pt')))
+        first = registry.get(str(weights))
+        weights.unlink()
+        assert registry.get(str(weights)) is first
+
+    def test_inference_is_serialized_per_model(self, loads, weights):
+        running = []
+        overlapped = []
+
+        class SlowModel(_FakeModel):
+            def detect(self, image_path):
+                running.append(image_path)
+                overlapped.append(len(running) > 1)
+                time.sleep(0.02)
+                running.remove(image_path)
+                return []
+
+        registry = ModelRegistry(loader=lambda path: SlowModel(path, loads))
+        threads = [
+            threading.Thread(target=registry.detect, args=(str(weights), f'{i}.jpg'))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert overlapped == [False] * 4
+
+
+class TestRegisteredCardDetector:
+    def test_loads_on_first_use(self, registry, loads, weights):
+        detector = RegisteredCardDetector(str(weights), registry)
+        assert loads == []
+        detector.warmup()
+        assert len(loads) == 1
+        assert detector.detect('x.jpg')[0]['detected_value'] == 'v1'
+        assert len(loads) == 1
+
+    def test_get_card_detector_uses_shared_registry(self, monkeypatch, weights):
+        monkeypatch.setattr(images, '_WEIGHTS_PATH', str(weights))
+        detector = images.get_card_detector()
+        assert isinstance(detector, RegisteredCardDetector)
+        assert detector.weights_path == str(weights)
+        assert detector._registry is model_registry
+
+    def test_get_card_detector_without_weights(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(images, '_WEIGHTS_PATH', str(tmp_path / 'a.pt'))
+        monkeypatch.setattr(images, '_WEIGHTS_PATH_FALLBACK', str(tmp_path / 'b.pt'))
+        assert not isinstance(images.get_card_detector(), RegisteredCardDetector)
@@ -0,0 +1,158 @@
+"""Tests for the incrementally maintained player_stats_agg table."""
+
+import pytest
+
+from app.database.models import PlayerStatsAgg
+from app.services.player_stats import OVERALL_GAME_ID, rebuild_player_stats
+from conftest import SessionLocal, new_game
+
+COLUMNS = (
+    'hands_played',
+    'hands_won',
+    'hands_lost',
+    'hands_folded',
+    'total_profit_loss',
+    'turn_reached',
+    'river_reached',
+    'sessions_played',
+)
+
+
+def _snapshot() -> dict:
+    db = SessionLocal()
+    try:
+        return {
+            (agg.player_id, agg.game_id): tuple(
+                round(getattr(agg, c), 6) for c in COLUMNS
+            )
+            for agg in db.query(PlayerStatsAgg).all()
+        }
+    finally:
+        db.close()
+
+
+def _rebuilt() -> dict:
+    db = SessionLocal()
+    try:
+        rebuild_player_stats(db)
+        db.commit()
+    finally:
+        db.close()
+    return _snapshot()
+
+
+def _hand(client, game_id, alice_result='won', alice_pl=20.0, turn=None):
+    body = {
+        'flop_1': '2C',
+        'flop_2': '7D',
+        'flop_3': 'JS',
+        'player_entries': [
+            {
+                'player_name': 'Alice',
+                'card_1': 'AS',
+                'card_2': 'KS',
+                'result': alice_result,
+                'profit_loss': alice_pl,
+            },
+            {
+                'player_name': 'Bob',
+                'card_1': 'QH',
+                'card_2': 'QD',
+                'result': 'lost',
+                'profit_loss': -alice_pl,
+            },
+        ],
+    }
+    if turn:
+        body['turn'] = turn
+    resp = client.post(f'/games/{game_id}/hands', json=body)
+    assert resp.status_code == 201
+    return resp.json()['hand_number']
+
+
+@pytest.fixture
+def two_games(client):
+    g1 = new_game(client, ['Alice', 'Bob'], '2026-03-11')
+    g2 = new_game(client, ['Alice', 'Bob'], '2026-03-12')
+    _hand(client, g1)
+    _hand(client, g1, 'folded', 0.0, turn='3H')
+    _hand(client, g2, 'won', 50.0)
+    return g1, g2
+
+
+class TestIncrementalMaintenance:
+    def test_record_hand_writes_game_and_career_rows(self, client, two_games):
+        g1, g2 = two_games
+        rows = _snapshot()
+        alice = next(pid for pid, gid in rows if gid == g1)
+        assert rows[(alice, g1)][:3] == (2, 1, 0)
+        assert rows[(alice, OVERALL_GAME_ID)][0] == 3
+        assert rows[(alice, OVERALL_GAME_ID)][-1] == 2
+
+    def test_matches_rebuild_after_edits(self, client, two_games):
+        g1, g2 = two_games
+        client.patch(
+            f'/games/{g1}/hands/1/players/Alice/result',
+            json={'result': 'lost', 'profit_loss': -5.0},
+        )
+        client.patch(
+            f'/games/{g1}/hands/2/results',
+            json=[{'player_name': 'Bob', 'result': 'won', 'profit_loss': 9.0}],
+        )
+        client.patch(f'/games/{g2}/hands/1/turn', json={'turn': '4H'})
+        client.patch(f'/games/{g2}/hands/1/river', json={'river': '5H'})
+        client.delete(f'/games/{g1}/hands/2/players/Bob')
+        assert _snapshot() == _rebuilt()
+
+    def test_delete_hand_and_game(self, client, two_games):
+        g1, g2 = two_games
+        assert client.delete(f'/games/{g1}/hands/1').status_code == 204
+        assert _snapshot() == _rebuilt()
+        assert client.delete(f'/games/{g2}').status_code == 204
+        rows = _snapshot()
+        assert rows == _rebuilt()
+        assert {gid for _, gid in rows} == {g1, OVERALL_GAME_ID}
+
+    def test_career_row_is_summed_not_shifted(self, client, two_games):
+        # A career row that missed a concurrent game's update...
+        g1, g2 = two_games
+        db = SessionLocal()
+        try:
+            db.query(PlayerStatsAgg).filter(
+                PlayerStatsAgg.game_id == OVERALL_GAME_ID
+            ).update({'hands_played': 1, 'total_profit_loss': 0.0})
+            db.commit()
+        finally:
+            db.close()
+        # ...is rebuilt from the per-game rows by the next write
+        client.patch(f'/games/{g2}/hands/1/turn', json={'turn': '4H'})
+        assert _snapshot() == _rebuilt()
+
+    def test_removing_last_result_drops_rows(self, client):
+        game_id = new_game(client, ['Alice', 'Bob'])
+        _hand(client, game_id)
+        client.delete(f'/games/{game_id}/hands/1')
+        assert _snapshot() == {}
+
+
+class TestStatsEndpointsReadAggregates:
+    def test_player_stats(self, client, two_games):
+        data = client.get('/stats/players/alice').json()
+        assert data['total_hands_played'] == 3
+        assert data['hands_won'] == 2
+        assert data['hands_folded'] == 1
+        assert data['total_profit_loss'] == 70.0
+        assert data['avg_profit_loss_per_session'] == 35.0
+        assert data['turn_pct'] == 33.33
+
+    def test_leaderboard(self, client, two_games):
+        board = client.get('/stats/leaderboard').json()
+        assert [e['player_name'] for e in board] == ['Alice', 'Bob']
+        assert board[1]['total_profit_loss'] == -70.0
+
+    def test_game_stats(self, client, two_games):
+        g1, _ = two_games
+        entries = client.get(f'/stats/games/{g1}').json()['player_stats']
+        by_name = {e['player_name']: e for e in entries}
+        assert by_name['Alice']['hands_played'] == 2
+        assert by_name['Bob']['profit_loss'] == -20.0
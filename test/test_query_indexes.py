@@ -0,0 +1,54 @@
+"""Secondary indexes are created and picked up by SQLite for the hot lookups."""
+
+import pytest
+from sqlalchemy import text
+
+from conftest import engine
+
+
+def _plan(sql: str) -> str:
+    with engine.connect() as conn:
+        return ' | '.join(
+            row[-1] for row in conn.execute(text(f'EXPLAIN QUERY PLAN {sql}'))
+        )
+
+
+@pytest.mark.parametrize(
+    'table, name',
+    [
+        ('players', 'ix_players_name_lower'),
+        ('game_sessions', 'ix_game_sessions_game_date'),
+        ('player_hands', 'ix_player_hands_player_result'),
+        ('hand_cards', 'ix_hand_cards_card_hand'),
+        ('hand_cards', 'ix_hand_cards_hand_id'),
+        ('image_uploads', 'ix_image_uploads_game_id'),
+    ],
+)
+def test_index_exists(table, name):
+    # Read sqlite_master directly: the inspector skips expression indexes
+    with engine.connect() as conn:
+        names = conn.execute(
+            text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t"
+            ),
+            {'t': table},
+        ).scalars()
+        assert name in set(names)
+
+
+def test_case_insensitive_name_lookup_uses_expression_index():
+    plan = _plan("SELECT * FROM players WHERE lower(name) = 'alice'")
+    assert 'ix_players_name_lower' in plan
+
+
+def test_player_result_filter_uses_composite_index():
+    plan = _plan(
+        'SELECT * FROM player_hands WHERE player_id = 1 '
+        "AND result IS NOT NULL AND result != 'handed_back'"
+    )
+    assert 'ix_player_hands_player_result' in plan
+
+
+def test_card_search_uses_hand_cards_index():
+    plan = _plan('SELECT hand_id FROM hand_cards WHERE card_code = 51')
+    assert 'ix_hand_cards_card_hand' in plan
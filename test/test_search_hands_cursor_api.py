@@ -0,0 +1,107 @@
+"""Tests for keyset (cursor) pagination on GET /hands."""
+
+import pytest
+
+from app.routes import search
+
+
+@pytest.fixture(autouse=True)
+def clear_total_cache():
+    search._total_cache.clear()
+    yield
+    search._total_cache.clear()
+
+
+@pytest.fixture
+def history(client):
+    """Two games on the same date plus one later game; 2 players per hand."""
+    for game_date, hands in [('2026-01-05', 3), ('2026-01-05', 2), ('2026-02-01', 4)]:
+        resp = client.post(
+            '/games', json={'game_date': game_date, 'player_names': ['Ann', 'Ben']}
+        )
+        game_id = resp.json()['game_id']
+        for _ in range(hands):
+            client.post(
+                f'/games/{game_id}/hands',
+                json={
+                    'flop_1': '2C',
+                    'flop_2': '7D',
+                    'flop_3': 'JS',
+                    'player_entries': [
+                        {'player_name': 'Ann', 'result': 'won', 'profit_loss': 1},
+                        {'player_name': 'Ben', 'result': 'lost', 'profit_loss': -1},
+                    ],
+                },
+            )
+    return 18
+
+
+def _walk(client, params: dict) -> list[dict]:
+    pages = []
+    cursor = ''
+    while cursor is not None:
+        resp = client.get('/hands', params={**params, 'cursor': cursor})
+        assert resp.status_code == 200
+        pages.append(resp.json())
+        cursor = resp.json()['next_cursor']
+    return pages
+
+
+def _key(result: dict) -> tuple:
+    return (
+        result['game_date'],
+        result['hand_number'],
+        result['player_hand']['player_hand_id'],
+    )
+
+
+class TestCursorPaging:
+    def test_walk_matches_offset_order(self, client, history):
+        offset = client.get('/hands', params={'per_page': 200}).json()['results']
+        pages = _walk(client, {'per_page': 4})
+        walked = [r for page in pages for r in page['results']]
+        assert [_key(r) for r in walked] == [_key(r) for r in offset]
+        assert len(walked) == history
+        assert [_key(r) for r in walked] == sorted(_key(r) for r in walked)
+
+    def test_last_page_has_no_cursor(self, client, history):
+        pages = _walk(client, {'per_page': 6})
+        assert len(pages) == 3
+        assert pages[-1]['next_cursor'] is None
+        assert all(p['page'] is None for p in pages)
+
+    def test_filters_apply_across_pages(self, client, history):
+        pages = _walk(client, {'per_page': 2, 'player': 'ben'})
+        names = {r['player_hand']['player_name'] for p in pages for r in p['results']}
+        assert names == {'Ben'}
+        assert sum(len(p['results']) for p in pages) == 9
+        assert pages[0]['total'] == 9
+
+    def test_total_is_cached_per_filter_set(self, client, history, mocker):
+        spy = mocker.spy(search, '_cached_total')
+        pages = _walk(client, {'per_page': 5})
+        assert {p['total'] for p in pages} == {history}
+        assert spy.call_count == len(pages)
+        assert len(search._total_cache) == 1
+
+    def test_total_can_be_skipped(self, client, history):
+        resp = client.get('/hands', params={'cursor': '', 'include_total': False})
+        assert resp.json()['total'] is None
+
+    def test_invalid_cursor_400(self, client, history):
+        resp = client.get('/hands', params={'cursor': 'not-a-cursor'})
+        assert resp.status_code == 400
+
+
+class TestCursorCodec:
+    def test_round_trip(self):
+        from datetime import date
+
+        cursor = search.encode_cursor(date(2026, 1, 5), 3, 42)
+        assert search.decode_cursor(cursor) == (date(2026, 1, 5), 3, 42)
+
+    def test_offset_mode_unchanged(self, client, history):
+        data = client.get('/hands', params={'page': 2, 'per_page': 5}).json()
+        assert data['page'] == 2
+        assert data['total'] == history
+        assert data['next_cursor'] is None
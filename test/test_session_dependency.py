@@ -1,5 +1,6 @@
 """Tests for the shared database session dependency (T-010)."""
 
+import ast
 import importlib
 import inspect
 import sys
@@ -52,8 +53,15 @@ class TestSessionModuleExists:
 class TestSharedGetDbWorksWithOverride:
     def test_conftest_overrides_shared_get_db(self):
         """conftest.py must override the shared get_db from session.py."""
-        conftest_src = Path('test/conftest.py').read_text()
-        assert 'from app.database.session import get_db' in conftest_src, (
+        conftest_tree = ast.parse(Path('test/conftest.py').read_text())
+        imported = {
+            alias.name
+            for node in ast.walk(conftest_tree)
+            if isinstance(node, ast.ImportFrom)
+            and node.module == 'app.database.session'
+            for alias in node.names
+        }
+        assert 'get_db' in imported, (
             'conftest.py must import get_db from app.database.session'
         )
 
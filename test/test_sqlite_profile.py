@@ -0,0 +1,74 @@
+"""Tests for the SQLite engine profiles built by app.database.session."""
+
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.database import session
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f'PRAGMA {name}').scalar()
+
+
+class TestTunedProfile:
+    def test_pragmas_applied(self, tmp_path):
+        engine = session.create_db_engine(f'sqlite:///{tmp_path}/t.db', 'tuned')
+        try:
+            assert _pragma(engine, 'journal_mode') == 'wal'
+            assert _pragma(engine, 'synchronous') == 1  # NORMAL
+            assert _pragma(engine, 'busy_timeout') == 5000
+            assert _pragma(engine, 'cache_size') == -65536
+            assert _pragma(engine, 'mmap_size') == 256 * 1024 * 1024
+        finally:
+            engine.dispose()
+
+    def test_queue_pool_sized_from_settings(self, tmp_path):
+        engine = session.create_db_engine(f'sqlite:///{tmp_path}/t.db', 'tuned')
+        try:
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.size() == session.DB_POOL_SIZE
+            assert engine.pool._max_overflow == session.DB_MAX_OVERFLOW
+        finally:
+            engine.dispose()
+
+    def test_reads_proceed_during_open_write(self, tmp_path):
+        engine = session.create_db_engine(f'sqlite:///{tmp_path}/t.db', 'tuned')
+        try:
+            with engine.begin() as conn:
+                conn.execute(text('CREATE TABLE t (x INTEGER)'))
+                conn.execute(text('INSERT INTO t VALUES (1)'))
+            writer = engine.connect()
+            writer.execute(text('BEGIN IMMEDIATE'))
+            writer.execute(text('INSERT INTO t VALUES (2)'))
+            # Under WAL a reader sees the last commit without waiting
+            seen = []
+
+            def read():
+                with engine.connect() as conn:
+                    seen.append(conn.execute(text('SELECT count(*) FROM t')).scalar())
+
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=2)
+            writer.rollback()
+            writer.close()
+            assert seen == [1]
+        finally:
+            engine.dispose()
+
+
+class TestOtherProfiles:
+    def test_default_profile_leaves_sqlite_defaults(self, tmp_path):
+        engine = session.create_db_engine(f'sqlite:///{tmp_path}/d.db', 'default')
+        try:
+            assert _pragma(engine, 'journal_mode') == 'delete'
+        finally:
+            engine.dispose()
+
+    def test_memory_database_untouched(self):
+        engine = session.create_db_engine('sqlite:///:memory:', 'tuned')
+        assert not isinstance(engine.pool, QueuePool)
+        assert _pragma(engine, 'journal_mode') == 'memory'